@@ -0,0 +1,73 @@
+"""
+Upload Encoding Benchmark
+Day 24.5 — Per-turn encode cost: flac subprocess vs in-process L16
+
+Before: AudioData.get_flac_data() (what recognize_google() does) —
+        WAV in memory, fork/exec `flac`, pipe in, pipe out.
+After:  encode_l16() — a view of the capture buffer (little-endian)
+        or one vectorized byte-swap (big-endian).
+
+Reported as encode milliseconds per second of audio.
+
+Usage:
+    python -m benchmarks.bench_encoding [seconds] [repeats]
+"""
+
+import sys
+import time
+
+import numpy as np
+import speech_recognition as sr
+
+from core.audio.recorder import SAMPLE_RATE, SAMPLE_WIDTH
+from core.speech.google_client import encode_l16
+
+
+def _utterance(seconds: float) -> bytes:
+    rng = np.random.default_rng(3)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    voiced = sum(np.sin(2 * np.pi * 180 * k * t) / k for k in range(1, 6)) * 3000
+    return (voiced + rng.standard_normal(len(t)) * 50).astype(np.int16).tobytes()
+
+
+def time_per_audio_second(encode, pcm: bytes, repeats: int) -> float:
+    seconds = len(pcm) / (SAMPLE_WIDTH * SAMPLE_RATE)
+    started = time.perf_counter()
+    for _ in range(repeats):
+        encode(pcm)
+    return (time.perf_counter() - started) / repeats / seconds * 1000
+
+
+def run(seconds: float = 3.0, repeats: int = 20):
+    pcm = _utterance(seconds)
+    rows = [
+        ("l16 (little-endian view)", time_per_audio_second(lambda b: encode_l16(b), pcm, repeats)),
+        ("l16 (big-endian swap)", time_per_audio_second(lambda b: encode_l16(b, big_endian=True), pcm, repeats)),
+    ]
+
+    def flac(b):
+        return sr.AudioData(b, SAMPLE_RATE, SAMPLE_WIDTH).get_flac_data()
+
+    try:
+        flac(pcm[:SAMPLE_RATE * SAMPLE_WIDTH])
+    except (OSError, AssertionError) as e:
+        rows.insert(0, ("flac subprocess", None))
+        print(f"flac encoder unavailable ({e}); showing in-process numbers only")
+    else:
+        rows.insert(0, ("flac subprocess", time_per_audio_second(flac, pcm, repeats)))
+    return rows
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    seconds = float(argv[0]) if argv else 3.0
+    repeats = int(argv[1]) if len(argv) > 1 else 20
+
+    print(f"{'encoder':<28}{'ms / audio s':>14}")
+    for name, ms in run(seconds, repeats):
+        print(f"{name:<28}{'n/a' if ms is None else f'{ms:.4f}':>14}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
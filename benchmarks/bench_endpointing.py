@@ -0,0 +1,101 @@
+"""
+Endpointing Benchmark
+Day 23.2 — Adaptive endpointing vs the fixed 0.8 s pause threshold
+
+Replays WAV files (or a synthetic command set) through the VAD and
+measures, per utterance, how long we wait after the last speech frame
+before closing — the part of voice latency the user actually feels.
+
+Usage:
+    python -m benchmarks.bench_endpointing [wav_dir]
+"""
+
+import glob
+import os
+import sys
+import wave
+
+import numpy as np
+
+from core.audio.recorder import FRAME_MS, FRAME_SAMPLES, SAMPLE_RATE
+from core.audio.vad import ENDED, AdaptiveEndpointer, VoiceActivityDetector
+
+FIXED_PAUSE_MS = 800    # speech_recognition.Recognizer.pause_threshold
+
+
+def _synthetic_commands():
+    rng = np.random.default_rng(7)
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+
+    def word(seconds):
+        n = int(seconds * SAMPLE_RATE)
+        f = rng.uniform(120, 260)
+        return (sum(np.sin(2 * np.pi * f * k * t[:n]) / k for k in range(1, 6)) * 3000).astype(np.int16)
+
+    def gap(seconds):
+        return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 30).astype(np.int16)
+
+    for i in range(20):
+        words = [word(rng.uniform(0.2, 0.5)) for _ in range(rng.integers(1, 5))]
+        parts = [gap(0.3)]
+        for w in words:
+            parts += [w, gap(rng.uniform(0.05, 0.25))]
+        parts.append(gap(1.5))
+        yield f"synthetic-{i:02d}", np.concatenate(parts)
+
+
+def _wav_commands(directory):
+    for path in sorted(glob.glob(os.path.join(directory, "*.wav"))):
+        with wave.open(path, "rb") as wav:
+            yield os.path.basename(path), np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+
+def endpoint_delay_ms(samples, endpointer, vad):
+    endpointer.reset()
+    flags = vad.classify(samples)
+    for i in range(0, len(flags)):
+        if endpointer.feed(flags[i:i + 1]) == ENDED:
+            break
+    if endpointer.speech_end is None or endpointer.state != ENDED:
+        return None
+    return (endpointer.frame_index - endpointer.speech_end) * FRAME_MS
+
+
+def run(commands):
+    vad = VoiceActivityDetector()
+    adaptive = AdaptiveEndpointer()
+    fixed = AdaptiveEndpointer(min_hangover_ms=FIXED_PAUSE_MS, max_hangover_ms=FIXED_PAUSE_MS)
+
+    rows = []
+    for name, samples in commands:
+        a = endpoint_delay_ms(samples, adaptive, vad)
+        f = endpoint_delay_ms(samples, fixed, vad)
+        if a is not None and f is not None:
+            rows.append((name, a, f))
+    return rows
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    commands = _wav_commands(argv[0]) if argv else _synthetic_commands()
+    rows = run(commands)
+    if not rows:
+        print("No utterances detected.")
+        return 1
+
+    adaptive = np.array([r[1] for r in rows], dtype=float)
+    fixed = np.array([r[2] for r in rows], dtype=float)
+
+    print(f"{'utterance':<24}{'adaptive ms':>12}{'fixed ms':>10}")
+    for name, a, f in rows:
+        print(f"{name:<24}{a:>12.0f}{f:>10.0f}")
+
+    print()
+    for label, values in (("adaptive", adaptive), ("fixed", fixed)):
+        print(f"{label:<10} mean {values.mean():6.0f} ms   p50 {np.percentile(values, 50):6.0f}   p95 {np.percentile(values, 95):6.0f}")
+    print(f"Saved per command: {fixed.mean() - adaptive.mean():.0f} ms (frame = {FRAME_SAMPLES} samples)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Idle Gate Benchmark
+Day 25.4 — Wake-word CPU per hour, gated vs always-on
+
+Room audio is mostly background noise with an occasional burst of
+activity. Both paths see the same samples:
+
+    always-on   every frame goes through the spotter
+    gated       IdleGate decides per block; the spotter only runs
+                from the rewind point while escalated
+
+Usage:
+    python -m benchmarks.bench_idle_gate [seconds] [activity_every_s]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from core.audio.idle_gate import IDLE, IdleGate
+from core.audio.keyword_spotter import KeywordSpotter
+from core.audio.recorder import FRAME_SAMPLES, SAMPLE_RATE
+
+
+def _room(seconds: float, every: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    audio = rng.standard_normal(int(seconds * SAMPLE_RATE)) * 30
+    t = np.arange(int(0.6 * SAMPLE_RATE)) / SAMPLE_RATE
+    burst = np.sin(2 * np.pi * 220 * t) * 4000
+    for start in np.arange(every, seconds - 1.0, every):
+        i = int(start * SAMPLE_RATE)
+        audio[i:i + len(burst)] += burst
+    return audio.astype(np.int16)
+
+
+def _spotter():
+    t = np.arange(int(0.5 * SAMPLE_RATE)) / SAMPLE_RATE
+    word = np.sin(2 * np.pi * (300 * t + 900 * t * t)) * 8000
+    spotter = KeywordSpotter()
+    spotter.enroll("rudra", [np.concatenate([np.zeros(1600), word, np.zeros(1600)]).astype(np.int16)])
+    return spotter
+
+
+def always_on(audio: np.ndarray) -> float:
+    spotter = _spotter()
+    started = time.process_time()
+    for i in range(0, len(audio) - FRAME_SAMPLES + 1, FRAME_SAMPLES):
+        spotter.process(audio[i:i + FRAME_SAMPLES])
+    return time.process_time() - started
+
+
+def gated(audio: np.ndarray) -> dict:
+    gate, spotter = IdleGate(), _spotter()
+    cursor = 0
+    while True:
+        size = gate.block_samples if gate.mode == IDLE else FRAME_SAMPLES
+        if cursor + size > len(audio):
+            break
+        samples = audio[cursor:cursor + size]
+        cursor += size
+
+        if gate.mode == IDLE:
+            rewind = gate.idle_step(samples, cursor)
+            if rewind is not None:
+                cursor = rewind
+                spotter.reset()
+            continue
+
+        cpu = time.process_time()
+        spotter.process(samples)
+        if gate.full_step(samples, time.process_time() - cpu, cursor):
+            spotter.reset()
+    return gate.report()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    seconds = float(argv[0]) if argv else 120.0
+    every = float(argv[1]) if len(argv) > 1 else 20.0
+
+    audio = _room(seconds, every)
+    full = always_on(audio) / seconds * 3600
+    report = gated(audio)
+    gated_total = (
+        (report["idle_cpu_s_per_hour"] or 0) * report["idle_fraction"]
+        + (report["full_cpu_s_per_hour"] or 0) * (1 - report["idle_fraction"])
+    )
+
+    print(f"audio {seconds:.0f}s, activity every {every:.0f}s")
+    print(f"{'always-on cpu s / hour':>28}{full:>10.1f}")
+    print(f"{'gated cpu s / hour':>28}{gated_total:>10.1f}")
+    print(f"{'  idle-mode rate':>28}{report['idle_cpu_s_per_hour']:>10.1f}")
+    print(f"{'idle fraction':>28}{report['idle_fraction']:>10.3f}")
+    print(f"{'escalations':>28}{report['escalations']:>10}")
+    print(f"{'escalation delay ms p50':>28}{report['escalation_delay_ms_p50']!s:>10}")
+    print(f"{'catch-up ms p50':>28}{report['catch_up_ms_p50']!s:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
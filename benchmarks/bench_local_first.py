@@ -0,0 +1,144 @@
+"""
+Local-First Recognition Benchmark
+Day 25.5 — How many turns the on-device command recognizer resolves
+
+Replays a recorded command set (FileSpeechEngine corpus: NAME.wav +
+NAME.txt with the true transcript) through LocalFirstEngine. The cloud
+side is the file engine with a simulated round trip, so every fallback
+pays it and every on-device answer saves it.
+
+    on-device share   turns answered locally / all turns
+    accuracy          returned text == transcript (local and fallback)
+    net saved         (saved on local turns − local probes on fallbacks) / turns
+    wrong on-device   turns answered locally with the wrong command
+    command score p5  top local score of in-grammar turns (5th percentile)
+    query score max   top local score of open-vocabulary turns
+
+COMMAND_CONFIDENCE_FLOOR belongs between the last two: above every
+query (and near-miss) score, below nearly every command score.
+
+Usage:
+    python -m benchmarks.bench_local_first [templates.npz corpus_dir] [cloud_ms]
+
+Without arguments a synthetic set is generated: the command grammar
+plus open-vocabulary queries, rendered by the tone synthesizer.
+"""
+
+import os
+import sys
+import tempfile
+import wave
+
+import numpy as np
+from loguru import logger
+
+from core.config import COMMAND_CONFIDENCE_FLOOR
+from core.speech.command_recognizer import (
+    CommandRecognizer,
+    LocalFirstEngine,
+    TemplateDecoder,
+    command_grammar,
+)
+from core.speech.file_engine import FileSpeechEngine
+from core.speech.tts import ToneSynthesizer
+
+QUERIES = [
+    "search for cheap flights to goa",
+    "find python tutorials",
+    "take a note buy milk",
+    "what is the weather like",
+    "look up the capital of peru",
+]
+
+_synth = ToneSynthesizer()
+
+
+def spoken(text: str, seed: int = 0, speed: float = 1.0) -> np.ndarray:
+    """
+    Deterministic "recording" of a phrase: level, pace and noise vary per seed.
+    """
+    pcm = np.frombuffer(_synth.synthesize(text), dtype=np.int16).astype(float)
+    rng = np.random.default_rng(seed)
+    pcm = pcm[np.arange(0, len(pcm), speed).astype(int)]
+    pad = np.zeros(3200)
+    audio = np.concatenate([pad, pcm * rng.uniform(0.6, 1.2), pad])
+    return (audio + rng.standard_normal(len(audio)) * 100).astype(np.int16)
+
+
+def synthetic_set(directory: str) -> str:
+    decoder = TemplateDecoder()
+    for phrase in command_grammar():
+        decoder.enroll(phrase, [spoken(phrase, s, sp) for s, sp in ((1, 1.0), (2, 0.9), (3, 1.1))])
+    templates = os.path.join(directory, "commands.npz")
+    decoder.save(templates)
+
+    rng = np.random.default_rng(7)
+    turns = list(rng.choice(command_grammar(), 40)) + QUERIES * 2
+    for i, text in enumerate(turns):
+        name = os.path.join(directory, f"{i:03d}")
+        with wave.open(name + ".wav", "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(spoken(str(text), 100 + i, rng.uniform(0.9, 1.1)).tobytes())
+        with open(name + ".txt", "w", encoding="utf-8") as f:
+            f.write(f"{text}\n")
+    return templates
+
+
+def run(templates: str, corpus_dir: str, cloud_ms: float, confidence_floor: float = COMMAND_CONFIDENCE_FLOOR):
+    local = CommandRecognizer(TemplateDecoder.load(templates))
+    cloud = FileSpeechEngine(corpus_dir=corpus_dir, latency=cloud_ms / 1000, name="cloud")
+    engine = LocalFirstEngine(local, cloud, confidence_floor=confidence_floor)
+    grammar = set(command_grammar())
+
+    correct = total = wrong_on_device = 0
+    command_scores, query_scores = [], []
+    while cloud.remaining():
+        on_device = engine.stats["on_device"]
+        text = engine.listen_once()
+        truth = engine.last_clip.meta["transcripts"][0]
+        total += 1
+        correct += text == truth
+        wrong_on_device += engine.stats["on_device"] > on_device and text != truth
+
+        # Scored again outside the timed path, for placing the floor
+        score = local.recognize(engine.last_clip)["confidence"]
+        (command_scores if truth in grammar else query_scores).append(score)
+
+    report = engine.report()
+    report["accuracy"] = round(correct / total, 3) if total else None
+    report["wrong_on_device"] = wrong_on_device
+    report["command_score_p5"] = round(float(np.percentile(command_scores, 5)), 3) if command_scores else None
+    report["query_score_max"] = round(max(query_scores), 3) if query_scores else None
+    return report
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    cloud_ms = float(argv[2]) if len(argv) > 2 else 300.0
+    logger.disable("core")      # one "heard:" line per turn otherwise
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if len(argv) >= 2:
+            templates, corpus_dir = argv[0], argv[1]
+        else:
+            templates, corpus_dir = synthetic_set(tmp), tmp
+        r = run(templates, corpus_dir, cloud_ms)
+
+    print(f"{'turns':>24}{r['turns']:>10}")
+    print(f"{'on-device share':>24}{r['on_device_share']:>10.3f}")
+    print(f"{'accuracy':>24}{r['accuracy']!s:>10}")
+    print(f"{'local ms p50':>24}{r['local_ms_p50']!s:>10}")
+    print(f"{'cloud ms p50':>24}{r['cloud_ms_p50']!s:>10}")
+    print(f"{'latency saved ms':>24}{r['latency_saved_ms']!s:>10}")
+    print(f"{'fallback overhead ms':>24}{r['fallback_overhead_ms']!s:>10}")
+    print(f"{'net saved ms / turn':>24}{r['net_saved_ms_per_turn']!s:>10}")
+    print(f"{'wrong on-device':>24}{r['wrong_on_device']:>10}")
+    print(f"{'command score p5':>24}{r['command_score_p5']!s:>10}")
+    print(f"{'query score max':>24}{r['query_score_max']!s:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Multi-Microphone Benchmark
+Day 25.2 — How many device streams one core sustains
+
+Every stream runs its own wake-word spotter + VAD + endpointer over
+synthetic room audio (a wake word and a command every few seconds).
+Sources are not paced, so the run measures pure processing cost:
+
+    cpu per stream-second = stream CPU time / audio seconds processed
+    streams per core      = 1 / cpu per stream-second
+
+Usage:
+    python -m benchmarks.bench_multi_mic [seconds] [max_streams]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+from core.audio.keyword_spotter import KeywordSpotter
+from core.audio.multi_mic import MultiMicInput
+from core.audio.recorder import SAMPLE_RATE, WavFileSource
+
+
+class NullRecognizer:
+    def recognize(self, clip):
+        return {"text": "", "confidence": 0.0}
+
+
+def _chirp(seconds, f0, f1):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return np.sin(2 * np.pi * (f0 * t + (f1 - f0) * t * t / (2 * seconds))) * 8000
+
+
+def _room(seconds: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(0.6 * SAMPLE_RATE)) / SAMPLE_RATE
+    command = sum(np.sin(2 * np.pi * 220 * k * t) / k for k in range(1, 6)) * 3000
+    parts, total = [], 0.0
+    while total < seconds:
+        gap = rng.standard_normal(int(rng.uniform(1.0, 2.5) * SAMPLE_RATE)) * 30
+        parts += [gap, _chirp(0.5, 300, 1200), np.zeros(3200), command]
+        total += (len(gap) + 8000 + 3200 + len(command)) / SAMPLE_RATE
+    return np.concatenate(parts).astype(np.int16)
+
+
+def _spotter():
+    spotter = KeywordSpotter()
+    pad = np.zeros(1600)
+    spotter.enroll("rudra", [np.concatenate([pad, _chirp(0.5, 300, 1200), pad]).astype(np.int16)])
+    return spotter
+
+
+def run(streams: int, seconds: float, directory: str):
+    sources = {}
+    for i in range(streams):
+        path = os.path.join(directory, f"room{i}.wav")
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(_room(seconds, i).tobytes())
+        sources[f"room{i}"] = WavFileSource(path)
+
+    mic_input = MultiMicInput(
+        sources, NullRecognizer(), spotter_factory=_spotter, capacity_seconds=seconds + 5
+    )
+    started = time.perf_counter()
+    mic_input.start()
+    while mic_input.active():
+        time.sleep(0.05)
+    wall = time.perf_counter() - started
+    mic_input.stop()
+
+    report = mic_input.report()
+    report["wall_seconds"] = wall
+    report["wakes"] = sum(s["wakes"] for s in report["streams"].values())
+    return report
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    seconds = float(argv[0]) if argv else 30.0
+    max_streams = int(argv[1]) if len(argv) > 1 else 8
+
+    print(f"{'streams':>8}{'cpu ms / stream-s':>20}{'streams / core':>16}{'wakes':>8}{'wall s':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        n = 1
+        while n <= max_streams:
+            r = run(n, seconds, tmp)
+            print(
+                f"{n:>8}{r['cpu_per_stream_second'] * 1000:>20.1f}"
+                f"{r['streams_per_core']:>16}{r['wakes']:>8}{r['wall_seconds']:>8.2f}"
+            )
+            n *= 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Voice Path Benchmark
+Day 23.3 — Offline, reproducible latency of listen → recognize → intent
+
+Runs InputController on a FileSpeechEngine (no microphone, no network)
+and times each stage per turn:
+    capture    engine.listen()       (realtime=True replays at speaking speed)
+    recognize  engine.recognize()    (simulated latency + seeded jitter)
+    intent     normalize → score → pick → refine
+
+Usage:
+    python -m benchmarks.bench_voice_path [corpus_dir] [--latency 0.3] [--jitter 0.1] [--realtime]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from core.audio.recorder import SAMPLE_RATE
+from core.input_controller import InputController
+from core.intelligence.confidence_refiner import refine_confidence
+from core.intelligence.intent_scorer import pick_best_intent, score_intents
+from core.nlp.normalizer import normalize_text
+from core.speech.file_engine import FileSpeechEngine, load_corpus
+
+SYNTHETIC_COMMANDS = [
+    "rudra open youtube",
+    "turn on wifi",
+    "what time is it",
+    "open downloads folder",
+    "increase volume",
+    "search python tutorials",
+    "turn off bluetooth",
+    "open notepad",
+]
+
+
+class _TimedEngine:
+    """
+    Wraps an engine and records how long each stage took.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.timings = []
+
+    def listen_once(self):
+        t0 = time.perf_counter()
+        clip = self.engine.listen()
+        t1 = time.perf_counter()
+        text = self.engine.recognize(clip)["text"] if clip else ""
+        t2 = time.perf_counter()
+        self.timings.append({"capture": t1 - t0, "recognize": t2 - t1})
+        return text
+
+
+def write_synthetic_corpus(directory: str, commands=SYNTHETIC_COMMANDS):
+    import wave
+
+    for i, text in enumerate(commands):
+        seconds = 0.25 * len(text.split()) + 0.3
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        samples = (np.sin(2 * np.pi * (150 + 10 * i) * t) * 4000).astype(np.int16)
+
+        base = os.path.join(directory, f"{i:03d}")
+        with wave.open(base + ".wav", "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(samples.tobytes())
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+def run(pairs, latency=0.0, jitter=0.0, realtime=False, seed=0):
+    engine = _TimedEngine(FileSpeechEngine(pairs=pairs, latency=latency, jitter=jitter, realtime=realtime, seed=seed))
+    controller = InputController(engine=engine, push_to_talk=False)
+
+    rows = []
+    last_intent = None
+    start = time.perf_counter()
+    for _ in range(len(pairs)):
+        text = controller.read()
+        t0 = time.perf_counter()
+        intent = None
+        if text:
+            tokens = normalize_text(text)
+            intent, confidence = pick_best_intent(score_intents(tokens), tokens)
+            refine_confidence(confidence, tokens, intent.value, last_intent)
+            last_intent = intent.value
+        timing = dict(engine.timings[-1])
+        timing["intent"] = time.perf_counter() - t0
+        timing["total"] = sum(timing.values())
+        timing["text"] = text
+        timing["result"] = intent.value if intent else "-"
+        rows.append(timing)
+
+    elapsed = time.perf_counter() - start
+    return rows, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("corpus", nargs="?")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--realtime", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = args.corpus
+        if not corpus:
+            write_synthetic_corpus(tmp)
+            corpus = tmp
+        pairs = load_corpus(corpus)
+        if not pairs:
+            print(f"No WAV/transcript pairs in {corpus}")
+            return 1
+        rows, elapsed = run(pairs, args.latency, args.jitter, args.realtime, args.seed)
+
+    print(f"{'transcript':<28}{'intent':<18}{'capture':>9}{'asr':>9}{'nlp':>9}{'total':>9}  (ms)")
+    for r in rows:
+        print(
+            f"{r['text'][:27]:<28}{r['result'][:17]:<18}"
+            f"{r['capture'] * 1000:>9.1f}{r['recognize'] * 1000:>9.1f}"
+            f"{r['intent'] * 1000:>9.2f}{r['total'] * 1000:>9.1f}"
+        )
+
+    totals = np.array([r["total"] for r in rows]) * 1000
+    print()
+    print(f"turns {len(rows)}   p50 {np.percentile(totals, 50):.1f} ms   p95 {np.percentile(totals, 95):.1f} ms")
+    print(f"throughput {len(rows) / elapsed:.1f} turns/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
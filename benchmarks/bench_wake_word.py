@@ -0,0 +1,57 @@
+"""
+Wake-Word Benchmark
+Day 23.4 — False accepts / rejects and CPU cost of the on-device spotter
+
+Test-set layout:
+    <dir>/templates/*.wav   enrollment recordings of the keyword
+    <dir>/positive/*.wav    held-out recordings containing the keyword
+    <dir>/negative/*.wav    room audio / speech without it
+
+Usage:
+    python -m benchmarks.bench_wake_word <dir> [--keyword rudra] [--threshold 0.75] [--save wake.npz]
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+from core.audio.keyword_spotter import KeywordSpotter, evaluate, read_wav
+
+
+def _wavs(directory):
+    return sorted(glob.glob(os.path.join(directory, "*.wav")))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("directory")
+    parser.add_argument("--keyword", default="rudra")
+    parser.add_argument("--threshold", type=float, default=0.75)
+    parser.add_argument("--save", help="write the enrolled templates (.npz) for WAKE_WORD_TEMPLATES")
+    args = parser.parse_args(argv)
+
+    templates = _wavs(os.path.join(args.directory, "templates"))
+    if not templates:
+        print("No enrollment recordings found in templates/")
+        return 1
+
+    spotter = KeywordSpotter.from_wavs({args.keyword: templates}, threshold=args.threshold)
+    positives = [read_wav(p) for p in _wavs(os.path.join(args.directory, "positive"))]
+    negatives = [read_wav(p) for p in _wavs(os.path.join(args.directory, "negative"))]
+
+    report = evaluate(spotter, positives, negatives, keyword=args.keyword)
+
+    print(f"templates {len(templates)}   positives {len(positives)}   negatives {len(negatives)}")
+    print(f"false reject rate   {report['false_reject_rate']:.3f}")
+    print(f"false accept rate   {report['false_accept_rate']:.3f}  ({report['false_accepts_per_hour']:.1f} / hour)")
+    print(f"CPU per audio sec   {report['cpu_per_audio_second'] * 1000:.1f} ms")
+
+    if args.save:
+        spotter.save(args.save)
+        print(f"Templates saved to {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Spool Replay
+Day 24.2 — Stream a captured session back through the voice path
+
+Each spooled utterance is played into a ring recorder (with silence
+between turns), cut again by the VAD + endpointer, and optionally sent
+to the recognizer, so a latency complaint can be reproduced from the
+exact audio that caused it.
+
+Usage:
+    python -m benchmarks.replay_spool session.wav [--realtime] [--recognize] [--turn 12]
+"""
+
+import argparse
+import sys
+import time
+
+from core.audio.recorder import RingBufferRecorder
+from core.audio.spool import AudioSpool, SpoolSource
+from core.audio.vad import AdaptiveEndpointer, VoiceActivityDetector, capture_utterance
+
+
+def replay(spool: AudioSpool, entries, realtime: bool = False, engine=None):
+    recorder = RingBufferRecorder(SpoolSource(spool, entries, realtime=realtime), capacity_seconds=30)
+    reader = recorder.reader("replay", from_start=True)
+    vad, endpointer = VoiceActivityDetector(), AdaptiveEndpointer()
+    recorder.start()
+
+    rows = []
+    for entry in entries:
+        started = time.perf_counter()
+        clip = capture_utterance(reader, vad, endpointer, timeout=5.0, catch_up=False)
+        row = {
+            "turn_id": entry["turn_id"],
+            "transcript": entry.get("transcript", ""),
+            "captured": clip is not None,
+            "capture_ms": (time.perf_counter() - started) * 1000,
+            "duration_s": clip.duration if clip else 0.0,
+            "endpoint_delay_ms": clip.endpoint_delay * 1000 if clip else 0.0,
+        }
+        if engine is not None and clip is not None:
+            t0 = time.perf_counter()
+            row["recognized"] = engine.recognize(clip).get("text", "")
+            row["recognize_ms"] = (time.perf_counter() - t0) * 1000
+        rows.append(row)
+
+    recorder.stop()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("spool")
+    parser.add_argument("--realtime", action="store_true", help="replay at speaking speed")
+    parser.add_argument("--recognize", action="store_true", help="send each utterance to Google")
+    parser.add_argument("--turn", type=int, action="append", help="only these turn ids")
+    args = parser.parse_args(argv)
+
+    spool = AudioSpool(args.spool)
+    entries = [e for e in spool.entries() if not args.turn or e["turn_id"] in args.turn]
+    if not entries:
+        print("Spool is empty.")
+        return 1
+
+    engine = None
+    if args.recognize:
+        from core.speech.engine import create_engine
+        engine = create_engine("google", capture=False)     # recognize-only: clips come from replay()
+
+    rows = replay(spool, entries, realtime=args.realtime, engine=engine)
+    spool.close()
+
+    for r in rows:
+        line = (
+            f"turn {r['turn_id']:>4}  {r['duration_s']:5.2f}s  "
+            f"endpoint {r['endpoint_delay_ms']:5.0f} ms  "
+            f"capture {r['capture_ms']:7.1f} ms  | {r['transcript']}"
+        )
+        if "recognized" in r:
+            line += f"  → {r['recognized']} ({r['recognize_ms']:.0f} ms)"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,55 +4,117 @@ Day 17.6 — Confidence Gating + Follow-up + Slot Recovery (FINAL)
 Day 18.1 — Global Interrupt Guard (READ-ONLY)
 Day 18.3 — Safe Cancel Hook (FINAL)
 Day 18.4 — Policy-Compatible (NO OWNERSHIP)
+Day 22.1 — Compound commands (parallel independent actions)
+Day 22.2 — Next-intent prediction + speculative prefetch
+Day 22.3 — Local browser index for open_browser
+Day 26.1 — Asynchronous execution (bounded pool, futures, timeouts, cancellation)
+Day 26.2 — Dispatch through the skill registry (one lookup, lazy skill modules)
+
+Conversation state (follow-up context, next-intent chain) lives in an
+ExecutionSession; several sessions (Day 25.2 rooms) can share one executor.
 """
 
 import logging
 import re
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+
+import numpy as np
 
 from core.nlp.intent import Intent
 from core.nlp.argument_extractor import ArgumentExtractor
 from core.skills.system_actions import SystemActions
+from core.skills.registry import SKILLS, DEFAULT_ACTION_TIMEOUT
 from core.context.follow_up import FollowUpContext, INTENT_ENTITY_WHITELIST
 from core.control.global_interrupt import GLOBAL_INTERRUPT  # READ-ONLY
+from core.actions.dependency_analyzer import plan_stages
+from core.actions.prefetcher import Prefetcher
+from core.intelligence.next_intent_model import NextIntentModel
+from core.system.browser_index import BrowserIndex
 
 logger = logging.getLogger(__name__)
 
 # Never auto-repeat dangerous intents
 DANGEROUS_INTENTS = {Intent.OPEN_TERMINAL}
 
-REQUIRED_ARGS = {
-    "open_browser": ["url"],
-    "search_web": ["query"],
-    "open_file_manager": ["path"],
-    "list_files": ["path"],
-    "open_file": ["filename"],
-    "open_terminal": ["command"],
-}
+# Day 26.2 — derived from the skill registry (kept in sync on register)
+REQUIRED_ARGS = SKILLS.required_args
+
+# Day 26.1 — time budget per action in asynchronous mode (seconds)
+ACTION_TIMEOUTS = SKILLS.timeouts
+
+
+class ExecutionSession:
+    """
+    Day 25.2 — per-conversation state on a shared executor.
+    "Open it again" resolves against this session's actions only.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self.follow_up_context = FollowUpContext()
 
 
 class ActionExecutor:
     def __init__(self, config=None):
         self.config = config
-        self.argument_extractor = ArgumentExtractor(config)
+        # Day 22.3 — built in the background, never on the hot path
+        self.browser_index = BrowserIndex()
+        self.browser_index.refresh_async()
+
+        self.argument_extractor = ArgumentExtractor(config, self.browser_index)
         self.system_actions = SystemActions(config)
-        self.follow_up_context = FollowUpContext()
+        # Used when the caller passes no session (single conversation)
+        self.default_session = ExecutionSession()
+
+        # Day 22.2 — predictive prefetch
+        self.next_intent_model = NextIntentModel()
+        self.prefetcher = Prefetcher(self.system_actions.prefetch_cache)
 
         self.min_confidence = 0.3
         self.high_confidence = 0.7
         self.min_reference_confidence = 0.5
 
+        # Day 22.1 — upper bound on concurrently dispatched actions
+        self.max_parallel_actions = 4
+
         self.action_history: List[Dict[str, Any]] = []
 
+        # Day 26.1 — asynchronous mode; the pool is created on first submit()
+        self.max_workers = 4
+        self.max_queue = 16
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Future, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self.async_stats = {
+            "submitted": 0, "completed": 0, "timeouts": 0, "cancelled": 0,
+            "rejected": 0, "late_results": 0, "max_queue_depth": 0,
+        }
+        self._latency: Dict[str, deque] = defaultdict(lambda: deque(maxlen=200))
+
+        # In-flight actions are dropped the moment an interrupt fires
+        GLOBAL_INTERRUPT.subscribe(self.cancel_in_flight)
+
+    @property
+    def follow_up_context(self) -> FollowUpContext:
+        return self.default_session.follow_up_context
+
     # =====================================================
     # DAY 18.3 — SAFE CANCEL HOOK
     # =====================================================
-    def cancel_pending(self):
+    def cancel_pending(self, session: Optional[ExecutionSession] = None):
         """
         Cancel follow-up context safely.
         Memory and history are preserved.
         """
-        self.follow_up_context.clear_context()
+        session = session or self.default_session
+        with self._lock:
+            session.follow_up_context.clear_context()
+            self.next_intent_model.reset_sequence(session.name)
+        self.cancel_in_flight()
 
     # =====================================================
     # SLOT INSPECTION
@@ -65,7 +127,7 @@ class ActionExecutor:
         if not required:
             return []
 
-        args = self.argument_extractor.extract_for_intent(text, intent.value)
+        args = self._extract_args(text, intent.value)
         return [k for k in required if not args.get(k)]
 
     # =====================================================
@@ -81,9 +143,7 @@ class ActionExecutor:
         if GLOBAL_INTERRUPT.is_triggered():
             return {}
 
-        args = self.argument_extractor.extract_for_intent(
-            followup_text, intent.value
-        ) or {}
+        args = self._extract_args(followup_text, intent.value) or {}
 
         # Single-slot recovery: map full text
         if missing and len(missing) == 1 and not args.get(missing[0]):
@@ -100,37 +160,321 @@ class ActionExecutor:
         text: str,
         confidence: float,
         replay_args: Optional[Dict[str, Any]] = None,
+        session: Optional[ExecutionSession] = None,
     ) -> Dict[str, Any]:
 
+        session = session or self.default_session
+        response, args = self._prepare(intent, text, confidence, replay_args, session)
+        if response is not None:
+            return response
+
+        # ---------------- EXECUTE ACTION ----------------
+        started = time.perf_counter()
+        result = self._execute_action_by_name(intent.value, args)
+        self._record_latency(intent.value, started)
+
+        return self._finalize(intent, text, confidence, args, result, session)
+
+    # =====================================================
+    # DAY 26.1 — ASYNCHRONOUS EXECUTION
+    # =====================================================
+    def submit(
+        self,
+        intent: Intent,
+        text: str,
+        confidence: float,
+        replay_args: Optional[Dict[str, Any]] = None,
+        session: Optional[ExecutionSession] = None,
+    ) -> Future:
+        """
+        execute() without blocking the caller: gates run now, the action
+        on the worker pool. The future resolves to the response execute()
+        would return, or to a busy / timed-out / cancelled response.
+        It never raises.
+        """
+        outer: Future = Future()
+
+        session = session or self.default_session
+        response, args = self._prepare(intent, text, confidence, replay_args, session)
+        if response is not None:
+            outer.set_result(response)
+            return outer
+
+        action = intent.value
+        with self._lock:
+            depth = self.queue_depth()
+            if depth >= self.max_queue:
+                self.async_stats["rejected"] += 1
+                outer.set_result({
+                    "success": False,
+                    "message": "I’m still busy with earlier actions.",
+                    "confidence": confidence,
+                    "executed": False,
+                })
+                return outer
+
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="action")
+
+            record = {
+                "action": action, "confidence": confidence, "session": session,
+                "submitted": time.perf_counter(), "started": None,
+            }
+            self._pending[outer] = record
+            self.async_stats["submitted"] += 1
+            self.async_stats["max_queue_depth"] = max(self.async_stats["max_queue_depth"], depth + 1)
+
+            record["inner"] = self._pool.submit(self._run_queued, outer, record, args)
+            record["timer"] = threading.Timer(ACTION_TIMEOUTS.get(action, DEFAULT_ACTION_TIMEOUT), self._expire, (outer,))
+            record["timer"].daemon = True
+            record["timer"].start()
+
+        record["inner"].add_done_callback(
+            lambda inner: self._complete(outer, intent, text, confidence, args, inner, session)
+        )
+        return outer
+
+    def queue_depth(self) -> int:
+        """
+        Submitted actions still waiting for a worker.
+        """
+        with self._lock:
+            return sum(1 for r in self._pending.values() if r["started"] is None)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def cancel_in_flight(self):
+        """
+        Resolve every pending future as cancelled. Queued actions never
+        start; running ones finish in the background and are ignored.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            for record in pending.values():
+                record["timer"].cancel()
+                record["inner"].cancel()
+            self.async_stats["cancelled"] += len(pending)
+
+        for outer, record in pending.items():
+            outer.set_result(self._cancelled(record["confidence"]))
+        if pending:
+            logger.warning("Cancelled %d in-flight action(s)", len(pending))
+
+    def close(self):
+        self.cancel_in_flight()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run_queued(self, outer: Future, record: Dict[str, Any], args: Dict[str, Any]):
+        record["started"] = time.perf_counter()
+        if outer.done():
+            return None     # timed out or cancelled while queued
+        return self._execute_action_by_name(record["action"], args)
+
+    def _complete(self, outer, intent, text, confidence, args, inner, session):
+        with self._lock:
+            record = self._pending.pop(outer, None)
+            if record is None:
+                # Already answered with a timeout / cancellation
+                if not inner.cancelled():
+                    self.async_stats["late_results"] += 1
+                return
+            record["timer"].cancel()
+            self._record_latency(record["action"], record["submitted"])
+            self.async_stats["completed"] += 1
+
+            result = self._cancelled(confidence) if inner.cancelled() else self._collect(inner)
+            response = self._finalize(intent, text, confidence, args, result, session)
+        outer.set_result(response)
+
+    def _expire(self, outer: Future):
+        with self._lock:
+            record = self._pending.pop(outer, None)
+            if record is None:
+                return
+            record["inner"].cancel()
+            self.async_stats["timeouts"] += 1
+            self._record_latency(record["action"], record["submitted"])
+            record["session"].follow_up_context.clear_context()
+
+        action = record["action"]
+        logger.warning("Action %s timed out", action)
+        outer.set_result({
+            "success": False,
+            "message": f"{action.replace('_', ' ').capitalize()} is taking too long, I stopped waiting.",
+            "confidence": record["confidence"],
+            "executed": False,
+            "timed_out": True,
+        })
+
+    def _record_latency(self, action: str, started: float):
+        with self._lock:
+            self._latency[action].append(time.perf_counter() - started)
+
+    def execution_report(self) -> Dict[str, Any]:
+        with self._lock:
+            latency = {}
+            for action, samples in self._latency.items():
+                values = np.array(samples, dtype=float) * 1000
+                latency[action] = {
+                    "count": len(values),
+                    "p50_ms": round(float(np.percentile(values, 50)), 1),
+                    "p95_ms": round(float(np.percentile(values, 95)), 1),
+                }
+            return {
+                **self.async_stats,
+                "workers": self.max_workers,
+                "queue_depth": self.queue_depth(),
+                "in_flight": len(self._pending),
+                "latency": latency,
+            }
+
+    # =====================================================
+    # DAY 22.1 — COMPOUND EXECUTION
+    # =====================================================
+    def supports(self, intent: Intent) -> bool:
+        return SKILLS.is_action(intent.value)
+
+    def execute_compound(
+        self, commands: List[Dict[str, Any]], session: Optional[ExecutionSession] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute several sub-commands as one turn.
+
+        commands: ordered list of
+            {"intent": Intent, "text": str, "confidence": float,
+             "sequential": bool}
+
+        Independent commands inside a stage are dispatched in parallel.
+        Gating, slot checks and follow-up bookkeeping stay sequential,
+        in the original clause order.
+        """
+        session = session or self.default_session
+        stages = plan_stages(commands, DANGEROUS_INTENTS)
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(commands)
+
+        for stage in stages:
+            if GLOBAL_INTERRUPT.is_triggered():
+                for idx in stage:
+                    responses[idx] = self._cancelled(commands[idx]["confidence"])
+                continue
+
+            self._run_stage(commands, stage, responses, session)
+
+        confidence = min((c["confidence"] for c in commands), default=0.0)
+        messages = [r.get("message", "") for r in responses if r and r.get("message")]
+
+        return {
+            "success": all(r.get("success") for r in responses),
+            "message": " | ".join(messages) or "Done.",
+            "confidence": confidence,
+            "executed": any(r.get("executed") for r in responses),
+            "results": responses,
+            "stages": stages,
+        }
+
+    def _run_stage(
+        self,
+        commands: List[Dict[str, Any]],
+        stage: List[int],
+        responses: List[Optional[Dict[str, Any]]],
+        session: ExecutionSession,
+    ):
+        ready: List[Tuple[int, Dict[str, Any]]] = []
+
+        for idx in stage:
+            cmd = commands[idx]
+            response, args = self._prepare(cmd["intent"], cmd["text"], cmd["confidence"], session=session)
+            if response is not None:
+                responses[idx] = response
+            else:
+                ready.append((idx, args))
+
+        if not ready:
+            return
+
+        if len(ready) == 1:
+            idx, args = ready[0]
+            results = {idx: self._execute_action_by_name(commands[idx]["intent"].value, args)}
+        else:
+            workers = min(len(ready), self.max_parallel_actions)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    idx: pool.submit(
+                        self._execute_action_by_name, commands[idx]["intent"].value, args
+                    )
+                    for idx, args in ready
+                }
+                results = {idx: self._collect(future) for idx, future in futures.items()}
+
+        for idx, args in ready:
+            cmd = commands[idx]
+            responses[idx] = self._finalize(
+                cmd["intent"], cmd["text"], cmd["confidence"], args, results[idx], session
+            )
+
+    def _collect(self, future) -> Dict[str, Any]:
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error("Parallel action failed: %s", e)
+            return {"success": False, "message": "Action failed."}
+
+    # =====================================================
+    # EXECUTION STEPS
+    # =====================================================
+    def _cancelled(self, confidence: float) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "message": "Action cancelled.",
+            "confidence": confidence,
+            "executed": False,
+        }
+
+    def _prepare(
+        self,
+        intent: Intent,
+        text: str,
+        confidence: float,
+        replay_args: Optional[Dict[str, Any]] = None,
+        session: Optional[ExecutionSession] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Run every gate before dispatch.
+        Returns (response, {}) when the turn ends early,
+        or (None, args) when the action is ready to dispatch.
+        """
+
         # 🔴 HARD GUARD — executor never clears interrupt
         if GLOBAL_INTERRUPT.is_triggered():
             logger.warning("Execution skipped due to global interrupt")
-            return {
-                "success": False,
-                "message": "Action cancelled.",
-                "confidence": confidence,
-                "executed": False,
-            }
+            return self._cancelled(confidence), {}
 
         logger.info("Intent=%s confidence=%.2f", intent.value, confidence)
+        context = (session or self.default_session).follow_up_context
 
         # ---------------- UNKNOWN ----------------
         if intent == Intent.UNKNOWN:
-            self.follow_up_context.clear_context()
+            with self._lock:
+                context.clear_context()
             return {
                 "success": False,
                 "message": "Intent not supported",
                 "confidence": confidence,
                 "executed": False,
-            }
+            }, {}
 
         # ---------------- PRONOUN GUARD ----------------
         if re.search(r"\b(it|that|there|again|same|them)\b", text.lower()):
-            last = (
-                self.follow_up_context.contexts[-1]
-                if self.follow_up_context.contexts
-                else None
-            )
+            # Completions on pool threads write the context (Day 26.1)
+            with self._lock:
+                last = (
+                    context.contexts[-1]
+                    if context.contexts
+                    else None
+                )
 
             if not last:
                 return {
@@ -138,7 +482,7 @@ class ActionExecutor:
                     "message": "No previous context to refer to.",
                     "confidence": confidence,
                     "executed": False,
-                }
+                }, {}
 
             if last.get("action") != intent.value:
                 return {
@@ -146,12 +490,12 @@ class ActionExecutor:
                     "message": "Previous context does not apply to this action.",
                     "confidence": confidence,
                     "executed": False,
-                }
+                }, {}
 
         # ---------------- FOLLOW-UP ----------------
-        followup = self._try_follow_up(intent, text, confidence)
+        followup = self._try_follow_up(intent, text, confidence, context)
         if followup is not None:
-            return followup
+            return followup, {}
 
         # ---------------- CONFIDENCE GATE ----------------
         if confidence < self.min_confidence:
@@ -160,45 +504,53 @@ class ActionExecutor:
                 "message": "I can’t perform that action.",
                 "confidence": confidence,
                 "executed": False,
-            }
+            }, {}
 
         # ---------------- ARGUMENT EXTRACTION ----------------
-        args = self.argument_extractor.extract_for_intent(text, intent.value)
+        args = self._extract_args(text, intent.value)
         if replay_args:
             args = {**args, **replay_args}
 
         # ---------------- SLOT CHECK ----------------
         for slot in REQUIRED_ARGS.get(intent.value, []):
             if GLOBAL_INTERRUPT.is_triggered():
-                return {
-                    "success": False,
-                    "message": "Action cancelled.",
-                    "confidence": confidence,
-                    "executed": False,
-                }
+                return self._cancelled(confidence), {}
 
             if not args.get(slot):
-                self.follow_up_context.clear_context()
+                with self._lock:
+                    context.clear_context()
                 return {
                     "success": False,
                     "message": f"Please provide {slot}.",
                     "confidence": confidence,
                     "executed": False,
-                }
-
-        # ---------------- EXECUTE ACTION ----------------
-        result = self._execute_action_by_name(intent.value, args)
+                }, {}
 
-        if result.get("success"):
-            self.follow_up_context.add_context(
-                action=intent.value,
-                result={"success": True, "entities": args},
-                user_input=text,
-            )
-        else:
-            self.follow_up_context.clear_context()
+        return None, args
 
-        self._log(intent, text, confidence)
+    def _finalize(
+        self,
+        intent: Intent,
+        text: str,
+        confidence: float,
+        args: Dict[str, Any],
+        result: Dict[str, Any],
+        session: Optional[ExecutionSession] = None,
+    ) -> Dict[str, Any]:
+        session = session or self.default_session
+        # Runs on the caller's thread or, for submit(), on pool threads
+        with self._lock:
+            if result.get("success"):
+                session.follow_up_context.add_context(
+                    action=intent.value,
+                    result={"success": True, "entities": args},
+                    user_input=text,
+                )
+                self._predict_next(intent, args, session.name)
+            else:
+                session.follow_up_context.clear_context()
+
+            self._log(intent, text, confidence)
 
         return {
             "success": result.get("success", False),
@@ -213,7 +565,7 @@ class ActionExecutor:
     # FOLLOW-UP HANDLER
     # =====================================================
     def _try_follow_up(
-        self, intent: Intent, text: str, confidence: float
+        self, intent: Intent, text: str, confidence: float, context: FollowUpContext
     ) -> Optional[Dict[str, Any]]:
 
         if GLOBAL_INTERRUPT.is_triggered():
@@ -235,12 +587,14 @@ class ActionExecutor:
                 "executed": False,
             }
 
-        context, _ = self.follow_up_context.resolve_reference(text)
-        if not context:
+        with self._lock:
+            reference, _ = context.resolve_reference(text)
+            if reference and intent in DANGEROUS_INTENTS:
+                context.clear_context()
+        if not reference:
             return None
 
         if intent in DANGEROUS_INTENTS:
-            self.follow_up_context.clear_context()
             return {
                 "success": False,
                 "message": "I won’t repeat that action for safety.",
@@ -249,7 +603,7 @@ class ActionExecutor:
             }
 
         args = self._filter_args_by_intent(
-            intent.value, context.get("entities", {})
+            intent.value, reference.get("entities", {})
         )
 
         result = self._execute_action_by_name(intent.value, args)
@@ -274,24 +628,24 @@ class ActionExecutor:
         if GLOBAL_INTERRUPT.is_triggered():
             return {"success": False, "message": "Action cancelled."}
 
-        sa = self.system_actions
-
-        if action == "open_browser":
-            return sa.open_browser(args.get("url"), args.get("target"))
-        if action == "search_web":
-            return sa.search_web(args.get("query"), args.get("target"))
-        if action == "open_file_manager":
-            return sa.open_file_manager(args.get("path"), args.get("target"))
-        if action == "list_files":
-            return sa.list_files(args.get("path"), args.get("target"))
-        if action == "open_file":
-            return sa.open_file(
-                args.get("filename"), args.get("full_path"), args.get("target")
-            )
-        if action == "open_terminal":
-            return sa.open_terminal(args.get("command"), args.get("target"))
+        try:
+            handler = SKILLS.handler(action)
+        except KeyError:
+            return {"success": False, "message": f"Intent not implemented: {action}"}
+        except Exception as e:
+            logger.error(f"Skill {action} failed to load: {e}")
+            return {"success": False, "message": f"Skill unavailable: {action}"}
 
-        return {"success": False, "message": f"Intent not implemented: {action}"}
+        return handler(self.system_actions, args)
+
+    def _extract_args(self, text: str, action: str) -> Dict[str, Any]:
+        """
+        The skill's own extractor when it declares one, the shared one otherwise.
+        """
+        extractor = SKILLS.extractor(action)
+        if extractor is None:
+            return self.argument_extractor.extract_for_intent(text, action)
+        return extractor(text)
 
     # =====================================================
     # HELPERS
@@ -302,6 +656,16 @@ class ActionExecutor:
         allowed = INTENT_ENTITY_WHITELIST.get(intent, [])
         return {k: v for k, v in (args or {}).items() if k in allowed}
 
+    def _predict_next(self, intent: Intent, args: Dict[str, Any], sequence: str = "default"):
+        """
+        Day 22.2 — score the last prediction, learn, prefetch the next one.
+        """
+        self.prefetcher.resolve(intent.value)
+        self.next_intent_model.observe(intent.value, args, sequence)
+        self.prefetcher.schedule(
+            self.next_intent_model.predict(intent.value, args), args
+        )
+
     def _log(self, intent: Intent, text: str, confidence: float):
         self.action_history.append(
             {"intent": intent.value, "text": text, "confidence": confidence}
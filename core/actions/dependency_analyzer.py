@@ -0,0 +1,50 @@
+"""
+Dependency Analyzer
+Day 22.1 — Decide which sub-commands may run concurrently
+
+Input: ordered sub-commands
+    {"intent": Intent, "text": str, "confidence": float, "sequential": bool}
+
+Output: ordered stages (lists of command indexes).
+Commands inside one stage are independent and may run in parallel.
+Stages run strictly one after another.
+
+A command starts a NEW stage when:
+- it refers to a previous result ("open it", "list them again")
+- it was introduced with "then" / "after that"
+- it is a dangerous intent (always runs alone)
+- the current stage holds a dangerous intent
+"""
+
+import re
+from typing import Any, Dict, List
+
+from core.nlp.intent import Intent
+
+REFERENCE_PATTERN = re.compile(r"\b(it|that|there|again|same|them)\b")
+
+
+def plan_stages(
+    commands: List[Dict[str, Any]],
+    dangerous_intents: set[Intent],
+) -> List[List[int]]:
+    stages: List[List[int]] = []
+
+    for idx, command in enumerate(commands):
+        intent = command.get("intent")
+        text = (command.get("text") or "").lower()
+
+        needs_new_stage = (
+            not stages
+            or command.get("sequential", False)
+            or bool(REFERENCE_PATTERN.search(text))
+            or intent in dangerous_intents
+            or any(commands[i].get("intent") in dangerous_intents for i in stages[-1])
+        )
+
+        if needs_new_stage:
+            stages.append([idx])
+        else:
+            stages[-1].append(idx)
+
+    return stages
@@ -0,0 +1,169 @@
+"""
+Prefetcher
+Day 22.2 — Speculative warm-up for the predicted next action
+
+After each action the NextIntentModel predicts what comes next.
+The Prefetcher does the cheap, side-effect-free part of that
+action in the background:
+
+- list_files / open_file_manager → directory listing
+- open_file                        → listings of the folders it searches
+- open_browser / search_web        → browser controller lookup
+
+Nothing is ever launched or opened speculatively.
+
+Stats (scored from what the real action took from the cache):
+- hits / misses / hit_rate
+- saved_seconds  (prefetch work the real action did not repeat)
+- wasted_seconds (prefetch work nobody used, even if the intent was right)
+Wasted work is capped per time window; over budget → prefetch pauses.
+"""
+
+import logging
+import os
+import time
+import webbrowser
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from core.system.prefetch_cache import PrefetchCache
+
+logger = logging.getLogger(__name__)
+
+# Folders SystemActions.open_file searches (in order)
+OPEN_FILE_BASES = ["~/Downloads", "~/Desktop", "~/Documents"]
+
+
+class Prefetcher:
+    def __init__(
+        self,
+        cache: PrefetchCache,
+        min_probability: float = 0.5,
+        max_wasted_seconds: float = 2.0,
+        window_seconds: float = 60.0,
+    ):
+        self.cache = cache
+        self.min_probability = min_probability
+        self.max_wasted_seconds = max_wasted_seconds
+        self.window_seconds = window_seconds
+
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._pending: Optional[Dict[str, Any]] = None
+        self._waste_log: deque = deque()
+
+        self.stats = {
+            "predictions": 0,
+            "hits": 0,
+            "misses": 0,
+            "skipped": 0,
+            "saved_seconds": 0.0,
+            "wasted_seconds": 0.0,
+        }
+
+    # -------------------------------
+    # Scoring the previous prediction
+    # -------------------------------
+    def resolve(self, intent: str):
+        """
+        Called after the action that actually ran (intent kept for logging).
+        Each warmed entry is a hit if that action took it from the cache;
+        the rest of the work is waste.
+        """
+        pending = self._pending
+        self._pending = None
+        if not pending:
+            return
+
+        cost = self._cost(pending["future"])
+        keys = pending["keys"]
+        used = sum(self.cache.settle(key) for key in keys)
+
+        if used:
+            self.stats["hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            logger.debug("Prefetch for %s unused (ran %s)", pending["intent"], intent)
+
+        saved = cost * used / len(keys) if keys else 0.0
+        self.stats["saved_seconds"] += saved
+        if cost - saved > 0:
+            self.stats["wasted_seconds"] += cost - saved
+            self._waste_log.append((time.monotonic(), cost - saved))
+
+    def _cost(self, future: Future) -> float:
+        # Never block the turn on speculative work
+        if not future.done():
+            future.cancel()
+            return 0.0
+        try:
+            return future.result()
+        except Exception:
+            return 0.0
+
+    # -------------------------------
+    # Scheduling
+    # -------------------------------
+    def schedule(self, predictions: List[Dict[str, Any]], current_args: Dict[str, Any]):
+        if not predictions:
+            return
+
+        best = predictions[0]
+        if best["probability"] < self.min_probability:
+            return
+
+        if self._wasted_in_window() > self.max_wasted_seconds:
+            self.stats["skipped"] += 1
+            return
+
+        self.stats["predictions"] += 1
+        keys: List[Any] = []
+        self._pending = {
+            "intent": best["intent"],
+            "keys": keys,
+            "future": self._pool.submit(self._warm, best, keys),
+        }
+
+    def _wasted_in_window(self) -> float:
+        cutoff = time.monotonic() - self.window_seconds
+        while self._waste_log and self._waste_log[0][0] < cutoff:
+            self._waste_log.popleft()
+        return sum(cost for _, cost in self._waste_log)
+
+    # -------------------------------
+    # Warm-up work (background thread)
+    # -------------------------------
+    def _warm(self, prediction: Dict[str, Any], keys: List[Any]) -> float:
+        start = time.perf_counter()
+        intent = prediction["intent"]
+
+        try:
+            if intent in ("list_files", "open_file_manager"):
+                path = prediction["args"].get("path")
+                if path:
+                    self._listdir(path, keys)
+
+            elif intent == "open_file":
+                for base in OPEN_FILE_BASES:
+                    self._listdir(os.path.expanduser(base), keys)
+
+            elif intent in ("open_browser", "search_web"):
+                self.cache.put(("browser",), webbrowser.get())
+                keys.append(("browser",))
+
+        except Exception as e:
+            logger.debug("Prefetch for %s failed: %s", intent, e)
+
+        return time.perf_counter() - start
+
+    def _listdir(self, path: str, keys: List[Any]):
+        if os.path.isdir(path):
+            self.cache.put(("listdir", path), os.listdir(path))
+            keys.append(("listdir", path))
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+    def hit_rate(self) -> float:
+        scored = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / scored if scored else 0.0
@@ -1,16 +1,21 @@
+import threading
+
 from loguru import logger
 
 from core.input.input_validator import InputValidator
 from core.input_controller import InputController
 from core.nlp.normalizer import normalize_text
+from core.nlp.compound_splitter import split_compound
 from core.nlp.intent import Intent
 from core.skills.basic import handle as basic_handle
 from core.context.short_term import ShortTermContext
-from core.context.long_term import save_message
+from core.context.long_term import save_message, recent_intents
 from core.intelligence.intent_scorer import score_intents, pick_best_intent
 from core.intelligence.confidence_refiner import refine_confidence
-from core.actions.action_executor import ActionExecutor
+from core.intelligence.utterance_log import UnclearUtteranceLog
+from core.actions.action_executor import ActionExecutor, DANGEROUS_INTENTS, ExecutionSession
 
+from core.config import ASYNC_ACTIONS, TTS_BACKEND
 from core.control.global_interrupt import GLOBAL_INTERRUPT
 from core.control.interrupt_words import INTERRUPT_KEYWORDS
 from core.control.interrupt_policy import INTERRUPT_POLICY  # Day 18.4
@@ -36,8 +41,15 @@ from core.memory.memory_manager import MemoryManager
 # Day 21.5 — STM read (READ-ONLY)
 from core.memory.short_term_memory import ShortTermMemory
 
+# Day 22.4 — Learned phrase shortcuts
+from core.memory.phrase_shortcuts import PhraseShortcuts
+
+# Day 24.4 — Spoken responses
+from core.speech.tts import PyAudioPlayer, SpeechOutput, create_backend
+
 
 INTENT_CONFIDENCE_THRESHOLD = 0.65
+SHORTCUT_CONFIDENCE = 0.85
 
 CLARIFICATION_MESSAGES = [
     "I’m not sure what you meant. Can you rephrase?",
@@ -45,37 +57,89 @@ CLARIFICATION_MESSAGES = [
     "I didn’t fully get that. What would you like to do?",
 ]
 
+# Day 24.4 — rendered once, served from the TTS cache afterwards
+FIXED_PHRASES = CLARIFICATION_MESSAGES + [
+    "Okay, stopped.",
+    "Please repeat.",
+    "Goodbye!",
+    "Do you want me to stop this action?",
+]
+
 IDLE, ACTIVE, WAITING = "idle", "active", "waiting"
 
 NEGATION_TOKENS = {"dont", "do", "not", "never", "no"}
 
 
 class Assistant:
-    def __init__(self):
-        self.input = InputController()
+    def __init__(self, input_controller=None, action_executor=None, session: str | None = None):
+        # Day 25.2 — a multi-room router injects per-device input + a shared executor
+        self.input = input_controller or InputController()
+        self.session = session
         self.running = True
+        # Day 26.1 — a turn and an action completion never run at the same time
+        self._turn_lock = threading.RLock()
         self.ctx = ShortTermContext()
         self.input_validator = InputValidator()
         self.state = IDLE
 
-        self.action_executor = ActionExecutor()
+        if action_executor is None:
+            action_executor = ActionExecutor()
+
+            # Day 22.2 — learn intent transitions from the conversation log
+            try:
+                action_executor.next_intent_model.train(recent_intents())
+            except Exception as e:
+                logger.warning("Next-intent bootstrap skipped: {}", e)
+        self.action_executor = action_executor
+        # Follow-up context of this conversation (the executor may be shared)
+        self.execution = ExecutionSession(session) if session else action_executor.default_session
 
         # Slot recovery (Day 17.6)
         self.pending_intent = None
         self.pending_args = {}
         self.missing_args = []
+        self.pending_text = None
 
         self.clarify_index = 0
 
+        # Day 22.4 — phrase that last needed a clarification
+        self.unclear_text = None
+
+        # Day 22.5 — clarification failures, mined offline
+        self.unclear_log = UnclearUtteranceLog()
+
         # Day 21.1 — Memory manager (policy enforced internally)
         self.memory_manager = MemoryManager()
 
         # Day 21.5 — STM (read-only usage)
         self.stm = ShortTermMemory()
 
+        # Day 22.4 — Phrase shortcuts (never for dangerous intents)
+        self.shortcuts = PhraseShortcuts(
+            blocked_intents={i.value for i in DANGEROUS_INTENTS} | {Intent.EXIT.value}
+        )
+
+        # Day 24.4 — TTS (off unless configured)
+        self.speech_output = None
+        if TTS_BACKEND:
+            try:
+                self.speech_output = SpeechOutput(
+                    create_backend(TTS_BACKEND),
+                    player=PyAudioPlayer(),
+                    fixed_phrases=FIXED_PHRASES,
+                )
+                self.speech_output.warm_async()
+            except Exception as e:
+                logger.warning("Speech output disabled: {}", e)
+
     # =================================================
     # UTIL
     # =================================================
+    def _say(self, text: str):
+        print(f"Rudra ({self.session}) > {text}" if self.session else f"Rudra > {text}")
+        if self.speech_output is not None:
+            self.speech_output.say(text)
+
     def next_clarification(self):
         msg = CLARIFICATION_MESSAGES[self.clarify_index]
         self.clarify_index = (self.clarify_index + 1) % len(CLARIFICATION_MESSAGES)
@@ -109,24 +173,37 @@ class Assistant:
             return
 
         if policy == "SOFT":
-            print("Rudra > Do you want me to stop this action?")
+            self._say("Do you want me to stop this action?")
             return
 
         GLOBAL_INTERRUPT.trigger()
-        self.action_executor.cancel_pending()
+        self.action_executor.cancel_pending(self.execution)
 
         self.pending_intent = None
         self.pending_args = {}
         self.missing_args = []
+        self.pending_text = None
 
         self.input.reset_execution_state()
-        print("Rudra > Okay, stopped.")
         GLOBAL_INTERRUPT.clear()
+        self._say("Okay, stopped.")
 
     # =================================================
     # CORE SINGLE CYCLE (Day 21.5)
     # =================================================
     def _cycle(self):
+        with self._turn_lock:
+            self._turn()
+
+    def _read_unlocked(self) -> str:
+        # Completions may speak and save while we wait for the user
+        self._turn_lock.release()
+        try:
+            return self.input.read()
+        finally:
+            self._turn_lock.acquire()
+
+    def _turn(self):
         # Working Memory
         wm = WorkingMemory()
 
@@ -147,18 +224,31 @@ class Assistant:
         slot_merger = SlotPreferenceMerger()
         confidence_adjuster = ConfidenceAdjuster()
 
-        raw_text = self.input.read()
+        # Day 24.3 — "stop" was spotted on audio while the last action ran
+        barge_in = getattr(self.input, "barge_in", None)
+        if barge_in is not None and barge_in.fired.is_set():
+            cancel_ms = barge_in.acknowledge()
+            logger.info("Barge-in cancellation acknowledged after {:.0f} ms", cancel_ms or 0.0)
+            self._handle_interrupt("barge-in", self.pending_intent)
+            GLOBAL_INTERRUPT.clear()
+            wm.mark_interrupted()
+            return
+
+        raw_text = self._read_unlocked()
         if not raw_text and not self.pending_intent:
             return
 
         validation = self.input_validator.validate(raw_text)
         if not validation["valid"]:
-            print("Rudra > Please repeat.")
+            self._say("Please repeat.")
             return
 
         clean_text = validation["clean_text"]
         tokens = normalize_text(clean_text)
 
+        # Day 22.4 — a clarification only applies to the very next turn
+        unclear_text, self.unclear_text = self.unclear_text, None
+
         # 🔴 INTERRUPT
         current_intent = self.pending_intent
         if self._detect_embedded_interrupt(tokens):
@@ -178,48 +268,75 @@ class Assistant:
             ]
 
             if still_missing:
-                print(f"Rudra > Please provide {', '.join(still_missing)}.")
+                self._say(f"Please provide {', '.join(still_missing)}.")
                 self.missing_args = still_missing
                 return
 
-            self.action_executor.execute(
+            result = self.action_executor.execute(
                 self.pending_intent,
                 clean_text,
                 confidence=0.85,
                 replay_args=self.pending_args,
+                session=self.execution,
             )
 
+            # Day 22.4 — the user just confirmed what the phrase meant
+            if result.get("success") and self.pending_text:
+                self.shortcuts.learn(
+                    self.pending_text, self.pending_intent.value, self.pending_args
+                )
+
             self.pending_intent = None
             self.pending_args = {}
             self.missing_args = []
+            self.pending_text = None
             return
 
-        # ================= NORMAL FLOW =================
-        scores = score_intents(tokens)
-        intent, confidence = pick_best_intent(scores, tokens)
-        confidence = refine_confidence(
-            confidence, tokens, intent.value, self.ctx.last_intent
-        )
-
-        wm.set_intent(intent.value, confidence)
+        # ================= PHRASE SHORTCUT (Day 22.4) =================
+        shortcut = self.shortcuts.lookup(clean_text)
+        shortcut_args = {}
+        # The phrase needed ambiguity resolution → worth learning once confirmed
+        ambiguous = False
+
+        if shortcut:
+            intent = Intent(shortcut["intent"])
+            confidence = SHORTCUT_CONFIDENCE
+            shortcut_args = shortcut["args"]
+            logger.debug("Phrase shortcut hit: {}", intent.value)
+            wm.set_intent(intent.value, confidence)
+        else:
+            # ================= COMPOUND COMMANDS (Day 22.1) =================
+            clauses = split_compound(clean_text)
+            if len(clauses) > 1 and self._run_compound(clauses):
+                return
 
-        # ---- Ambiguity resolution (Day 20.2 + STM context) ----
-        if confidence < INTENT_CONFIDENCE_THRESHOLD or intent == Intent.UNKNOWN:
-            resolved = follow_up_resolver.resolve(
-                tokens=tokens,
-                context_pack=context_pack
+            # ================= NORMAL FLOW =================
+            scores = score_intents(tokens)
+            intent, confidence = pick_best_intent(scores, tokens)
+            confidence = refine_confidence(
+                confidence, tokens, intent.value, self.ctx.last_intent
             )
 
-            if resolved:
-                try:
-                    intent = Intent(resolved["resolved_intent"])
-                    confidence = 0.7
-                except Exception:
-                    print(f"Rudra > {self.next_clarification()}")
+            wm.set_intent(intent.value, confidence)
+
+            # ---- Ambiguity resolution (Day 20.2 + STM context) ----
+            if confidence < INTENT_CONFIDENCE_THRESHOLD or intent == Intent.UNKNOWN:
+                resolved = follow_up_resolver.resolve(
+                    tokens=tokens,
+                    context_pack=context_pack
+                )
+
+                if resolved:
+                    try:
+                        intent = Intent(resolved["resolved_intent"])
+                        confidence = 0.7
+                        ambiguous = True
+                    except Exception:
+                        self._clarify(clean_text, intent, confidence)
+                        return
+                else:
+                    self._clarify(clean_text, intent, confidence)
                     return
-            else:
-                print(f"Rudra > {self.next_clarification()}")
-                return
 
         # ---- Confidence adjustment (Day 20.4) ----
         confidence = confidence_adjuster.adjust(
@@ -229,7 +346,10 @@ class Assistant:
         )
 
         # ---- Slot + preference merge (Day 20.3) ----
-        missing = self.action_executor.get_missing_args(intent, clean_text)
+        missing = [
+            k for k in self.action_executor.get_missing_args(intent, clean_text)
+            if not shortcut_args.get(k)
+        ]
 
         if missing:
             preferences = context_pack.get("user_preferences", [])
@@ -247,12 +367,17 @@ class Assistant:
                     clean_text,
                     confidence=confidence,
                     replay_args=merged_args,
+                    session=self.execution,
                 )
                 return
 
             self.pending_intent = intent
+            self.pending_args = dict(shortcut_args)
             self.missing_args = missing
-            print(f"Rudra > Please provide {', '.join(missing)}.")
+            # Only an unclear phrase is learned; a plainly under-specified
+            # one ("open file") must keep asking for its slot
+            self.pending_text = unclear_text or (clean_text if ambiguous else None)
+            self._say(f"Please provide {', '.join(missing)}.")
             return
 
         # =================================================
@@ -271,27 +396,167 @@ class Assistant:
         save_message("user", clean_text, intent.value)
 
         if intent == Intent.EXIT:
-            print("Rudra > Goodbye!")
+            self._say("Goodbye!")
             self.running = False
             return
 
-        if intent in (Intent.GREETING, Intent.HELP):
+        if intent == Intent.NOTE_DICTATE:
+            response = self._dictate()
+        elif intent in (Intent.GREETING, Intent.HELP):
             response = basic_handle(intent, clean_text)
+        elif ASYNC_ACTIONS and self.action_executor.supports(intent):
+            # Day 26.1 — back to listening now; answer when the action is done
+            future = self.action_executor.submit(
+                intent, clean_text, confidence, replay_args=shortcut_args or None, session=self.execution
+            )
+            future.add_done_callback(
+                lambda f: self._action_done(f.result(), clean_text, intent, shortcut, unclear_text)
+            )
+            self.ctx.update(intent.value)
+            return
         else:
-            result = self.action_executor.execute(intent, clean_text, confidence)
+            result = self.action_executor.execute(
+                intent, clean_text, confidence, replay_args=shortcut_args or None, session=self.execution
+            )
             response = result.get("message", "Done.")
+            self._update_shortcuts(clean_text, intent, result, shortcut, unclear_text)
 
-        print(f"Rudra > {response}")
+        self._say(response)
         save_message("assistant", response, intent.value)
         self.ctx.update(intent.value)
 
+    # =================================================
+    # DAY 26.1 — ASYNCHRONOUS ACTIONS
+    # =================================================
+    def _action_done(
+        self,
+        result: dict,
+        clean_text: str,
+        intent: Intent,
+        shortcut: dict | None,
+        unclear_text: str | None,
+    ):
+        """
+        Called on pool / timer threads: waits for the current turn, so
+        speech, the conversation log and shortcuts are never written concurrently.
+        """
+        with self._turn_lock:
+            response = result.get("message", "Done.")
+            self._update_shortcuts(clean_text, intent, result, shortcut, unclear_text)
+            self._say(response)
+            save_message("assistant", response, intent.value)
+
+    # =================================================
+    # DAY 22.4 — PHRASE SHORTCUTS
+    # =================================================
+    def _clarify(self, clean_text: str, intent: Intent, confidence: float):
+        self.unclear_text = clean_text
+        self.unclear_log.record(clean_text, intent.value, confidence)
+        self._say(self.next_clarification())
+
+    def _update_shortcuts(
+        self,
+        clean_text: str,
+        intent: Intent,
+        result: dict,
+        shortcut: dict | None,
+        unclear_text: str | None,
+    ):
+        if shortcut:
+            # A shortcut that no longer works is dropped
+            if not result.get("success"):
+                self.shortcuts.forget(clean_text)
+            return
+
+        # Clarification answered by a successful action → learn the unclear phrase
+        if unclear_text and result.get("success"):
+            self.shortcuts.learn(unclear_text, intent.value, result.get("args"))
+
+    # =================================================
+    # DAY 25.6 — DICTATION
+    # =================================================
+    def _dictate(self) -> str:
+        dictate = getattr(self.input, "dictate", None)
+        if dictate is None:
+            return "Dictation needs streaming audio capture."
+
+        from core.skills.notes import append_to_note, start_note
+
+        note = {}
+
+        def save(text: str):
+            # Runs on dictation worker threads: saved and logged, never spoken
+            if "id" in note:
+                append_to_note(note["id"], text)
+            else:
+                note["id"] = start_note(text)
+            logger.info("Dictated ({}): {}", self.session or "local", text)
+
+        self._say("Dictating. Pause for a few seconds when you are done.")
+        report = dictate(save)
+        if report is None:
+            return "Dictation needs streaming audio capture."
+        if not report["words"]:
+            return "I did not hear anything to save."
+        return f"Saved {report['words']} words to your note."
+
+    # =================================================
+    # DAY 22.1 — COMPOUND COMMANDS
+    # =================================================
+    def _run_compound(self, clauses: list[dict]) -> bool:
+        """
+        Resolve every clause on its own and execute them as one turn.
+        Returns False (single-intent fallback) unless EVERY clause
+        is a confident, executor-supported action.
+        """
+        commands = []
+
+        for clause in clauses:
+            tokens = normalize_text(clause["text"])
+            scores = score_intents(tokens)
+            intent, confidence = pick_best_intent(scores, tokens)
+            confidence = refine_confidence(
+                confidence, tokens, intent.value, self.ctx.last_intent
+            )
+
+            if confidence < INTENT_CONFIDENCE_THRESHOLD:
+                return False
+            if not self.action_executor.supports(intent):
+                return False
+
+            commands.append({
+                "intent": intent,
+                "text": clause["text"],
+                "confidence": confidence,
+                "sequential": clause["sequential"],
+            })
+
+        logger.debug("Compound command: {}", [c["intent"].value for c in commands])
+
+        for cmd in commands:
+            save_message("user", cmd["text"], cmd["intent"].value)
+
+        result = self.action_executor.execute_compound(commands, session=self.execution)
+        response = result.get("message", "Done.")
+
+        self._say(response)
+        save_message("assistant", response, commands[-1]["intent"].value)
+        self.ctx.update(commands[-1]["intent"].value)
+        return True
+
     # =================================================
     # PRODUCTION LOOP
     # =================================================
     def run(self):
         logger.info("Day 21.5 — STM read-only context integrated")
-        while self.running:
-            self._cycle()
+        try:
+            while self.running:
+                self._cycle()
+        finally:
+            # Room inputs (SessionInput) own no capture resources
+            close = getattr(self.input, "close", None)
+            if close is not None:
+                close()
 
     # =================================================
     # TEST-SAFE SINGLE CYCLE
@@ -0,0 +1,179 @@
+"""
+Barge-In Listener
+Day 24.3 — Say "stop" while an action runs and it stops now
+
+While armed (from the end of the user's command until the assistant
+listens again) a background thread runs the keyword spotter on its
+own ring reader. A spotted interrupt phrase calls
+GLOBAL_INTERRUPT.trigger() at once — no transcript, no new turn.
+
+Latency, both published in report():
+    detect   end of the spoken keyword → trigger()  (audio-clock based)
+    cancel   trigger() → the assistant acknowledged the cancellation
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.recorder import FRAME_SAMPLES
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.control.interrupt_words import INTERRUPT_KEYWORDS
+
+
+class BargeInListener:
+    def __init__(
+        self,
+        recorder,
+        spotter,
+        keywords: Iterable[str] = INTERRUPT_KEYWORDS,
+        interrupt=GLOBAL_INTERRUPT,
+        on_interrupt: Optional[Callable[[Dict[str, object]], None]] = None,
+        history: int = 200,
+    ):
+        self.recorder = recorder
+        self.spotter = spotter
+        self.keywords = set(keywords)
+        self.interrupt = interrupt
+        self.on_interrupt = on_interrupt
+
+        self._reader = recorder.reader("barge-in")
+        self._armed = threading.Event()
+        self._running = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.fired = threading.Event()
+        self.last_detection: Optional[Dict[str, object]] = None
+        self._triggered_at: Optional[float] = None
+
+        self._detect_ms = deque(maxlen=history)
+        self._cancel_ms = deque(maxlen=history)
+        self._total_ms = deque(maxlen=history)
+        self.stats = {"armed": 0, "detections": 0, "ignored": 0}
+
+    # -------------------------------
+    # Lifecycle
+    # -------------------------------
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="barge-in", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        self._running.clear()
+        self._armed.set()           # wake the thread so it can exit
+        if self._thread:
+            self._thread.join(timeout)
+
+    def arm(self):
+        """
+        Start listening from "now" (old audio is never re-scanned).
+        """
+        if self._armed.is_set():
+            return
+        self._reader.skip_to_now()
+        self.spotter.reset()
+        self.fired.clear()
+        self.stats["armed"] += 1
+        self._armed.set()
+
+    def disarm(self):
+        self._armed.clear()
+
+    @property
+    def armed(self) -> bool:
+        return self._armed.is_set()
+
+    # -------------------------------
+    # Listening
+    # -------------------------------
+    def _run(self):
+        while self._running.is_set():
+            if not self._armed.wait(0.1) or not self._running.is_set():
+                continue
+
+            view = self._reader.read_exact(FRAME_SAMPLES, timeout=0.1)
+            if view is None or not self._armed.is_set():
+                continue
+
+            try:
+                detection = self.spotter.process(np.frombuffer(view, dtype=np.int16))
+            except Exception as e:
+                logger.error("Barge-in spotter failed: {}", e)
+                continue
+
+            if detection:
+                self._on_detection(detection)
+
+    def _on_detection(self, detection: Dict[str, object]):
+        if detection["keyword"] not in self.keywords:
+            self.stats["ignored"] += 1
+            return
+
+        # Where the keyword ended, in ring positions
+        buffered = self.spotter.samples_seen - detection["end_sample"]
+        keyword_end = self._reader.cursor - buffered
+
+        self.interrupt.trigger()
+        self._triggered_at = time.perf_counter()
+
+        lag = max(0, self.recorder.write_position - keyword_end)
+        detection["detect_ms"] = lag / self.recorder.sample_rate * 1000
+        self._detect_ms.append(detection["detect_ms"])
+
+        self.stats["detections"] += 1
+        self.last_detection = detection
+        self._armed.clear()
+        self.fired.set()
+        logger.warning(
+            "Barge-in: '{}' (score {}) → interrupt in {:.0f} ms",
+            detection["keyword"], detection["score"], detection["detect_ms"],
+        )
+
+        if self.on_interrupt:
+            self.on_interrupt(detection)
+
+    def acknowledge(self) -> Optional[float]:
+        """
+        Called once the interrupted work has actually stopped.
+        """
+        if not self.fired.is_set():
+            return None
+        self.fired.clear()
+        if self._triggered_at is None:
+            return None
+        cancel_ms = (time.perf_counter() - self._triggered_at) * 1000
+        self._cancel_ms.append(cancel_ms)
+        self._total_ms.append(self.last_detection["detect_ms"] + cancel_ms)
+        self._triggered_at = None
+        return cancel_ms
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+    @staticmethod
+    def _summary(values) -> Dict[str, float]:
+        if not values:
+            return {"count": 0}
+        arr = np.array(values, dtype=float)
+        return {
+            "count": len(arr),
+            "p50_ms": round(float(np.percentile(arr, 50)), 1),
+            "p95_ms": round(float(np.percentile(arr, 95)), 1),
+        }
+
+    def report(self) -> Dict[str, object]:
+        return {
+            "armed": self.stats["armed"],
+            "detections": self.stats["detections"],
+            "ignored": self.stats["ignored"],
+            "detect_latency": self._summary(self._detect_ms),
+            "cancel_latency": self._summary(self._cancel_ms),
+            "utterance_to_cancel": self._summary(self._total_ms),
+        }
@@ -0,0 +1,41 @@
+"""
+Audio Clip
+Day 23.2 — One captured utterance
+
+Positions are absolute ring positions (samples), so latency
+can be measured in audio time:
+    endpoint delay = end - speech_end
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Union
+
+from core.audio.recorder import SAMPLE_RATE, SAMPLE_WIDTH
+
+
+@dataclass
+class AudioClip:
+    # int16 mono PCM (bytes, or a zero-copy view into the ring)
+    pcm: Union[bytes, memoryview]
+    sample_rate: int = SAMPLE_RATE
+    sample_width: int = SAMPLE_WIDTH
+
+    start: int = 0          # first sample (incl. pre-roll)
+    speech_end: int = 0     # last sample judged to be speech
+    end: int = 0            # where the endpointer closed the utterance
+
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return memoryview(self.pcm).nbytes / (self.sample_width * self.sample_rate)
+
+    @property
+    def endpoint_delay(self) -> float:
+        """
+        Seconds of trailing silence waited before closing.
+        """
+        return max(0, self.end - self.speech_end) / self.sample_rate
+
+    def to_bytes(self) -> bytes:
+        return self.pcm if isinstance(self.pcm, bytes) else self.pcm.tobytes()
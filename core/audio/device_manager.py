@@ -0,0 +1,278 @@
+"""
+Audio Device Manager
+Day 23.5 — One input stream for the life of the process
+
+- Enumerates input devices once and caches the list
+- Selects by (partial) name, falling back to a configured index,
+  the system default, then the first capable device
+- Keeps the stream open across turns; reads never re-open PortAudio
+- Reconnects transparently when the device disappears
+  (re-enumerates, re-selects, fills the gap with silence meanwhile)
+
+The manager itself is a frame source (read / sample_rate / close),
+so it feeds RingBufferRecorder directly, and ManagedAudioSource
+adapts it for speech_recognition's Recognizer.listen().
+
+A backend is anything with:
+    list_devices() -> [{"index", "name", "channels", "default_rate"}]
+    default_index() -> int | None
+    open(index, sample_rate, frame_samples) -> stream (read(n) / close())
+    refresh()       -> re-scan hardware
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+import speech_recognition as sr
+from loguru import logger
+
+from core.audio.recorder import FRAME_SAMPLES, SAMPLE_RATE, SAMPLE_WIDTH
+
+
+class PyAudioBackend:
+    def __init__(self):
+        import pyaudio
+
+        self._pyaudio = pyaudio
+        self._pa = pyaudio.PyAudio()
+
+    def list_devices(self) -> List[Dict[str, object]]:
+        devices = []
+        for i in range(self._pa.get_device_count()):
+            info = self._pa.get_device_info_by_index(i)
+            if info.get("maxInputChannels", 0) > 0:
+                devices.append({
+                    "index": i,
+                    "name": info.get("name", f"device {i}"),
+                    "channels": int(info["maxInputChannels"]),
+                    "default_rate": int(info.get("defaultSampleRate", SAMPLE_RATE)),
+                })
+        return devices
+
+    def default_index(self) -> Optional[int]:
+        try:
+            return self._pa.get_default_input_device_info()["index"]
+        except (IOError, OSError):
+            return None
+
+    def open(self, index: int, sample_rate: int, frame_samples: int):
+        stream = self._pa.open(
+            format=self._pyaudio.paInt16,
+            channels=1,
+            rate=sample_rate,
+            input=True,
+            input_device_index=index,
+            frames_per_buffer=frame_samples,
+        )
+        return _PyAudioStream(stream)
+
+    def refresh(self):
+        # PortAudio only re-scans hardware on re-initialisation
+        self._pa.terminate()
+        self._pa = self._pyaudio.PyAudio()
+
+
+class _PyAudioStream:
+    def __init__(self, stream):
+        self._stream = stream
+
+    def read(self, num_samples: int) -> bytes:
+        return self._stream.read(num_samples, exception_on_overflow=False)
+
+    def close(self):
+        self._stream.stop_stream()
+        self._stream.close()
+
+
+class DeviceManager:
+    def __init__(
+        self,
+        backend=None,
+        device_name: Optional[str] = None,
+        device_index: Optional[int] = None,
+        sample_rate: int = SAMPLE_RATE,
+        frame_samples: int = FRAME_SAMPLES,
+        retry_interval: float = 1.0,
+    ):
+        self.backend = backend or PyAudioBackend()
+        self.device_name = device_name
+        self.device_index = device_index
+        self.sample_rate = sample_rate
+        self.frame_samples = frame_samples
+        self.retry_interval = retry_interval
+
+        self.device: Optional[Dict[str, object]] = None
+        self._devices: Optional[List[Dict[str, object]]] = None
+        self._stream = None
+        self._lock = threading.Lock()
+        self._next_retry = 0.0
+
+        self.stats = {
+            "opens": 0,
+            "reconnects": 0,
+            "read_errors": 0,
+            "silence_samples": 0,
+            "open_seconds": 0.0,
+            "close_seconds": 0.0,
+            "turns": 0,
+        }
+
+    # -------------------------------
+    # Discovery
+    # -------------------------------
+    def devices(self, refresh: bool = False) -> List[Dict[str, object]]:
+        if self._devices is None or refresh:
+            if refresh:
+                self.backend.refresh()
+            self._devices = self.backend.list_devices()
+        return self._devices
+
+    def select(self, name: Optional[str] = None, index: Optional[int] = None) -> Optional[Dict[str, object]]:
+        """
+        Name substring → explicit index → system default → first device.
+        """
+        devices = self.devices()
+        if not devices:
+            return None
+
+        if name:
+            needle = name.lower()
+            for device in devices:
+                if needle in str(device["name"]).lower():
+                    return device
+            logger.warning("No input device matching '{}'", name)
+
+        by_index = {d["index"]: d for d in devices}
+        for candidate in (index, self.backend.default_index()):
+            if candidate in by_index:
+                return by_index[candidate]
+
+        return devices[0]
+
+    # -------------------------------
+    # Stream lifecycle
+    # -------------------------------
+    def open(self):
+        with self._lock:
+            if self._stream is None:
+                self._open_locked()
+            return self._stream
+
+    def _open_locked(self):
+        self.device = self.select(self.device_name, self.device_index)
+        if self.device is None:
+            raise OSError("No audio input device available")
+
+        started = time.perf_counter()
+        self._stream = self.backend.open(self.device["index"], self.sample_rate, self.frame_samples)
+        self.stats["open_seconds"] += time.perf_counter() - started
+        self.stats["opens"] += 1
+        logger.info("Audio input opened: {} (#{})", self.device["name"], self.device["index"])
+
+    def _close_locked(self):
+        if self._stream is None:
+            return
+        started = time.perf_counter()
+        try:
+            self._stream.close()
+        except Exception as e:
+            logger.debug("Closing stale audio stream failed: {}", e)
+        self.stats["close_seconds"] += time.perf_counter() - started
+        self._stream = None
+
+    def _reconnect_locked(self) -> bool:
+        self._close_locked()
+        now = time.monotonic()
+        if now < self._next_retry:
+            return False
+        self._next_retry = now + self.retry_interval
+
+        try:
+            self.devices(refresh=True)
+            self._open_locked()
+        except Exception as e:
+            logger.warning("Audio input reconnect failed: {}", e)
+            return False
+
+        self.stats["reconnects"] += 1
+        return True
+
+    def read(self, num_samples: int) -> bytes:
+        """
+        Never raises and never returns b"" — a lost device yields
+        silence (paced in real time) until it is back.
+        """
+        with self._lock:
+            if self._stream is None and not self.stats["opens"]:
+                try:
+                    self._open_locked()
+                except Exception as e:
+                    logger.warning("Audio input unavailable: {}", e)
+
+            if self._stream is None and not self._reconnect_locked():
+                return self._silence(num_samples)
+            try:
+                return self._stream.read(num_samples)
+            except (IOError, OSError) as e:
+                self.stats["read_errors"] += 1
+                logger.warning("Audio input lost ({}), reconnecting", e)
+                if self._reconnect_locked():
+                    try:
+                        return self._stream.read(num_samples)
+                    except (IOError, OSError):
+                        self._close_locked()
+                return self._silence(num_samples)
+
+    def _silence(self, num_samples: int) -> bytes:
+        self.stats["silence_samples"] += num_samples
+        time.sleep(num_samples / self.sample_rate)
+        return bytes(num_samples * SAMPLE_WIDTH)
+
+    def close(self):
+        with self._lock:
+            self._close_locked()
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+    def note_turn(self):
+        self.stats["turns"] += 1
+
+    def report(self) -> Dict[str, object]:
+        """
+        Time saved = turns that reused the open stream × what one
+        open + close cycle costs on this machine.
+        """
+        opens = max(1, self.stats["opens"])
+        per_turn = (self.stats["open_seconds"] + self.stats["close_seconds"]) / opens
+        reused = max(0, self.stats["turns"] - self.stats["opens"])
+        return {
+            "device": self.device["name"] if self.device else None,
+            "opens": self.stats["opens"],
+            "reconnects": self.stats["reconnects"],
+            "turns": self.stats["turns"],
+            "per_turn_saved_ms": round(per_turn * 1000, 2),
+            "time_saved_ms": round(per_turn * reused * 1000, 2),
+            "silence_ms": round(self.stats["silence_samples"] / self.sample_rate * 1000, 1),
+        }
+
+
+class ManagedAudioSource(sr.AudioSource):
+    """
+    speech_recognition AudioSource over the persistent stream,
+    so Recognizer.listen() never re-opens the microphone.
+    """
+
+    def __init__(self, manager, chunk: int = 1024):
+        self.stream = manager
+        self.CHUNK = chunk
+        self.SAMPLE_RATE = manager.sample_rate
+        self.SAMPLE_WIDTH = SAMPLE_WIDTH
+        self.format = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
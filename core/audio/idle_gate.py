@@ -0,0 +1,190 @@
+"""
+Idle Gate
+Day 25.4 — Cheap listening while nobody talks
+
+The wake-word spotter computes a log-mel spectrum every 10 ms. In an
+empty room that is almost all wasted work. The gate sits in front of it:
+
+    IDLE       read a block of frames, keep every Nth sample, compare
+               frame energy with noise floor + margin (no FFT)
+        │  `onset_frames` loud frames in a row
+        ▼
+    ESCALATED  rewind `pre_roll_ms` and run the full-rate spotter from
+               there, so the start of the wake word is not lost
+        │  `hold_seconds` of quiet past the escalation point, no wake word
+        ▼
+    IDLE again (also at the start of every wake-word wait, i.e. once
+    InputController.ACTIVE_TIMEOUT has expired)
+
+Reported:
+    cpu seconds per hour of audio, idle vs full-rate
+    escalation delay   audio time from the first loud frame to escalation
+    catch-up           wall time for the spotter to work through the rewind
+"""
+
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+
+from core.audio.recorder import FRAME_SAMPLES, SAMPLE_RATE
+from core.audio.vad import frame_energy_db
+
+IDLE, ESCALATED = "idle", "escalated"
+
+
+class IdleGate:
+    DEFAULT_NOISE_FLOOR_DB = -60.0
+
+    def __init__(
+        self,
+        decimation: int = 4,
+        block_frames: int = 4,
+        margin_db: float = 10.0,
+        min_energy_db: float = -45.0,
+        onset_frames: int = 2,
+        hold_seconds: float = 2.0,
+        pre_roll_ms: int = 600,
+        noise_floor=None,
+        frame_samples: int = FRAME_SAMPLES,
+        sample_rate: int = SAMPLE_RATE,
+        history: int = 200,
+    ):
+        self.decimation = decimation
+        self.block_frames = block_frames
+        self.margin_db = margin_db
+        self.min_energy_db = min_energy_db
+        self.onset_frames = onset_frames
+        self.hold_frames = int(hold_seconds * sample_rate / frame_samples)
+        self.pre_roll_samples = int(pre_roll_ms * sample_rate / 1000)
+        self.noise_floor = noise_floor
+        self.frame_samples = frame_samples
+        self.sample_rate = sample_rate
+
+        self.mode = IDLE
+        self._run = 0
+        self._quiet = 0
+        self._woke = False
+        self._catch_up_started: Optional[float] = None
+        self._catch_up_target = 0
+
+        self.stats = {
+            "idle_audio_seconds": 0.0, "idle_cpu_seconds": 0.0,
+            "full_audio_seconds": 0.0, "full_cpu_seconds": 0.0,
+            "escalations": 0, "false_escalations": 0, "wakes": 0,
+        }
+        self._escalation_ms = deque(maxlen=history)
+        self._catch_up_ms = deque(maxlen=history)
+
+    @property
+    def block_samples(self) -> int:
+        return self.frame_samples * self.block_frames
+
+    def threshold_db(self) -> float:
+        floor = self.DEFAULT_NOISE_FLOOR_DB
+        if self.noise_floor is not None:
+            floor = self.noise_floor.noise_floor_db
+        return max(self.min_energy_db, floor + self.margin_db)
+
+    def _loud(self, samples: np.ndarray) -> np.ndarray:
+        decimated = samples[::self.decimation]
+        return frame_energy_db(decimated, self.frame_samples // self.decimation) > self.threshold_db()
+
+    # -------------------------------
+    # Transitions
+    # -------------------------------
+    def sleep(self):
+        if self.mode == ESCALATED and not self._woke:
+            self.stats["false_escalations"] += 1
+        self.mode = IDLE
+        self._run = 0
+        self._quiet = 0
+        self._woke = False
+        self._catch_up_started = None
+
+    def woke(self):
+        """
+        The spotter fired while escalated.
+        """
+        self._woke = True
+        self.stats["wakes"] += 1
+
+    # -------------------------------
+    # Feeding
+    # -------------------------------
+    def idle_step(self, samples: np.ndarray, end_position: int) -> Optional[int]:
+        """
+        One block in idle mode. Returns the ring position to rewind the
+        reader to when speech-like activity starts, else None.
+        """
+        started = time.process_time()
+        loud = self._loud(samples)
+        self.stats["idle_cpu_seconds"] += time.process_time() - started
+        self.stats["idle_audio_seconds"] += len(samples) / self.sample_rate
+
+        for i, is_loud in enumerate(loud):
+            self._run = self._run + 1 if is_loud else 0
+            if self._run < self.onset_frames:
+                continue
+
+            block_start = end_position - len(samples)
+            onset = block_start + (i + 1 - self._run) * self.frame_samples
+            self._escalation_ms.append((end_position - onset) / self.sample_rate * 1000)
+
+            self.mode = ESCALATED
+            self.stats["escalations"] += 1
+            self._run = 0
+            self._quiet = 0
+            self._catch_up_started = time.perf_counter()
+            self._catch_up_target = end_position
+            return max(0, onset - self.pre_roll_samples)
+        return None
+
+    def full_step(self, samples: np.ndarray, spotter_cpu: float, position: int) -> bool:
+        """
+        Account one full-rate frame. True → quiet for long enough, back to idle.
+        """
+        self.stats["full_cpu_seconds"] += spotter_cpu
+        self.stats["full_audio_seconds"] += len(samples) / self.sample_rate
+
+        if self._catch_up_started is not None and position >= self._catch_up_target:
+            self._catch_up_ms.append((time.perf_counter() - self._catch_up_started) * 1000)
+            self._catch_up_started = None
+
+        if position <= self._catch_up_target:
+            # Still inside the rewound pre-roll, which is quiet by design
+            return False
+        self._quiet = 0 if self._loud(samples).any() else self._quiet + 1
+        if self._quiet >= self.hold_frames:
+            self.sleep()
+            return True
+        return False
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+    def report(self) -> Dict[str, object]:
+        s = self.stats
+
+        def per_hour(cpu, audio):
+            return round(cpu / audio * 3600, 3) if audio else None
+
+        def p50(values):
+            return round(float(np.percentile(values, 50)), 1) if values else None
+
+        idle = per_hour(s["idle_cpu_seconds"], s["idle_audio_seconds"])
+        full = per_hour(s["full_cpu_seconds"], s["full_audio_seconds"])
+        return {
+            "mode": self.mode,
+            "escalations": s["escalations"],
+            "false_escalations": s["false_escalations"],
+            "wakes": s["wakes"],
+            "idle_cpu_s_per_hour": idle,
+            "full_cpu_s_per_hour": full,
+            "idle_fraction": round(
+                s["idle_audio_seconds"] / ((s["idle_audio_seconds"] + s["full_audio_seconds"]) or 1.0), 3
+            ),
+            "escalation_delay_ms_p50": p50(list(self._escalation_ms)),
+            "catch_up_ms_p50": p50(list(self._catch_up_ms)),
+        }
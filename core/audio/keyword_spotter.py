@@ -0,0 +1,280 @@
+"""
+Keyword Spotter
+Day 23.4 — On-device wake-word detection on raw audio frames
+
+Pipeline (all NumPy, vectorized per chunk):
+    PCM → 25 ms / 10 ms hop frames → power spectrum → 20-band log-mel
+    sliding window over the last ~template-length frames
+    → resample to a fixed length, per-band mean removal, L2 norm
+    → cosine similarity against every enrolled template (one matmul)
+
+Templates are enrolled from a handful of recordings of the keyword
+(silence trimmed by the VAD). Several window lengths are tried per
+check so slower / faster pronunciations still line up.
+
+Cost is reported as CPU seconds per second of audio.
+"""
+
+import time
+import wave
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.audio.recorder import SAMPLE_RATE
+from core.audio.vad import VoiceActivityDetector
+
+WIN_SAMPLES = 400           # 25 ms
+HOP_SAMPLES = 160           # 10 ms
+N_FFT = 512
+N_MELS = 20
+EMBED_FRAMES = 32
+EPS = 1e-6
+
+
+def mel_filterbank(n_mels: int = N_MELS, n_fft: int = N_FFT, rate: int = SAMPLE_RATE,
+                   fmin: float = 60.0, fmax: Optional[float] = None) -> np.ndarray:
+    """
+    Triangular mel filters, shape (n_mels, n_fft // 2 + 1).
+    """
+    fmax = fmax or rate / 2
+
+    def hz_to_mel(f):
+        return 2595.0 * np.log10(1.0 + f / 700.0)
+
+    def mel_to_hz(m):
+        return 700.0 * (10 ** (m / 2595.0) - 1.0)
+
+    mels = np.linspace(hz_to_mel(fmin), hz_to_mel(fmax), n_mels + 2)
+    bins = np.fft.rfftfreq(n_fft, 1.0 / rate)
+    edges = mel_to_hz(mels)
+
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bins - lower) / (center - lower)
+    falling = (upper - bins) / (upper - center)
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+
+
+_FILTERBANK = mel_filterbank()
+_WINDOW = np.hanning(WIN_SAMPLES).astype(np.float32)
+
+
+def log_mel(samples: np.ndarray) -> np.ndarray:
+    """
+    (n_frames, N_MELS) log-mel energies for a whole buffer.
+    """
+    x = np.asarray(samples, dtype=np.float32) / 32768.0
+    if len(x) < WIN_SAMPLES:
+        return np.zeros((0, N_MELS), dtype=np.float32)
+
+    frames = np.lib.stride_tricks.sliding_window_view(x, WIN_SAMPLES)[::HOP_SAMPLES]
+    power = np.abs(np.fft.rfft(frames * _WINDOW, n=N_FFT, axis=1)) ** 2
+    return np.log(power @ _FILTERBANK.T + EPS)
+
+
+def embed(features: np.ndarray) -> np.ndarray:
+    """
+    Fixed-size, level-independent vector for a feature window.
+    """
+    idx = np.linspace(0, len(features) - 1, EMBED_FRAMES).round().astype(int)
+    window = features[idx]
+    window = window - window.mean(axis=0)
+    vec = window.ravel()
+    return vec / (np.linalg.norm(vec) + EPS)
+
+
+def trim_silence(samples: np.ndarray, vad: Optional[VoiceActivityDetector] = None) -> np.ndarray:
+    vad = vad or VoiceActivityDetector()
+    flags = vad.classify(samples)
+    if not flags.any():
+        return samples
+    speech = np.flatnonzero(flags)
+    frame = vad.frame_samples
+    return samples[speech[0] * frame:(speech[-1] + 1) * frame]
+
+
+def read_wav(path: str) -> np.ndarray:
+    with wave.open(path, "rb") as wav:
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+
+class KeywordSpotter:
+    def __init__(
+        self,
+        threshold: float = 0.75,
+        min_energy_db: float = -45.0,
+        check_every: int = 3,           # frames (30 ms)
+        refractory_s: float = 1.0,
+        scales=(0.85, 1.0, 1.15),
+    ):
+        self.threshold = threshold
+        self.min_energy_db = min_energy_db
+        self.check_every = check_every
+        self.refractory_frames = int(refractory_s * SAMPLE_RATE / HOP_SAMPLES)
+        self.scales = scales
+
+        self._labels: List[str] = []
+        self._matrix = np.zeros((0, N_MELS * EMBED_FRAMES), dtype=np.float32)
+        self._lengths: List[int] = []
+
+        self.stats = {"audio_seconds": 0.0, "cpu_seconds": 0.0, "checks": 0, "detections": 0}
+        self.reset()
+
+    # -------------------------------
+    # Enrollment
+    # -------------------------------
+    def enroll(self, keyword: str, examples: Iterable[np.ndarray]):
+        lengths = []
+        rows = []
+        for samples in examples:
+            features = log_mel(trim_silence(samples))
+            if len(features) < 4:
+                continue
+            rows.append(embed(features))
+            lengths.append(len(features))
+
+        if not rows:
+            raise ValueError(f"No usable enrollment audio for '{keyword}'")
+
+        self._matrix = np.vstack([self._matrix, np.array(rows, dtype=np.float32)])
+        self._labels.extend([keyword] * len(rows))
+
+        base = int(np.median(lengths))
+        self._lengths = sorted(set(self._lengths) | {max(4, int(base * s)) for s in self.scales})
+        self._max_frames = max(self._lengths)
+
+    @classmethod
+    def from_wavs(cls, keyword_files: Dict[str, List[str]], **kwargs) -> "KeywordSpotter":
+        spotter = cls(**kwargs)
+        for keyword, paths in keyword_files.items():
+            spotter.enroll(keyword, [read_wav(p) for p in paths])
+        return spotter
+
+    @property
+    def keywords(self) -> List[str]:
+        return sorted(set(self._labels))
+
+    # -------------------------------
+    # Streaming
+    # -------------------------------
+    def reset(self):
+        """
+        Forget buffered audio (between utterances / test clips).
+        """
+        self._pending = np.zeros(0, dtype=np.int16)
+        self._features = np.zeros((0, N_MELS), dtype=np.float32)
+        self._energy = np.zeros(0, dtype=np.float32)
+        self._since_check = 0
+        self._cooldown = 0
+        self.samples_seen = 0
+
+    def process(self, samples: np.ndarray) -> Optional[Dict[str, object]]:
+        """
+        Feed one chunk; returns a detection dict or None.
+        """
+        started = time.process_time()
+        try:
+            return self._process(np.asarray(samples, dtype=np.int16))
+        finally:
+            self.stats["cpu_seconds"] += time.process_time() - started
+            self.stats["audio_seconds"] += len(samples) / SAMPLE_RATE
+
+    def _process(self, samples: np.ndarray) -> Optional[Dict[str, object]]:
+        self.samples_seen += len(samples)
+        if not self._labels:
+            return None
+
+        buf = np.concatenate([self._pending, samples])
+        if len(buf) < WIN_SAMPLES:
+            self._pending = buf
+            return None
+
+        n = 1 + (len(buf) - WIN_SAMPLES) // HOP_SAMPLES
+        used = buf[: (n - 1) * HOP_SAMPLES + WIN_SAMPLES]
+        self._pending = buf[n * HOP_SAMPLES:]
+
+        new = log_mel(used)
+        frames = np.lib.stride_tricks.sliding_window_view(used.astype(np.float32) / 32768.0, WIN_SAMPLES)[::HOP_SAMPLES]
+        energy = 10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+
+        keep = self._max_frames
+        self._features = np.concatenate([self._features, new])[-keep:]
+        self._energy = np.concatenate([self._energy, energy])[-keep:]
+
+        self._cooldown = max(0, self._cooldown - n)
+        self._since_check += n
+        if self._since_check < self.check_every or self._cooldown:
+            return None
+        self._since_check = 0
+
+        return self._check()
+
+    def _check(self) -> Optional[Dict[str, object]]:
+        if self._energy.max(initial=-100.0) < self.min_energy_db:
+            return None
+
+        candidates = [embed(self._features[-length:]) for length in self._lengths if length <= len(self._features)]
+        if not candidates:
+            return None
+
+        self.stats["checks"] += 1
+        sims = np.array(candidates) @ self._matrix.T          # (windows, templates)
+        best = np.unravel_index(np.argmax(sims), sims.shape)
+        score = float(sims[best])
+        if score < self.threshold:
+            return None
+
+        self.stats["detections"] += 1
+        self._cooldown = self.refractory_frames
+        return {
+            "keyword": self._labels[best[1]],
+            "score": round(score, 4),
+            "end_sample": self.samples_seen - len(self._pending),
+        }
+
+    def cpu_per_audio_second(self) -> float:
+        audio = self.stats["audio_seconds"]
+        return self.stats["cpu_seconds"] / audio if audio else 0.0
+
+    # -------------------------------
+    # Persistence
+    # -------------------------------
+    def save(self, path: str):
+        np.savez(path, matrix=self._matrix, labels=np.array(self._labels), lengths=np.array(self._lengths))
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "KeywordSpotter":
+        spotter = cls(**kwargs)
+        data = np.load(path)
+        spotter._matrix = data["matrix"].astype(np.float32)
+        spotter._labels = [str(x) for x in data["labels"]]
+        spotter._lengths = [int(x) for x in data["lengths"]]
+        spotter._max_frames = max(spotter._lengths)
+        return spotter
+
+
+def evaluate(spotter: KeywordSpotter, positives: List[np.ndarray], negatives: List[np.ndarray],
+             keyword: Optional[str] = None, chunk: int = 480) -> Dict[str, float]:
+    """
+    False-reject rate on clips containing the keyword and
+    false-accept rate on clips that do not, streamed chunk by chunk.
+    """
+    def spotted(samples):
+        spotter.reset()
+        padded = np.concatenate([samples, np.zeros(SAMPLE_RATE // 4, dtype=np.int16)])
+        for i in range(0, len(padded), chunk):
+            hit = spotter.process(padded[i:i + chunk])
+            if hit and (keyword is None or hit["keyword"] == keyword):
+                return True
+        return False
+
+    misses = sum(not spotted(p) for p in positives)
+    false_accepts = sum(spotted(n) for n in negatives)
+    negative_hours = sum(len(n) for n in negatives) / SAMPLE_RATE / 3600
+
+    return {
+        "false_reject_rate": misses / len(positives) if positives else 0.0,
+        "false_accept_rate": false_accepts / len(negatives) if negatives else 0.0,
+        "false_accepts_per_hour": false_accepts / negative_hours if negative_hours else 0.0,
+        "cpu_per_audio_second": spotter.cpu_per_audio_second(),
+    }
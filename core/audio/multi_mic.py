@@ -0,0 +1,209 @@
+"""
+Multi-Microphone Fan-In
+Day 25.2 — One process, several rooms
+
+    device A → RingBufferRecorder → MicStream A (wake word → VAD → ASR) ─┐
+    device B → RingBufferRecorder → MicStream B (wake word → VAD → ASR) ─┼─► utterances queue
+    device C → ...                                                       ─┘    {"device", "text", ...}
+
+Each device gets its own ring, spotter, VAD and endpointer (state is
+per stream); the recognizer is shared. Utterances fan in to one queue,
+tagged with the device they came from — SessionRouter turns them into
+per-room conversations on a single NLP/action pipeline.
+
+Per-stream CPU time (thread_time) over audio time processed gives the
+cost of one stream; 1 / that = streams one core can sustain.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.recorder import RingBufferRecorder
+from core.audio.vad import AdaptiveEndpointer, VoiceActivityDetector, capture_utterance
+
+
+class MicStream:
+    def __init__(
+        self,
+        device: str,
+        recorder,
+        recognizer,
+        sink: "queue.Queue",
+        spotter=None,
+        wake_word: str = "rudra",
+        listen_timeout: float = 5.0,
+    ):
+        self.device = device
+        self.recorder = recorder
+        self.recognizer = recognizer
+        self.sink = sink
+        self.spotter = spotter
+        self.wake_word = wake_word
+        self.listen_timeout = listen_timeout
+
+        self.reader = recorder.reader("stream")
+        self.vad = VoiceActivityDetector()
+        self.endpointer = AdaptiveEndpointer()
+
+        self._running = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.done = threading.Event()
+
+        self.stats = {"wakes": 0, "utterances": 0, "errors": 0, "cpu_seconds": 0.0}
+
+    def start(self):
+        self._running.set()
+        self.done.clear()
+        self._thread = threading.Thread(target=self._run, name=f"mic-{self.device}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        self._running.clear()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _finished(self) -> bool:
+        return not self.recorder.is_running() and self.reader.lag < self.vad.frame_samples
+
+    def _run(self):
+        try:
+            while self._running.is_set():
+                cpu = time.thread_time()
+                if self.spotter is not None and not self._wait_for_wake():
+                    break
+
+                clip = capture_utterance(
+                    self.reader, self.vad, self.endpointer,
+                    timeout=self.listen_timeout, catch_up=False,
+                )
+                self.stats["cpu_seconds"] += time.thread_time() - cpu
+
+                if clip is None:
+                    if self._finished():
+                        break
+                    continue
+
+                self._emit(clip)
+        finally:
+            self.done.set()
+
+    def _wait_for_wake(self) -> bool:
+        frame = self.vad.frame_samples
+        self.spotter.reset()
+        while self._running.is_set():
+            view = self.reader.read_exact(frame, timeout=0.5)
+            if view is None:
+                if self._finished():
+                    return False
+                continue
+
+            detection = self.spotter.process(np.frombuffer(view, dtype=np.int16))
+            if detection and detection["keyword"] == self.wake_word:
+                # The command starts where the wake word ended
+                buffered = self.spotter.samples_seen - detection["end_sample"]
+                self.reader.cursor -= min(buffered, self.reader.cursor)
+                self.stats["wakes"] += 1
+                return True
+        return False
+
+    def _emit(self, clip):
+        heard_at = time.time()
+        try:
+            result = self.recognizer.recognize(clip)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error("[{}] recognition failed: {}", self.device, e)
+            return
+
+        self.stats["utterances"] += 1
+        if not result.get("text"):
+            return
+        self.sink.put({
+            "device": self.device,
+            "text": result["text"],
+            "confidence": result.get("confidence", 0.0),
+            "clip": clip,
+            "heard_at": heard_at,
+        })
+
+    @property
+    def audio_seconds(self) -> float:
+        return self.reader.cursor / self.recorder.sample_rate
+
+    def report(self) -> Dict[str, object]:
+        audio = self.audio_seconds
+        return {
+            **self.stats,
+            "audio_seconds": round(audio, 2),
+            "cpu_per_audio_second": round(self.stats["cpu_seconds"] / audio, 4) if audio else None,
+            "overruns": self.reader.overruns,
+        }
+
+
+class MultiMicInput:
+    """
+    sources: {device name: frame source (DeviceManager, WavFileSource, ...)}
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, object],
+        recognizer,
+        spotter_factory: Optional[Callable[[], object]] = None,
+        wake_word: str = "rudra",
+        capacity_seconds: float = 10.0,
+        listen_timeout: float = 5.0,
+    ):
+        self.utterances: "queue.Queue[Dict[str, object]]" = queue.Queue()
+        self.recorders = {
+            name: RingBufferRecorder(source, capacity_seconds=capacity_seconds)
+            for name, source in sources.items()
+        }
+        self.streams = {
+            name: MicStream(
+                name,
+                recorder,
+                recognizer,
+                self.utterances,
+                spotter=spotter_factory() if spotter_factory else None,
+                wake_word=wake_word,
+                listen_timeout=listen_timeout,
+            )
+            for name, recorder in self.recorders.items()
+        }
+
+    def start(self):
+        # Recorders first: a stream that sees a stopped recorder ends
+        for name in self.streams:
+            self.recorders[name].start()
+            self.streams[name].start()
+        logger.info("Listening on {} devices: {}", len(self.streams), ", ".join(self.streams))
+
+    def stop(self):
+        for name in self.streams:
+            self.recorders[name].stop()
+            self.streams[name].stop()
+
+    def active(self) -> bool:
+        return any(not s.done.is_set() for s in self.streams.values())
+
+    def next_utterance(self, timeout: Optional[float] = None) -> Optional[Dict[str, object]]:
+        try:
+            return self.utterances.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def report(self) -> Dict[str, object]:
+        streams = {name: s.report() for name, s in self.streams.items()}
+        costs = [s["cpu_per_audio_second"] for s in streams.values() if s["cpu_per_audio_second"]]
+        per_stream = float(np.mean(costs)) if costs else None
+        return {
+            "streams": streams,
+            "cpu_per_stream_second": round(per_stream, 4) if per_stream else None,
+            "streams_per_core": int(1.0 / per_stream) if per_stream else None,
+        }
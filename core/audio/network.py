@@ -0,0 +1,356 @@
+"""
+Network Audio (Satellites)
+Day 25.3 — Remote microphones over UDP, played out through a jitter buffer
+
+A satellite only captures and sends; the central assistant runs
+everything else. UdpAudioSource is a frame source like DeviceManager
+(read / sample_rate / close), so it feeds RingBufferRecorder and the
+usual wake word / VAD / ASR path as one more "device".
+
+Packet (network byte order):
+    magic  4s   b"RDRA"
+    seq    I    frame counter, wraps never in practice (2^32 × 30 ms)
+    sent   d    sender clock, seconds
+    codec  B    0 = PCM16 LE, 1 = G.711 μ-law (2:1)
+    flags  B    1 = end of stream
+    payload     one frame
+
+Jitter buffer:
+- playout starts once `depth` frames are buffered
+- frames are released strictly in sequence order (reordering undone)
+- a gap is waited for up to depth × frame time while later frames
+  exist, then concealed with silence and counted as lost
+- late and duplicate packets are dropped; the buffer is bounded
+  (overflow skips ahead instead of growing latency)
+- a restarted satellite (seq back to 0: a jump further back than the
+  buffer could hold, or an earlier seq after END) starts a new stream
+"""
+
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.recorder import FRAME_SAMPLES, SAMPLE_RATE, SAMPLE_WIDTH
+
+HEADER = struct.Struct("!4sIdBB")
+MAGIC = b"RDRA"
+PCM16, ULAW = 0, 1
+END = 1
+
+MAX_DATAGRAM = 65507
+
+
+# -------------------------------
+# G.711 μ-law (vectorized)
+# -------------------------------
+ULAW_BIAS = 0x84
+ULAW_CLIP = 32635
+
+
+def ulaw_encode(samples: np.ndarray) -> bytes:
+    x = np.asarray(samples, dtype=np.int32)
+    sign = (x < 0).astype(np.int32) << 7
+    magnitude = np.minimum(np.abs(x), ULAW_CLIP) + ULAW_BIAS
+    exponent = np.clip(np.floor(np.log2(magnitude)).astype(np.int32) - 7, 0, 7)
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    return (~(sign | (exponent << 4) | mantissa) & 0xFF).astype(np.uint8).tobytes()
+
+
+def ulaw_decode(data: bytes) -> np.ndarray:
+    b = ~np.frombuffer(data, dtype=np.uint8).astype(np.int32) & 0xFF
+    exponent = (b >> 4) & 0x07
+    magnitude = ((((b & 0x0F) << 3) + ULAW_BIAS) << exponent) - ULAW_BIAS
+    return np.where(b & 0x80, -magnitude, magnitude).astype(np.int16)
+
+
+def encode_frame(pcm, codec: int) -> bytes:
+    if codec == ULAW:
+        return ulaw_encode(np.frombuffer(pcm, dtype=np.int16))
+    return bytes(pcm)
+
+
+def decode_frame(payload: bytes, codec: int) -> bytes:
+    if codec == ULAW:
+        return ulaw_decode(payload).tobytes()
+    return payload
+
+
+# -------------------------------
+# Sender (satellite side)
+# -------------------------------
+class UdpAudioSender:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        codec: int = PCM16,
+        frame_samples: int = FRAME_SAMPLES,
+    ):
+        self.address = (host, port)
+        self.codec = codec
+        self.frame_samples = frame_samples
+        self.seq = 0
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._pending = b""
+
+    def packet(self, frame, flags: int = 0) -> bytes:
+        data = HEADER.pack(MAGIC, self.seq, time.time(), self.codec, flags) + encode_frame(frame, self.codec)
+        self.seq += 1
+        return data
+
+    def packets(self, pcm) -> List[bytes]:
+        """
+        Whole frames from pcm (the remainder waits for the next call).
+        """
+        data = self._pending + bytes(pcm)
+        step = self.frame_samples * SAMPLE_WIDTH
+        whole = len(data) // step * step
+        self._pending = data[whole:]
+        return [self.packet(data[i:i + step]) for i in range(0, whole, step)]
+
+    def send_packet(self, packet: bytes):
+        self._sock.sendto(packet, self.address)
+
+    def send(self, pcm) -> int:
+        packets = self.packets(pcm)
+        for packet in packets:
+            self.send_packet(packet)
+        return len(packets)
+
+    def end(self):
+        self.send_packet(self.packet(b"", flags=END))
+
+    def close(self):
+        self._sock.close()
+
+
+# -------------------------------
+# Jitter buffer
+# -------------------------------
+class JitterBuffer:
+    def __init__(
+        self,
+        frame_samples: int = FRAME_SAMPLES,
+        sample_rate: int = SAMPLE_RATE,
+        depth: int = 3,
+        max_frames: int = 50,
+    ):
+        self.frame_samples = frame_samples
+        self.frame_seconds = frame_samples / sample_rate
+        self.depth = depth
+        self.max_frames = max_frames
+
+        self._frames: Dict[int, bytes] = {}
+        self._cond = threading.Condition()
+        self._next: Optional[int] = None
+        self._highest = -1
+        self._started = False
+        self.ended = False
+
+        self.stats = {
+            "received": 0, "played": 0, "lost": 0, "late": 0,
+            "duplicates": 0, "reordered": 0, "overflow": 0, "restarts": 0,
+        }
+
+    def push(self, seq: int, frame: bytes):
+        with self._cond:
+            self.stats["received"] += 1
+            if self._next is not None and (seq + self.max_frames < self._next or (self.ended and seq < self._next)):
+                # Not a late frame: the sender restarted its counter
+                self._restart()
+            if self._next is None or (not self._started and seq < self._next):
+                # Before playout, an earlier frame may still arrive out of order
+                self._next = seq
+            if seq < self._next:
+                self.stats["late"] += 1
+                return
+            if seq in self._frames:
+                self.stats["duplicates"] += 1
+                return
+            if seq < self._highest:
+                self.stats["reordered"] += 1
+            self._highest = max(self._highest, seq)
+            self._frames[seq] = frame
+
+            if len(self._frames) > self.max_frames:
+                # Too far behind: skip ahead rather than add latency
+                oldest = min(self._frames)
+                self.stats["overflow"] += oldest - self._next + 1
+                del self._frames[oldest]
+                self._next = oldest + 1
+            self._cond.notify_all()
+
+    def end(self):
+        with self._cond:
+            self.ended = True
+            self._cond.notify_all()
+
+    def _restart(self):
+        # Caller holds the lock; the old stream's leftovers are dropped
+        self.stats["restarts"] += 1
+        self._frames.clear()
+        self._next = None
+        self._highest = -1
+        self._started = False
+        self.ended = False
+
+    def __len__(self):
+        with self._cond:
+            return len(self._frames)
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Next frame in sequence order; silence for a lost one.
+        None → nothing to play (stream ended, or timeout while idle).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            gap_deadline = None
+            while True:
+                if not self._started:
+                    # Also after a restart: the new stream buffers up first
+                    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                    if not self._cond.wait_for(lambda: len(self._frames) >= self.depth or self.ended, remaining):
+                        return None
+                    self._started = True
+
+                if self._next in self._frames:
+                    self.stats["played"] += 1
+                    frame = self._frames.pop(self._next)
+                    self._next += 1
+                    return frame
+
+                if self._frames:
+                    # A gap with later frames behind it: wait briefly, then conceal
+                    if gap_deadline is None:
+                        gap_deadline = time.monotonic() + self.depth * self.frame_seconds
+                    remaining = gap_deadline - time.monotonic()
+                    if remaining <= 0 or self.ended:
+                        self.stats["lost"] += 1
+                        self._next += 1
+                        return bytes(self.frame_samples * SAMPLE_WIDTH)
+                    self._cond.wait(remaining)
+                    continue
+
+                if self.ended:
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+
+# -------------------------------
+# Receiver: a virtual input device
+# -------------------------------
+class UdpAudioSource:
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 0,
+        sample_rate: int = SAMPLE_RATE,
+        frame_samples: int = FRAME_SAMPLES,
+        depth: int = 3,
+        max_frames: int = 50,
+        history: int = 500,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_samples = frame_samples
+        self.jitter = JitterBuffer(frame_samples, sample_rate, depth, max_frames)
+
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind((host, port))
+        self._sock.settimeout(0.2)
+        self.address = self._sock.getsockname()
+
+        self._pending = b""
+        self._running = threading.Event()
+        self._running.set()
+
+        # One-way transit and RFC 3550 interarrival jitter
+        self._transit = deque(maxlen=history)
+        self._last_transit: Optional[float] = None
+        self.interarrival_jitter = 0.0
+        self.stats = {"packets": 0, "bad_packets": 0, "bytes": 0}
+
+        self._thread = threading.Thread(target=self._receive, name="udp-audio", daemon=True)
+        self._thread.start()
+        logger.info("Satellite audio endpoint on udp://{}:{}", *self.address)
+
+    @property
+    def port(self) -> int:
+        return self.address[1]
+
+    def _receive(self):
+        while self._running.is_set():
+            try:
+                data, _ = self._sock.recvfrom(MAX_DATAGRAM)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            arrived = time.time()
+
+            if len(data) < HEADER.size:
+                self.stats["bad_packets"] += 1
+                continue
+            magic, seq, sent, codec, flags = HEADER.unpack_from(data)
+            if magic != MAGIC or codec not in (PCM16, ULAW):
+                self.stats["bad_packets"] += 1
+                continue
+
+            self.stats["packets"] += 1
+            self.stats["bytes"] += len(data)
+            if flags & END:
+                self.jitter.end()
+                continue
+
+            transit = arrived - sent
+            self._transit.append(transit)
+            if self._last_transit is not None:
+                self.interarrival_jitter += (abs(transit - self._last_transit) - self.interarrival_jitter) / 16
+            self._last_transit = transit
+
+            self.jitter.push(seq, decode_frame(data[HEADER.size:], codec))
+
+    def read(self, num_samples: int) -> bytes:
+        """
+        Blocks like a device; b"" only once the satellite sent END.
+        """
+        need = num_samples * SAMPLE_WIDTH
+        while len(self._pending) < need:
+            frame = self.jitter.pop(timeout=0.5)
+            if frame is None:
+                if self.jitter.ended or not self._running.is_set():
+                    break
+                continue
+            self._pending += frame
+
+        data, self._pending = self._pending[:need], self._pending[need:]
+        return data
+
+    def close(self):
+        self._running.clear()
+        self.jitter.end()
+        self._sock.close()
+        self._thread.join(1.0)
+
+    def report(self) -> Dict[str, object]:
+        stats = self.jitter.stats
+        transit = np.array(self._transit, dtype=float) * 1000
+        expected = stats["played"] + stats["lost"]
+        return {
+            **self.stats,
+            **stats,
+            "loss_rate": round(stats["lost"] / expected, 4) if expected else 0.0,
+            "buffered_frames": len(self.jitter),
+            "transit_ms_p50": round(float(np.percentile(transit, 50)), 2) if len(transit) else None,
+            "transit_ms_p95": round(float(np.percentile(transit, 95)), 2) if len(transit) else None,
+            "jitter_ms": round(self.interarrival_jitter * 1000, 2),
+        }
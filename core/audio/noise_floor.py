@@ -0,0 +1,146 @@
+"""
+Noise-Floor Estimator
+Day 23.6 — Continuous ambient calibration, zero latency per turn
+
+Instead of adjust_for_ambient_noise() (a blocking second of listening),
+frame energies from the capture stream go into a rolling window and a
+low percentile of that window is taken as the noise floor:
+speech is loud but intermittent, so it barely moves the 20th percentile.
+
+Published values are plain float attributes, replaced in one store:
+    noise_floor_db     read by VoiceActivityDetector on every call
+    energy_threshold   RMS units for speech_recognition.Recognizer
+Readers never take a lock.
+
+Feeds:
+- attach(recorder)  background thread on its own ring reader
+- tap(stream)       pass-through wrapper around any read(n) stream
+- observe(samples)  direct
+"""
+
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.recorder import FRAME_MS, FRAME_SAMPLES, SAMPLE_RATE
+from core.audio.vad import frame_energy_db
+
+
+class NoiseFloorEstimator:
+    def __init__(
+        self,
+        window_seconds: float = 10.0,
+        percentile: float = 20.0,
+        update_every: int = 10,             # frames
+        speech_margin_db: float = 12.0,
+        initial_floor_db: float = -60.0,
+        min_floor_db: float = -90.0,
+    ):
+        self.percentile = percentile
+        self.update_every = update_every
+        self.speech_margin_db = speech_margin_db
+        self.min_floor_db = min_floor_db
+
+        self._window = np.full(int(window_seconds * 1000 / FRAME_MS), np.nan, dtype=np.float32)
+        self._index = 0
+        self._pending = 0
+        self._lock = threading.Lock()       # writers only
+
+        self.noise_floor_db = initial_floor_db
+        self.energy_threshold = self._rms_threshold(initial_floor_db)
+        self.updates = 0
+
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+
+    def _rms_threshold(self, floor_db: float) -> float:
+        return 32768.0 * 10 ** ((floor_db + self.speech_margin_db) / 20.0)
+
+    # -------------------------------
+    # Feeding
+    # -------------------------------
+    def observe(self, samples) -> float:
+        samples = np.frombuffer(samples, dtype=np.int16) if not isinstance(samples, np.ndarray) else samples
+        energies = frame_energy_db(samples, FRAME_SAMPLES)
+        if not len(energies):
+            return self.noise_floor_db
+
+        with self._lock:
+            size = len(self._window)
+            energies = energies[-size:]
+            idx = (self._index + np.arange(len(energies))) % size
+            self._window[idx] = energies
+            self._index = (self._index + len(energies)) % size
+            self._pending += len(energies)
+
+            if self._pending >= self.update_every:
+                self._pending = 0
+                self._publish()
+
+        return self.noise_floor_db
+
+    def _publish(self):
+        floor = float(np.nanpercentile(self._window, self.percentile))
+        floor = max(self.min_floor_db, floor)
+        # Single attribute stores — readers see old or new, never torn
+        self.energy_threshold = self._rms_threshold(floor)
+        self.noise_floor_db = floor
+        self.updates += 1
+
+    def tap(self, stream) -> "_TappedStream":
+        return _TappedStream(stream, self)
+
+    # -------------------------------
+    # Background thread
+    # -------------------------------
+    def attach(self, recorder):
+        self._reader = recorder.reader("noise-floor")
+        self._recorder = recorder
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="noise-floor", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        batch = FRAME_SAMPLES * self.update_every
+        while self._running.is_set():
+            view = self._reader.read_exact(batch, timeout=0.5)
+            if view is None:
+                if not self._recorder.eof:
+                    if not self._recorder.is_running():
+                        time.sleep(0.05)    # capture not started yet
+                    continue
+                # End of stream: use what is left, then stop
+                view = self._reader.read()
+                if not len(view):
+                    break
+            try:
+                self.observe(np.frombuffer(view, dtype=np.int16))
+            except Exception as e:
+                logger.error("Noise-floor update failed: {}", e)
+
+    def stop(self, timeout: float = 1.0):
+        self._running.clear()
+        if self._thread:
+            self._thread.join(timeout)
+
+
+class _TappedStream:
+    """
+    read(n) passthrough that feeds every chunk to the estimator.
+    """
+
+    def __init__(self, stream, estimator: NoiseFloorEstimator):
+        self.stream = stream
+        self.estimator = estimator
+        self.sample_rate = getattr(stream, "sample_rate", SAMPLE_RATE)
+
+    def read(self, num_samples: int) -> bytes:
+        data = self.stream.read(num_samples)
+        self.estimator.observe(data)
+        return data
+
+    def close(self):
+        self.stream.close()
@@ -0,0 +1,274 @@
+"""
+Ring-Buffer Recorder
+Day 23.1 — Continuous capture into a preallocated PCM ring
+
+One capture thread reads fixed-size frames from a source
+(microphone stream, WAV file, network, ...) and writes them into
+a preallocated int16 NumPy ring. Consumers (wake word, VAD, ASR,
+barge-in) each own a RingReader and get zero-copy memoryview slices.
+
+Mirrored layout:
+    every sample is written twice, at i and i + capacity,
+    so ANY window up to `capacity` samples is one contiguous slice.
+
+Positions are absolute sample counts (never wrap), which makes
+lag and overrun detection simple:
+    lag      = write_position - reader.cursor
+    overrun  = lag > capacity  (the producer lapped the reader)
+
+A source is anything with:
+    read(num_samples) -> bytes   (b"" = end of stream)
+    sample_rate: int
+    close()
+"""
+
+import threading
+import time
+import wave
+from typing import Dict, Optional
+
+import numpy as np
+from loguru import logger
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2            # int16
+FRAME_MS = 30
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+
+
+class WavFileSource:
+    """
+    Frame source backed by a mono 16-bit WAV file.
+    realtime=True paces reads like a live device.
+    """
+
+    def __init__(self, path: str, realtime: bool = False, loop: bool = False):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+
+        self._wav = wave.open(path, "rb")
+        if self._wav.getnchannels() != 1 or self._wav.getsampwidth() != SAMPLE_WIDTH:
+            self._wav.close()
+            raise ValueError(f"{path}: expected mono 16-bit PCM")
+
+        self.sample_rate = self._wav.getframerate()
+        self._next_deadline = None
+
+    def read(self, num_samples: int) -> bytes:
+        data = self._wav.readframes(num_samples)
+        if not data and self.loop:
+            self._wav.rewind()
+            data = self._wav.readframes(num_samples)
+
+        if self.realtime and data:
+            self._pace(len(data) // SAMPLE_WIDTH)
+        return data
+
+    def _pace(self, samples: int):
+        now = time.monotonic()
+        if self._next_deadline is None:
+            self._next_deadline = now
+        self._next_deadline += samples / self.sample_rate
+        delay = self._next_deadline - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def close(self):
+        self._wav.close()
+
+
+class RingBufferRecorder:
+    def __init__(
+        self,
+        source,
+        capacity_seconds: float = 10.0,
+        frame_samples: int = FRAME_SAMPLES,
+    ):
+        self.source = source
+        self.sample_rate = getattr(source, "sample_rate", SAMPLE_RATE)
+        self.frame_samples = frame_samples
+
+        self.capacity = int(capacity_seconds * self.sample_rate)
+        self._buf = np.zeros(2 * self.capacity, dtype=np.int16)
+        self._write_pos = 0
+
+        self._cond = threading.Condition()
+        self._readers: Dict[str, "RingReader"] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        self.eof = False
+
+        self.stats = {"frames": 0, "source_errors": 0}
+
+    # -------------------------------
+    # Producer
+    # -------------------------------
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="audio-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        self._running.clear()
+        if self._thread:
+            self._thread.join(timeout)
+        with self._cond:
+            self._cond.notify_all()
+
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def _run(self):
+        while self._running.is_set():
+            try:
+                data = self.source.read(self.frame_samples)
+            except Exception as e:
+                self.stats["source_errors"] += 1
+                logger.error("Audio source read failed: {}", e)
+                time.sleep(0.05)
+                continue
+
+            if not data:
+                self.eof = True
+                break
+
+            self.write(data)
+
+        self._running.clear()
+        with self._cond:
+            self._cond.notify_all()
+
+    def write(self, pcm) -> int:
+        """
+        Append PCM (bytes / memoryview / int16 array) to the ring.
+        Also usable directly, without a capture thread.
+        """
+        samples = np.frombuffer(pcm, dtype=np.int16) if not isinstance(pcm, np.ndarray) else pcm
+        n = len(samples)
+        if n == 0:
+            return 0
+        if n > self.capacity:
+            samples = samples[-self.capacity:]
+            n = self.capacity
+
+        cap = self.capacity
+        pos = self._write_pos % cap
+        first = min(n, cap - pos)
+
+        self._buf[pos:pos + first] = samples[:first]
+        self._buf[pos + cap:pos + cap + first] = samples[:first]
+        rest = n - first
+        if rest:
+            self._buf[0:rest] = samples[first:]
+            self._buf[cap:cap + rest] = samples[first:]
+
+        with self._cond:
+            # Publish only after the samples are in place
+            self._write_pos += n
+            self.stats["frames"] += 1
+            self._cond.notify_all()
+        return n
+
+    # -------------------------------
+    # Consumers
+    # -------------------------------
+    @property
+    def write_position(self) -> int:
+        return self._write_pos
+
+    def reader(self, name: str, from_start: bool = False) -> "RingReader":
+        """
+        Register a consumer. By default it starts at "now".
+        """
+        start = max(0, self._write_pos - self.capacity) if from_start else self._write_pos
+        reader = RingReader(self, name, start)
+        self._readers[name] = reader
+        return reader
+
+    def remove_reader(self, name: str):
+        self._readers.pop(name, None)
+
+    def view(self, start: int, num_samples: int) -> memoryview:
+        """
+        Zero-copy view of [start, start + num_samples) (absolute positions).
+        Caller guarantees the range is still inside the ring.
+        """
+        offset = start % self.capacity
+        return memoryview(self._buf[offset:offset + num_samples])
+
+    def wait_for(self, position: int, timeout: Optional[float]) -> bool:
+        """
+        Block until write_position >= position (or capture stops).
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._write_pos >= position or not self._running.is_set(),
+                timeout,
+            ) and self._write_pos >= position
+
+    def report(self) -> Dict[str, object]:
+        return {
+            "written_samples": self._write_pos,
+            "frames": self.stats["frames"],
+            "source_errors": self.stats["source_errors"],
+            "readers": {
+                name: {"lag": r.lag, "overruns": r.overruns, "dropped_samples": r.dropped_samples}
+                for name, r in self._readers.items()
+            },
+        }
+
+
+class RingReader:
+    """
+    One consumer's cursor into the ring.
+    Returned views stay valid until the producer laps them
+    (capacity seconds later) — consume before then.
+    """
+
+    def __init__(self, recorder: RingBufferRecorder, name: str, start: int):
+        self.recorder = recorder
+        self.name = name
+        self.cursor = start
+        self.overruns = 0
+        self.dropped_samples = 0
+
+    @property
+    def lag(self) -> int:
+        return self.recorder.write_position - self.cursor
+
+    def _check_overrun(self):
+        oldest = self.recorder.write_position - self.recorder.capacity
+        if self.cursor < oldest:
+            self.overruns += 1
+            self.dropped_samples += oldest - self.cursor
+            self.cursor = oldest
+
+    def read(self, max_samples: Optional[int] = None) -> memoryview:
+        """
+        Everything new since the last read (non-blocking).
+        """
+        self._check_overrun()
+        available = self.recorder.write_position - self.cursor
+        if max_samples is not None:
+            available = min(available, max_samples)
+
+        view = self.recorder.view(self.cursor, available)
+        self.cursor += available
+        return view
+
+    def read_exact(self, num_samples: int, timeout: Optional[float] = None) -> Optional[memoryview]:
+        """
+        Block until num_samples are available; None on timeout / end of stream.
+        """
+        if not self.recorder.wait_for(self.cursor + num_samples, timeout):
+            return None
+        self._check_overrun()
+        view = self.recorder.view(self.cursor, num_samples)
+        self.cursor += num_samples
+        return view
+
+    def skip_to_now(self):
+        self.cursor = self.recorder.write_position
@@ -0,0 +1,181 @@
+"""
+Shared-Memory Ring
+Day 25.1 — The capture ring, visible to another process
+
+SharedRingRecorder is a RingBufferRecorder whose mirrored int16 buffer
+lives in a multiprocessing.shared_memory block. The capture thread and
+in-process readers (wake word, barge-in, noise floor) work unchanged.
+
+Another process attaches by name with SharedRing.attach(name) and gets
+the same consumer surface (reader / view / wait_for / write_position /
+is_running), so capture_utterance() runs there as-is.
+
+The noise floor is estimated in the capturing process; once published
+(publish_noise_floor) it is copied into the header with every write, and
+the attached ring exposes it as .noise_floor_db / .energy_threshold —
+the attribute surface VoiceActivityDetector and the engines read.
+
+Block layout:
+    header  int64[7]   write_position, running, sample_rate, capacity,
+                       noise_published, noise_floor (milli-dB), energy_threshold
+    buffer  int16[2 × capacity]   (mirrored, see recorder.py)
+
+The header's write_position is stored only after the samples are in
+place (one aligned 8-byte store), so a reader never sees a position
+ahead of its data. Cross-process waits poll it every few ms.
+"""
+
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from core.audio.recorder import FRAME_SAMPLES, RingBufferRecorder, RingReader
+
+HEADER_SLOTS = 7
+HEADER_BYTES = HEADER_SLOTS * 8
+WRITE_POS, RUNNING, RATE, CAPACITY, NOISE_PUBLISHED, NOISE_FLOOR_MDB, ENERGY_THRESHOLD = range(HEADER_SLOTS)
+
+POLL_SECONDS = 0.003
+
+
+def _layout(shm: shared_memory.SharedMemory, capacity: int):
+    # frombuffer holds a real export on the mapping: while any view
+    # (clip, reader slice) is alive, close() raises instead of unmapping
+    header = np.frombuffer(shm.buf, dtype=np.int64, count=HEADER_SLOTS)
+    buf = np.frombuffer(shm.buf, dtype=np.int16, count=2 * capacity, offset=HEADER_BYTES)
+    return header, buf
+
+
+class SharedRingRecorder(RingBufferRecorder):
+    def __init__(
+        self,
+        source,
+        capacity_seconds: float = 10.0,
+        frame_samples: int = FRAME_SAMPLES,
+        name: Optional[str] = None,
+    ):
+        super().__init__(source, capacity_seconds, frame_samples)
+
+        size = HEADER_BYTES + 2 * self.capacity * 2
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._header, self._buf = _layout(self._shm, self.capacity)
+        self._buf[:] = 0
+        self._header[:] = (0, 0, self.sample_rate, self.capacity, 0, 0, 0)
+        self._noise_floor = None
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def start(self):
+        self._header[RUNNING] = 1
+        super().start()
+
+    def _run(self):
+        try:
+            super()._run()
+        finally:
+            self._header[RUNNING] = 0
+
+    def stop(self, timeout: float = 1.0):
+        super().stop(timeout)
+        self._header[RUNNING] = 0
+
+    def publish_noise_floor(self, estimator):
+        """
+        Mirror estimator.noise_floor_db / .energy_threshold into the header.
+        """
+        self._noise_floor = estimator
+        self._store_noise_floor()
+        self._header[NOISE_PUBLISHED] = 1
+
+    def _store_noise_floor(self):
+        self._header[NOISE_FLOOR_MDB] = int(round(self._noise_floor.noise_floor_db * 1000))
+        self._header[ENERGY_THRESHOLD] = int(round(self._noise_floor.energy_threshold))
+
+    def write(self, pcm) -> int:
+        n = super().write(pcm)
+        if n:
+            self._header[WRITE_POS] = self._write_pos
+            if self._noise_floor is not None:
+                self._store_noise_floor()
+        return n
+
+    def close(self):
+        self.stop()
+        # Drop our own views before releasing the mapping
+        self._header = self._buf = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass    # a clip still views the ring; unmapped once it is gone
+        self._shm.unlink()
+
+
+class SharedRing:
+    """
+    Read-only consumer side of a SharedRingRecorder, in another process.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+        header = np.frombuffer(shm.buf, dtype=np.int64, count=HEADER_SLOTS)
+        self.sample_rate = int(header[RATE])
+        self.capacity = int(header[CAPACITY])
+        self._header, self._buf = _layout(shm, self.capacity)
+        self._readers = {}
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRing":
+        # Child processes share the creator's resource tracker, which
+        # already holds this name; the creator alone unlinks it
+        return cls(shared_memory.SharedMemory(name=name, create=False))
+
+    @property
+    def write_position(self) -> int:
+        return int(self._header[WRITE_POS])
+
+    def is_running(self) -> bool:
+        return bool(self._header[RUNNING])
+
+    @property
+    def publishes_noise_floor(self) -> bool:
+        return bool(self._header[NOISE_PUBLISHED])
+
+    @property
+    def noise_floor_db(self) -> float:
+        return int(self._header[NOISE_FLOOR_MDB]) / 1000.0
+
+    @property
+    def energy_threshold(self) -> float:
+        return float(self._header[ENERGY_THRESHOLD])
+
+    def reader(self, name: str, from_start: bool = False) -> RingReader:
+        pos = self.write_position
+        reader = RingReader(self, name, max(0, pos - self.capacity) if from_start else pos)
+        self._readers[name] = reader
+        return reader
+
+    def view(self, start: int, num_samples: int) -> memoryview:
+        offset = start % self.capacity
+        return memoryview(self._buf[offset:offset + num_samples])
+
+    def wait_for(self, position: int, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.write_position < position:
+            if not self.is_running():
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(POLL_SECONDS)
+        return True
+
+    def close(self):
+        self._readers.clear()
+        self._header = self._buf = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass
@@ -0,0 +1,262 @@
+"""
+Audio Spool
+Day 24.2 — Keep captured utterances for replay and benchmarking
+
+One growing WAV file (mono 16-bit) plus a JSONL index beside it:
+    session.wav            valid WAV at all times (header patched per append)
+    session.wav.idx.jsonl  {"turn_id", "offset", "samples", "started_at",
+                            "ended_at", "transcript", ...} per utterance
+
+Writes go through a fixed-size mmap window that slides forward
+(file grows in grow_bytes steps, trimmed on close). Finished windows
+are flushed and dropped, so resident memory stays at about one window
+no matter how long the session runs. Reads map the file read-only and
+return zero-copy views.
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.recorder import SAMPLE_RATE, SAMPLE_WIDTH
+
+HEADER_BYTES = 44
+MB = 1024 * 1024
+
+
+def _wav_header(sample_rate: int, data_bytes: int) -> bytes:
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_bytes, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * SAMPLE_WIDTH, SAMPLE_WIDTH, 16,
+        b"data", data_bytes,
+    )
+
+
+class AudioSpool:
+    def __init__(
+        self,
+        path: str,
+        sample_rate: int = SAMPLE_RATE,
+        window_bytes: int = 4 * MB,
+        grow_bytes: int = 16 * MB,
+    ):
+        self.path = path
+        self.index_path = path + ".idx.jsonl"
+        self.sample_rate = sample_rate
+
+        granularity = mmap.ALLOCATIONGRANULARITY
+        self.window_bytes = max(granularity, window_bytes // granularity * granularity)
+        self.grow_bytes = max(self.window_bytes, grow_bytes)
+
+        self._entries: List[Dict[str, object]] = []
+        self._window: Optional[mmap.mmap] = None
+        self._window_start = 0
+        self._reader: Optional[mmap.mmap] = None
+        self._reader_size = 0
+
+        exists = os.path.exists(path) and os.path.getsize(path) >= HEADER_BYTES
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            self._data_bytes = self._read_header()
+            self._load_index()
+        else:
+            self._data_bytes = 0
+            self._file.write(_wav_header(sample_rate, 0))
+            self._file.flush()
+
+        self._capacity = os.path.getsize(path)
+
+    # -------------------------------
+    # Header / index
+    # -------------------------------
+    def _read_header(self) -> int:
+        self._file.seek(0)
+        header = self._file.read(HEADER_BYTES)
+        if header[:4] != b"RIFF" or header[8:12] != b"WAVE" or header[36:40] != b"data":
+            raise ValueError(f"{self.path}: not an audio spool")
+        self.sample_rate = struct.unpack_from("<I", header, 24)[0]
+        return struct.unpack_from("<I", header, 40)[0]
+
+    def _write_header(self):
+        self._file.seek(0)
+        self._file.write(_wav_header(self.sample_rate, self._data_bytes))
+        self._file.flush()
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    self._entries.append(json.loads(line))
+                except ValueError:
+                    logger.warning("Skipping corrupt spool index line")
+
+    # -------------------------------
+    # Writing
+    # -------------------------------
+    def _ensure_capacity(self, end: int):
+        if end <= self._capacity:
+            return
+        self._capacity = (end // self.grow_bytes + 1) * self.grow_bytes
+        self._file.truncate(self._capacity)
+
+    def _map_window(self, offset: int):
+        self._release_window()
+        start = offset // self.window_bytes * self.window_bytes
+        self._ensure_capacity(start + self.window_bytes)
+        self._window = mmap.mmap(self._file.fileno(), self.window_bytes, offset=start)
+        self._window_start = start
+
+    def _release_window(self):
+        if self._window is None:
+            return
+        self._window.flush()
+        if hasattr(mmap, "MADV_DONTNEED"):
+            self._window.madvise(mmap.MADV_DONTNEED)
+        self._window.close()
+        self._window = None
+
+    def _write(self, offset: int, data: memoryview):
+        pos = 0
+        while pos < len(data):
+            at = offset + pos
+            if self._window is None or not (self._window_start <= at < self._window_start + self.window_bytes):
+                self._map_window(at)
+            local = at - self._window_start
+            n = min(len(data) - pos, self.window_bytes - local)
+            self._window[local:local + n] = data[pos:pos + n]
+            pos += n
+
+    def append(
+        self,
+        pcm,
+        transcript: str = "",
+        turn_id: Optional[int] = None,
+        started_at: Optional[float] = None,
+        ended_at: Optional[float] = None,
+        **meta,
+    ) -> Dict[str, object]:
+        data = memoryview(pcm).cast("B")
+        offset = HEADER_BYTES + self._data_bytes
+
+        self._write(offset, data)
+        if self._window is not None:
+            self._window.flush()
+        self._data_bytes += len(data)
+        self._write_header()
+
+        now = time.time()
+        entry = {
+            "turn_id": turn_id if turn_id is not None else len(self._entries) + 1,
+            "offset": (offset - HEADER_BYTES) // SAMPLE_WIDTH,
+            "samples": len(data) // SAMPLE_WIDTH,
+            "started_at": started_at if started_at is not None else now,
+            "ended_at": ended_at if ended_at is not None else now,
+            "transcript": transcript,
+        }
+        entry.update(meta)
+        self._entries.append(entry)
+
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return entry
+
+    # -------------------------------
+    # Reading
+    # -------------------------------
+    def entries(self) -> List[Dict[str, object]]:
+        return list(self._entries)
+
+    def read(self, entry: Dict[str, object]) -> memoryview:
+        """
+        Zero-copy int16 view of one utterance.
+        """
+        end = HEADER_BYTES + self._data_bytes
+        if self._reader is None or self._reader_size < end:
+            # Older maps stay alive while views into them exist
+            self._reader = mmap.mmap(self._file.fileno(), end, access=mmap.ACCESS_READ)
+            self._reader_size = end
+
+        start = HEADER_BYTES + int(entry["offset"]) * SAMPLE_WIDTH
+        stop = start + int(entry["samples"]) * SAMPLE_WIDTH
+        return memoryview(self._reader)[start:stop].cast("h")
+
+    def __iter__(self) -> Iterator[Dict[str, object]]:
+        return iter(self.entries())
+
+    @property
+    def duration(self) -> float:
+        return self._data_bytes / SAMPLE_WIDTH / self.sample_rate
+
+    def close(self):
+        self._release_window()
+        self._reader = None
+        # Trim preallocation so the WAV ends exactly at its data
+        self._file.truncate(HEADER_BYTES + self._data_bytes)
+        self._write_header()
+        self._file.close()
+
+
+class SpoolSource:
+    """
+    Frame source replaying spooled utterances, separated by silence.
+    Feeds RingBufferRecorder like a microphone; realtime=False runs
+    at maximum speed.
+    """
+
+    def __init__(self, spool: AudioSpool, entries=None, gap_seconds: float = 0.8, realtime: bool = False):
+        self.spool = spool
+        self.sample_rate = spool.sample_rate
+        self.realtime = realtime
+
+        gap = np.zeros(int(gap_seconds * self.sample_rate), dtype=np.int16)
+        self._chunks = []
+        for entry in (entries if entries is not None else spool.entries()):
+            self._chunks.append(gap)
+            self._chunks.append(entry)
+        self._chunks.append(gap)
+
+        self._current = None
+        self._pos = 0
+        self._next_deadline = None
+
+    def _next_chunk(self):
+        if not self._chunks:
+            return None
+        item = self._chunks.pop(0)
+        return item if isinstance(item, np.ndarray) else np.frombuffer(self.spool.read(item), dtype=np.int16)
+
+    def read(self, num_samples: int) -> bytes:
+        out = []
+        needed = num_samples
+        while needed:
+            if self._current is None or self._pos >= len(self._current):
+                self._current = self._next_chunk()
+                self._pos = 0
+                if self._current is None:
+                    break
+            part = self._current[self._pos:self._pos + needed]
+            self._pos += len(part)
+            needed -= len(part)
+            out.append(part.tobytes())
+
+        data = b"".join(out)
+        if self.realtime and data:
+            now = time.monotonic()
+            if self._next_deadline is None:
+                self._next_deadline = now
+            self._next_deadline += len(data) / SAMPLE_WIDTH / self.sample_rate
+            if self._next_deadline > now:
+                time.sleep(self._next_deadline - now)
+        return data
+
+    def close(self):
+        pass
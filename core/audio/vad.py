@@ -0,0 +1,238 @@
+"""
+Voice Activity Detection + Adaptive Endpointing
+Day 23.2 — Close the utterance as soon as speech has plausibly ended
+
+VAD (vectorized over whole buffers, one row per frame):
+- energy (dBFS)           → loud enough above the noise floor
+- zero-crossing rate      → together with flatness, rejects broadband noise
+- spectral flatness       → tonal (speech) vs flat (hiss / fan)
+
+Endpointer:
+- onset:  a few consecutive speech frames
+- offset: trailing silence longer than an ADAPTIVE hangover
+          hangover = clamp(pause_factor × longest pause inside this utterance)
+  Short commands with no internal pauses close after min_hangover,
+  instead of speech_recognition's fixed 0.8 s pause_threshold.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from core.audio.clip import AudioClip
+from core.audio.recorder import FRAME_MS, FRAME_SAMPLES, RingReader
+
+EPS = 1e-10
+FULL_SCALE = 32768.0
+
+WAITING, SPEECH, ENDED, TIMEOUT = "waiting", "speech", "ended", "timeout"
+
+
+def frame_energy_db(samples: np.ndarray, frame_samples: int = FRAME_SAMPLES) -> np.ndarray:
+    """
+    Per-frame energy in dBFS (cheap path for noise tracking).
+    """
+    samples = np.asarray(samples)
+    n = len(samples) // frame_samples
+    frames = samples[: n * frame_samples].reshape(n, frame_samples).astype(np.float32) / FULL_SCALE
+    return 10.0 * np.log10(np.mean(frames * frames, axis=1) + EPS)
+
+
+def frame_features(samples: np.ndarray, frame_samples: int = FRAME_SAMPLES) -> Dict[str, np.ndarray]:
+    """
+    Per-frame features for a whole buffer at once.
+    Trailing partial frame is ignored.
+    """
+    samples = np.asarray(samples)
+    n = len(samples) // frame_samples
+    if n == 0:
+        empty = np.zeros(0, dtype=np.float32)
+        return {"energy_db": empty, "zcr": empty, "flatness": empty}
+
+    frames = samples[: n * frame_samples].reshape(n, frame_samples).astype(np.float32) / FULL_SCALE
+
+    energy_db = 10.0 * np.log10(np.mean(frames * frames, axis=1) + EPS)
+
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(frame_samples), axis=1)) ** 2 + EPS
+    flatness = np.exp(np.mean(np.log(spectrum), axis=1)) / np.mean(spectrum, axis=1)
+
+    return {"energy_db": energy_db, "zcr": zcr, "flatness": flatness}
+
+
+class VoiceActivityDetector:
+    DEFAULT_NOISE_FLOOR_DB = -60.0
+
+    def __init__(
+        self,
+        energy_margin_db: float = 12.0,
+        min_energy_db: float = -50.0,
+        max_flatness: float = 0.5,
+        noise_zcr: float = 0.3,
+        noise_floor=None,
+        frame_samples: int = FRAME_SAMPLES,
+    ):
+        self.energy_margin_db = energy_margin_db
+        self.min_energy_db = min_energy_db
+        self.max_flatness = max_flatness
+        self.noise_zcr = noise_zcr
+        self.frame_samples = frame_samples
+
+        # Anything exposing .noise_floor_db (read lock-free on every call)
+        self.noise_floor = noise_floor
+
+    def threshold_db(self) -> float:
+        floor = self.DEFAULT_NOISE_FLOOR_DB
+        if self.noise_floor is not None:
+            floor = self.noise_floor.noise_floor_db
+        return max(self.min_energy_db, floor + self.energy_margin_db)
+
+    def classify(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Boolean speech flag per frame.
+        """
+        f = frame_features(samples, self.frame_samples)
+        loud = f["energy_db"] > self.threshold_db()
+        broadband = (f["flatness"] > self.max_flatness) & (f["zcr"] > self.noise_zcr)
+        return loud & ~broadband
+
+
+class AdaptiveEndpointer:
+    def __init__(
+        self,
+        frame_ms: int = FRAME_MS,
+        onset_ms: int = 90,
+        min_hangover_ms: int = 240,
+        max_hangover_ms: int = 720,
+        pause_factor: float = 1.5,
+        max_utterance_s: float = 15.0,
+        start_timeout_s: Optional[float] = None,
+    ):
+        self.frame_ms = frame_ms
+        self.onset_frames = max(1, onset_ms // frame_ms)
+        self.min_hangover_ms = min_hangover_ms
+        self.max_hangover_ms = max_hangover_ms
+        self.pause_factor = pause_factor
+        self.max_frames = int(max_utterance_s * 1000 / frame_ms)
+        self.start_timeout_frames = (
+            int(start_timeout_s * 1000 / frame_ms) if start_timeout_s else None
+        )
+        self.reset()
+
+    def reset(self):
+        self.state = WAITING
+        self.frame_index = 0
+        self.speech_start: Optional[int] = None   # frame index
+        self.speech_end: Optional[int] = None     # last speech frame + 1
+        self._run = 0
+        self._silence = 0
+        self._longest_pause = 0
+
+    def hangover_frames(self) -> int:
+        pause_ms = self._longest_pause * self.frame_ms * self.pause_factor
+        hangover_ms = min(self.max_hangover_ms, max(self.min_hangover_ms, pause_ms))
+        return int(round(hangover_ms / self.frame_ms))
+
+    def feed(self, flags: np.ndarray) -> str:
+        for is_speech in flags:
+            if self.state in (ENDED, TIMEOUT):
+                break
+            self._step(bool(is_speech))
+            self.frame_index += 1
+        return self.state
+
+    def _step(self, is_speech: bool):
+        if self.state == WAITING:
+            self._run = self._run + 1 if is_speech else 0
+            if self._run >= self.onset_frames:
+                self.state = SPEECH
+                self.speech_start = self.frame_index - self._run + 1
+                self.speech_end = self.frame_index + 1
+            elif self.start_timeout_frames and self.frame_index >= self.start_timeout_frames:
+                self.state = TIMEOUT
+            return
+
+        # SPEECH
+        if is_speech:
+            if self._silence:
+                # Speech resumed → that silence was an internal pause
+                self._longest_pause = max(self._longest_pause, self._silence)
+            self._silence = 0
+            self.speech_end = self.frame_index + 1
+        else:
+            self._silence += 1
+            if self._silence >= self.hangover_frames():
+                self.state = ENDED
+                return
+
+        if self.frame_index - self.speech_start >= self.max_frames:
+            self.state = ENDED
+
+
+def capture_utterance(
+    reader: RingReader,
+    vad: VoiceActivityDetector,
+    endpointer: AdaptiveEndpointer,
+    timeout: Optional[float] = None,
+    pre_roll_ms: int = 300,
+    catch_up: bool = True,
+) -> Optional[AudioClip]:
+    """
+    Read frames from the ring until the endpointer closes an utterance.
+    Returns a clip viewing the ring (zero-copy), or None if no speech.
+    catch_up=False keeps the reader's cursor (replay / offline use).
+
+    The utterance is capped so it always fits in the ring; a clip longer
+    than half the ring is copied out, since recording would overwrite it
+    while it is still being recognized. timeout applies to this call only.
+    """
+    recorder = reader.recorder
+    frame = vad.frame_samples
+    rate = recorder.sample_rate
+
+    # Start slightly in the past so the first syllable is not clipped
+    pre_roll = min(int(pre_roll_ms * rate / 1000), recorder.capacity // 2)
+
+    saved = endpointer.start_timeout_frames, endpointer.max_frames
+    endpointer.reset()
+    if timeout:
+        endpointer.start_timeout_frames = int(timeout * rate / frame)
+    endpointer.max_frames = min(endpointer.max_frames, (recorder.capacity - pre_roll) // frame)
+
+    try:
+        if catch_up:
+            reader.cursor = max(reader.cursor, recorder.write_position - pre_roll)
+        origin = reader.cursor
+
+        state = WAITING
+        while state not in (ENDED, TIMEOUT):
+            view = reader.read_exact(frame, timeout=1.0)
+            if view is None:
+                if recorder.is_running():
+                    continue
+                break   # end of stream
+            state = endpointer.feed(vad.classify(np.frombuffer(view, dtype=np.int16)))
+    finally:
+        endpointer.start_timeout_frames, endpointer.max_frames = saved
+
+    if endpointer.speech_start is None:
+        return None
+
+    start = max(origin + endpointer.speech_start * frame - pre_roll, origin)
+    start = max(start, recorder.write_position - recorder.capacity)
+    speech_end = origin + endpointer.speech_end * frame
+    end = origin + endpointer.frame_index * frame
+
+    pcm = recorder.view(start, end - start)
+    if end - start > recorder.capacity // 2:
+        pcm = pcm.tobytes()
+
+    return AudioClip(
+        pcm=pcm,
+        sample_rate=rate,
+        start=start,
+        speech_end=speech_end,
+        end=end,
+    )
@@ -4,3 +4,59 @@ INPUT_MODE = "voice"
 # options: "voice", "text"
 
 PUSH_TO_TALK = True
+
+AUDIO_CAPTURE = "legacy"
+# options: "legacy" (speech_recognition listen), "stream" (ring recorder + adaptive endpointing)
+
+ASR_WORKER = False
+# with AUDIO_CAPTURE = "stream": VAD + recognition run in a separate process,
+# fed through a shared-memory ring; the main process keeps NLP + actions
+
+AUDIO_SPOOL_PATH = ""
+# opt-in: append every captured utterance (+ transcript) to this WAV spool
+
+MIC_DEVICE_NAME = ""
+# substring of the input device name; empty → MIC_DEVICE_INDEX, then the system default
+
+MIC_DEVICE_INDEX = 9
+
+MIC_ROOMS = {}
+# multi-room: {"kitchen": "<device name substring>", "garage": "udp:5004", ...}
+# → one session per device; "udp:<port>" receives a satellite's audio stream
+
+SPEECH_ENGINE = "google"
+# options: "google", "file" (replays WAV/transcript pairs from SPEECH_CORPUS_DIR)
+
+SPEECH_CORPUS_DIR = "speech_corpus"
+
+SPEECH_HEDGE_ENGINE = ""
+# second recognizer raced against SPEECH_ENGINE after HEDGE_DELAY seconds ("" = off)
+HEDGE_DELAY = 0.3
+HEDGE_CONFIDENCE_FLOOR = 0.5
+
+COMMAND_RECOGNIZER = ""
+# on-device recognizer for the fixed command grammar, tried before SPEECH_ENGINE:
+# saved command templates (.npz) or a vosk model directory ("" = off)
+COMMAND_CONFIDENCE_FLOOR = 0.6
+# cosine template score needed to answer on-device. In bench_local_first,
+# queries score <= 0.32 and commands mostly >= 0.6, but misheard commands and
+# near-misses ("open notepad" → "open youtube") reach 0.53-0.56: at 0.5 they
+# would run the wrong action. Re-tune with the benchmark for new templates.
+
+WAKE_WORD_TEMPLATES = ""
+# path to a saved KeywordSpotter (.npz); with AUDIO_CAPTURE = "stream",
+# "rudra" is spotted on-device and only the audio after it reaches ASR
+
+IDLE_GATE_DECIMATION = 4
+# while waiting for the wake word, only every Nth sample is energy-gated
+# until speech-like activity appears (1 = always run the full spotter)
+
+BARGE_IN_TEMPLATES = ""
+# saved KeywordSpotter (.npz) for INTERRUPT_KEYWORDS; spotted on audio while actions run
+
+TTS_BACKEND = ""
+# spoken responses: "" (print only), "tone" (test stand-in), "pyttsx3"
+
+ASYNC_ACTIONS = False
+# actions run on ActionExecutor's worker pool; the assistant goes back to
+# listening at once and answers when the action finishes (or times out)
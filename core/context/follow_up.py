@@ -16,6 +16,8 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
+from core.skills.registry import SKILLS
+
 
 class ReferenceType(Enum):
     PRONOUN = "pronoun"
@@ -26,29 +28,11 @@ class ReferenceType(Enum):
 
 
 # ------------------------------------------------------------------
-# INTENT → ALLOWED ENTITY KEYS (STRICT)
-# ------------------------------------------------------------------
-INTENT_ENTITY_WHITELIST: Dict[str, List[str]] = {
-    "open_browser": ["url", "target"],
-    "search_web": ["query", "target"],
-    "open_file_manager": ["path", "target"],
-    "list_files": ["path", "target"],
-    "open_file": ["filename", "full_path", "target"],
-    "open_terminal": ["command", "target"],
-}
-
-
-# ------------------------------------------------------------------
-# INTENT → INTENT CLASS
+# INTENT → ALLOWED ENTITY KEYS (STRICT) / INTENT → INTENT CLASS
+# Day 26.2 — declared per skill in core.skills.registry
 # ------------------------------------------------------------------
-INTENT_CLASS: Dict[str, str] = {
-    "open_browser": "system",
-    "search_web": "system",
-    "open_file_manager": "filesystem",
-    "list_files": "filesystem",
-    "open_file": "filesystem",
-    "open_terminal": "dangerous",
-}
+INTENT_ENTITY_WHITELIST: Dict[str, List[str]] = SKILLS.entity_whitelist
+INTENT_CLASS: Dict[str, str] = SKILLS.intent_class
 
 
 class FollowUpContext:
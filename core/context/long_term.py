@@ -21,3 +21,18 @@ def recent_messages(limit: int = 5) -> List[Conversation]:
             .limit(limit)
         )
         return list(session.scalars(stmt))
+
+
+def recent_intents(limit: int = 200) -> List[str]:
+    """
+    User intents, oldest first (Day 22.2 — next-intent model bootstrap).
+    """
+    with get_session() as session:
+        stmt = (
+            select(Conversation.intent)
+            .where(Conversation.role == "user")
+            .order_by(Conversation.created_at.desc())
+            .limit(limit)
+        )
+        intents = list(session.scalars(stmt))
+    return list(reversed(intents))
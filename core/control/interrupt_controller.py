@@ -1,5 +1,9 @@
+import threading
+import weakref
 from threading import Event
 
+from loguru import logger
+
 
 class InterruptController:
     """
@@ -9,11 +13,36 @@ class InterruptController:
 
     def __init__(self):
         self._interrupt_event = Event()
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback) -> None:
+        """
+        Day 26.1 — call back on every trigger (e.g. to cancel in-flight work).
+        Bound methods are held weakly: subscribing never keeps an object alive.
+        """
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
+        with self._lock:
+            self._subscribers.append(ref)
 
     def trigger(self) -> None:
         """Activate global interrupt."""
         self._interrupt_event.set()
 
+        with self._lock:
+            callbacks = [ref() for ref in self._subscribers]
+            self._subscribers = [ref for ref, cb in zip(self._subscribers, callbacks) if cb is not None]
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as e:
+                logger.error("Interrupt subscriber failed: {}", e)
+
     def clear(self) -> None:
         """Clear interrupt state after safe reset."""
         self._interrupt_event.clear()
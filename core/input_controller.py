@@ -1,18 +1,279 @@
 import time
 from loguru import logger
 
-from core.speech.google_engine import GoogleSpeechEngine
+import numpy as np
+
+from core.config import (
+    ASR_WORKER,
+    AUDIO_CAPTURE,
+    AUDIO_SPOOL_PATH,
+    BARGE_IN_TEMPLATES,
+    COMMAND_CONFIDENCE_FLOOR,
+    COMMAND_RECOGNIZER,
+    HEDGE_CONFIDENCE_FLOOR,
+    HEDGE_DELAY,
+    IDLE_GATE_DECIMATION,
+    MIC_DEVICE_INDEX,
+    MIC_DEVICE_NAME,
+    PUSH_TO_TALK,
+    SPEECH_CORPUS_DIR,
+    SPEECH_ENGINE,
+    SPEECH_HEDGE_ENGINE,
+    WAKE_WORD_TEMPLATES,
+)
+from core.audio.idle_gate import IDLE
+from core.audio.recorder import FRAME_SAMPLES
+from core.speech.engine import SpeechEngine, create_engine
 from core.speech.wake_word import contains_wake_word
 from core.control.global_interrupt import GLOBAL_INTERRUPT
 
 
 class InputController:
-    def __init__(self):
-        self.speech = GoogleSpeechEngine()
+    def __init__(
+        self,
+        engine: SpeechEngine = None,
+        push_to_talk: bool = PUSH_TO_TALK,
+        recorder=None,
+        wake_spotter=None,
+        barge_in=None,
+        idle_gate=None,
+    ):
+        self.recorder = recorder
+        self.device_manager = None
+        self.noise_floor = None
+        if engine is None:
+            engine = self._build_engine()
+
+        self.speech = engine
+        self.push_to_talk = push_to_talk
+
+        # Day 23.4 — on-device wake word gates cloud ASR
+        if wake_spotter is None and WAKE_WORD_TEMPLATES and self.recorder is not None:
+            from core.audio.keyword_spotter import KeywordSpotter
+            wake_spotter = KeywordSpotter.load(WAKE_WORD_TEMPLATES)
+        self.wake_spotter = wake_spotter
+        self.wake_reader = self.recorder.reader("wake") if (wake_spotter and self.recorder) else None
+
+        # Day 25.4 — decimated energy gate in front of the spotter
+        if idle_gate is None and self.wake_reader is not None and IDLE_GATE_DECIMATION > 1:
+            from core.audio.idle_gate import IdleGate
+            idle_gate = IdleGate(decimation=IDLE_GATE_DECIMATION, noise_floor=self.noise_floor)
+        self.idle_gate = idle_gate
+
+        # Day 24.3 — interrupt phrases spotted on audio while actions run
+        if barge_in is None and BARGE_IN_TEMPLATES and self.recorder is not None:
+            from core.audio.barge_in import BargeInListener
+            from core.audio.keyword_spotter import KeywordSpotter
+            barge_in = BargeInListener(self.recorder, KeywordSpotter.load(BARGE_IN_TEMPLATES))
+        self.barge_in = barge_in
+        if barge_in is not None:
+            barge_in.start()
         self.active = False
         self.last_active_time = 0
         self.ACTIVE_TIMEOUT = 45
 
+        # Day 24.2 — opt-in capture spool
+        self.spool = None
+        self.turn_id = 0
+        if AUDIO_SPOOL_PATH:
+            from core.audio.spool import AudioSpool
+            self.spool = AudioSpool(AUDIO_SPOOL_PATH)
+            self.turn_id = len(self.spool.entries())
+
+    def _build_engine(self) -> SpeechEngine:
+        """
+        Day 23.3 — backend chosen by config.
+        Day 24.1 — optionally hedged with a second recognizer.
+        Day 25.5 — optionally fronted by the on-device command recognizer.
+        """
+        engine = self._build_primary()
+        if SPEECH_HEDGE_ENGINE:
+            from core.speech.hedged import HedgedRecognizer
+
+            secondary = create_engine(SPEECH_HEDGE_ENGINE, **self._recognize_only_kwargs(SPEECH_HEDGE_ENGINE))
+            engine = HedgedRecognizer(
+                engine,
+                secondary,
+                hedge_delay=HEDGE_DELAY,
+                confidence_floor=HEDGE_CONFIDENCE_FLOOR,
+            )
+
+        if COMMAND_RECOGNIZER:
+            from core.speech.command_recognizer import CommandRecognizer, LocalFirstEngine, load_command_decoder
+
+            local = CommandRecognizer(load_command_decoder(COMMAND_RECOGNIZER))
+            engine = LocalFirstEngine(local, engine, confidence_floor=COMMAND_CONFIDENCE_FLOOR)
+        return engine
+
+    def _recognize_only_kwargs(self, name: str) -> dict:
+        # The hedge only recognizes clips; it never captures audio
+        if name == "file":
+            return {"corpus_dir": SPEECH_CORPUS_DIR, "name": "file-hedge"}
+        if name == "google":
+            return {"capture": False}
+        return {}
+
+    def _build_primary(self) -> SpeechEngine:
+        if SPEECH_ENGINE == "file":
+            return create_engine("file", corpus_dir=SPEECH_CORPUS_DIR)
+
+        # Day 23.5 — one persistent input stream, selected by name
+        from core.audio.device_manager import DeviceManager
+        self.device_manager = DeviceManager(device_name=MIC_DEVICE_NAME, device_index=MIC_DEVICE_INDEX)
+
+        # Day 23.6 — ambient calibration runs continuously in the background
+        from core.audio.noise_floor import NoiseFloorEstimator
+        self.noise_floor = NoiseFloorEstimator()
+
+        if self.recorder is None and AUDIO_CAPTURE == "stream":
+            if ASR_WORKER:
+                # Day 25.1 — the ring is shared with an out-of-process recognizer
+                from core.audio.shm_ring import SharedRingRecorder as Recorder
+            else:
+                from core.audio.recorder import RingBufferRecorder as Recorder
+
+            self.recorder = Recorder(self.device_manager)
+            self.recorder.start()
+            self.noise_floor.attach(self.recorder)
+            if ASR_WORKER:
+                # The worker's VAD thresholds on this process's estimate
+                self.recorder.publish_noise_floor(self.noise_floor)
+
+        if ASR_WORKER and AUDIO_CAPTURE == "stream":
+            return create_engine("worker", recorder=self.recorder, engine=SPEECH_ENGINE)
+
+        return create_engine(
+            SPEECH_ENGINE,
+            recorder=self.recorder,
+            device_index=MIC_DEVICE_INDEX,
+            device_manager=self.device_manager,
+            noise_floor=self.noise_floor,
+        )
+
+    def wait_for_wake_word(self, timeout: float = None):
+        """
+        Consume ring frames until the spotter fires.
+        Returns the detection (with its ring position) or None.
+
+        Day 25.4: with an idle gate, frames only reach the spotter
+        after cheap energy gating escalates; every wait starts idle.
+        """
+        self.wake_reader.skip_to_now()
+        self.wake_spotter.reset()
+        gate = self.idle_gate
+        if gate is not None:
+            gate.sleep()
+        deadline = time.time() + timeout if timeout else None
+
+        while not GLOBAL_INTERRUPT.is_triggered():
+            if deadline and time.time() > deadline:
+                return None
+
+            idle = gate is not None and gate.mode == IDLE
+            view = self.wake_reader.read_exact(gate.block_samples if idle else FRAME_SAMPLES, timeout=0.5)
+            if view is None:
+                if not self.recorder.is_running():
+                    return None
+                continue
+            samples = np.frombuffer(view, dtype=np.int16)
+
+            if idle:
+                rewind = gate.idle_step(samples, self.wake_reader.cursor)
+                if rewind is not None:
+                    oldest = self.recorder.write_position - self.recorder.capacity
+                    self.wake_reader.cursor = max(rewind, oldest)
+                    self.wake_spotter.reset()
+                continue
+
+            cpu = time.process_time()
+            detection = self.wake_spotter.process(samples)
+            cpu = time.process_time() - cpu
+
+            if detection:
+                if gate is not None:
+                    gate.woke()
+                    gate.full_step(samples, cpu, self.wake_reader.cursor)
+                detection["position"] = self.wake_reader.cursor
+                logger.info("Wake word spotted on-device (score {})", detection["score"])
+                return detection
+
+            if gate is not None and gate.full_step(samples, cpu, self.wake_reader.cursor):
+                self.wake_spotter.reset()
+
+        return None
+
+    def _spool_turn(self, text: str, started_at: float):
+        clip = self.speech.last_clip
+        if clip is None:
+            return
+        self.turn_id += 1
+        try:
+            self.spool.append(
+                clip.pcm,
+                transcript=text,
+                turn_id=self.turn_id,
+                started_at=started_at,
+                ended_at=time.time(),
+                endpoint_delay_ms=round(clip.endpoint_delay * 1000, 1),
+                recognize_ms=round(clip.meta.get("recognize_seconds", 0.0) * 1000, 1),
+            )
+        except Exception as e:
+            logger.error("Audio spool append failed: {}", e)
+
+    def dictate(self, sink, **kwargs):
+        """
+        Day 25.6 — long-form speech straight from the ring: chunked,
+        recognized concurrently, each stitched piece passed to sink(text).
+        Returns the dictation report, or None without streaming capture.
+        """
+        if self.recorder is None:
+            return None
+
+        from core.audio.vad import VoiceActivityDetector
+        from core.speech.dictation import Dictation
+
+        # Open vocabulary: skip the on-device command grammar (Day 25.5)
+        recognizer = getattr(self.speech, "cloud", self.speech)
+        dictation = Dictation(
+            self.recorder.reader("dictation"),
+            recognizer,
+            sink,
+            vad=VoiceActivityDetector(noise_floor=self.noise_floor),
+            **kwargs,
+        )
+        report = dictation.run()
+        self.last_active_time = time.time()
+        logger.info("Dictation: {} words in {} chunks", report["words"], report["chunks"])
+        return report
+
+    def close(self):
+        """
+        Release capture resources on shutdown: listeners first, then the
+        engine, the ring and the device, and finally the spool (Day 24.2),
+        whose preallocation is trimmed and header finalized on close.
+        Safe to call more than once.
+        """
+        if self.barge_in is not None:
+            self.barge_in.stop()
+        if self.noise_floor is not None:
+            self.noise_floor.stop()
+        self.speech.close()
+
+        if self.recorder is not None:
+            # SharedRingRecorder.close() also unlinks the segment
+            getattr(self.recorder, "close", self.recorder.stop)()
+            self.recorder = None
+        if self.device_manager is not None:
+            self.device_manager.close()
+            self.device_manager = None
+
+        if self.spool is not None:
+            try:
+                self.spool.close()
+            except Exception as e:
+                logger.error("Audio spool close failed: {}", e)
+            self.spool = None
+
     def reset_execution_state(self):
         """
         Reset ONLY execution-related state.
@@ -23,6 +284,17 @@ class InputController:
         self.last_active_time = 0
 
     def read(self) -> str:
+        if self.barge_in is not None:
+            self.barge_in.disarm()
+
+        text = self._read()
+
+        # A command is about to run: listen for "stop" meanwhile
+        if text and self.barge_in is not None:
+            self.barge_in.arm()
+        return text
+
+    def _read(self) -> str:
         # 🔴 Abort immediately if interrupt already active
         if GLOBAL_INTERRUPT.is_triggered():
             logger.debug("Input read aborted due to global interrupt")
@@ -30,12 +302,28 @@ class InputController:
 
         now = time.time()
 
-        # Only ask for ENTER if assistant is sleeping
+        if self.wake_spotter is not None and self.active and (now - self.last_active_time) >= self.ACTIVE_TIMEOUT:
+            self.active = False
+
+        # Sleeping: wait for the on-device wake word, or ask for ENTER
         if not self.active:
-            input("Press ENTER and speak...")
+            if self.wake_spotter is not None:
+                detection = self.wait_for_wake_word()
+                if detection is None:
+                    return ""
+                self.speech.skip_to(detection["position"])
+                self.active = True
+                self.last_active_time = time.time()
+            elif self.push_to_talk:
+                input("Press ENTER and speak...")
 
+        started_at = time.time()
         text = self.speech.listen_once()
         logger.debug("Raw speech: {}", text)
+        if self.device_manager is not None:
+            self.device_manager.note_turn()
+        if self.spool is not None:
+            self._spool_turn(text, started_at)
 
         # Interrupt may occur during listening
         if GLOBAL_INTERRUPT.is_triggered():
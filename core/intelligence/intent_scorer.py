@@ -1,5 +1,6 @@
 from typing import Dict, List
 from core.nlp.intent import Intent
+from core.skills.registry import SKILLS
 
 
 # -------------------------------------------------
@@ -33,23 +34,23 @@ HARD_GUARDS: Dict[str, Intent] = {
 
     # Listing intent
     "list": Intent.LIST_FILES,
+
+    # Long-form notes (Day 25.6) — never a one-utterance note
+    "dictate": Intent.NOTE_DICTATE,
+    "dictation": Intent.NOTE_DICTATE,
+
+    # Volume is never a browser / file action (Day 26.2)
+    "volume": Intent.CONTROL_VOLUME,
+    "mute": Intent.CONTROL_VOLUME,
+    "unmute": Intent.CONTROL_VOLUME,
 }
 
 
 # -------------------------------------------------
 # Day 15.2 — INTENT PRIORITY (TIE-BREAKER)
+# Day 26.2 — declared per skill in core.skills.registry
 # -------------------------------------------------
-INTENT_PRIORITY: Dict[Intent, int] = {
-    Intent.OPEN_TERMINAL: 5,
-    Intent.OPEN_FILE: 4,
-    Intent.LIST_FILES: 4,
-    Intent.OPEN_FILE_MANAGER: 3,
-    Intent.SEARCH_WEB: 3,
-    Intent.OPEN_BROWSER: 2,
-    Intent.GREETING: 1,
-    Intent.HELP: 1,
-    Intent.EXIT: 1,
-}
+INTENT_PRIORITY: Dict[Intent, int] = SKILLS.priority
 
 
 # -------------------------------------------------
@@ -64,6 +65,7 @@ INTENT_KEYWORDS: Dict[Intent, List[str]] = {
     # Notes
     Intent.NOTE_CREATE: ["note", "save", "write", "take"],
     Intent.NOTE_READ: ["read", "show"],
+    Intent.NOTE_DICTATE: ["dictate", "dictation", "note"],
 
     # --------------------
     # System actions
@@ -110,6 +112,27 @@ INTENT_KEYWORDS: Dict[Intent, List[str]] = {
         "lookup",
         "query",
     ],
+
+    # --------------------
+    # Media (Day 26.2)
+    # --------------------
+    Intent.PLAY_MEDIA: [
+        "play",
+        "music",
+        "song",
+        "songs",
+        "video",
+        "spotify",
+    ],
+
+    Intent.CONTROL_VOLUME: [
+        "volume",
+        "louder",
+        "quieter",
+        "softer",
+        "mute",
+        "unmute",
+    ],
 }
 
 
@@ -0,0 +1,131 @@
+"""
+Next-Intent Model
+Day 22.2 — Online Markov model over intent transitions
+
+State = intent + coarse argument key
+    "list_files:downloads" → "open_file:named_file"
+
+- Learned from the conversation log at startup
+- Updated after every executed action
+- Deterministic: ties resolve to the transition seen first
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Arguments that are stable enough to be part of a state
+STATE_ARG_KEYS = ("target",)
+
+# Max distinct successors remembered per state
+MAX_SUCCESSORS = 8
+
+
+def state_key(intent: str, args: Optional[Dict[str, Any]] = None) -> str:
+    args = args or {}
+    for key in STATE_ARG_KEYS:
+        value = args.get(key)
+        if value:
+            return f"{intent}:{value}"
+    return intent
+
+
+class NextIntentModel:
+    def __init__(self, min_observations: int = 2):
+        # state → next_state → count
+        self._transitions: Dict[str, Dict[str, int]] = defaultdict(dict)
+
+        # next_state → last seen args (what a prefetch would need)
+        self._last_args: Dict[str, Dict[str, Any]] = {}
+
+        # sequence → last observed state (one chain per conversation)
+        self._previous: Dict[str, str] = {}
+        self.min_observations = min_observations
+
+    # -------------------------------
+    # Learning
+    # -------------------------------
+    def train(self, intents: Iterable[str]):
+        """
+        Bootstrap from a chronological list of intent names
+        (e.g. the user side of the conversation log).
+        """
+        previous = None
+        for intent in intents:
+            if not intent or intent == "unknown":
+                previous = None
+                continue
+            if previous:
+                self._count(previous, intent)
+            previous = intent
+
+    def observe(self, intent: str, args: Optional[Dict[str, Any]] = None, sequence: str = "default"):
+        """
+        Record one executed action (online update).
+        Transitions are only counted within one sequence (session).
+        """
+        current = state_key(intent, args)
+        previous = self._previous.get(sequence)
+
+        if previous:
+            self._count(previous, current)
+            # Also learn the bare-intent transition so
+            # unseen argument keys still get a prediction
+            bare = previous.split(":", 1)[0]
+            if bare != previous:
+                self._count(bare, current)
+
+        self._last_args[current] = dict(args or {})
+        self._previous[sequence] = current
+
+    def _count(self, state: str, next_state: str):
+        successors = self._transitions[state]
+        if next_state not in successors and len(successors) >= MAX_SUCCESSORS:
+            # Drop the weakest successor to stay bounded
+            weakest = min(successors, key=successors.get)
+            del successors[weakest]
+        successors[next_state] = successors.get(next_state, 0) + 1
+
+    # -------------------------------
+    # Prediction
+    # -------------------------------
+    def predict(
+        self, intent: str, args: Optional[Dict[str, Any]] = None, top_k: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Most likely next actions after (intent, args).
+
+        Returns:
+            [{"intent": str, "state": str, "probability": float, "args": dict}]
+        """
+        current = state_key(intent, args)
+        successors = self._transitions.get(current) or self._transitions.get(intent)
+        if not successors:
+            return []
+
+        total = sum(successors.values())
+        if total < self.min_observations:
+            return []
+
+        ranked: List[Tuple[str, int]] = sorted(
+            successors.items(), key=lambda kv: kv[1], reverse=True
+        )
+
+        return [
+            {
+                "intent": state.split(":", 1)[0],
+                "state": state,
+                "probability": count / total,
+                "args": dict(self._last_args.get(state, {})),
+            }
+            for state, count in ranked[:top_k]
+        ]
+
+    def reset_sequence(self, sequence: Optional[str] = None):
+        """
+        Break the chain (e.g. after an interrupt) without forgetting counts.
+        sequence=None breaks every chain.
+        """
+        if sequence is None:
+            self._previous.clear()
+        else:
+            self._previous.pop(sequence, None)
@@ -0,0 +1,45 @@
+"""
+Unclear Utterance Log
+Day 22.5 — Record every turn that ended in a clarification
+
+One JSON object per line (append-only, cheap on the hot path):
+    {"ts": float, "text": str, "intent": str, "confidence": float}
+
+Mined offline by core.intelligence.utterance_miner.
+"""
+
+import json
+import os
+import time
+from threading import Lock
+
+from loguru import logger
+
+from core.system.config import RUDRA_DATA_DIR
+
+DEFAULT_LOG_PATH = os.path.join(RUDRA_DATA_DIR, "unclear_utterances.jsonl")
+
+
+class UnclearUtteranceLog:
+    def __init__(self, path: str = DEFAULT_LOG_PATH):
+        self.path = path
+        self._lock = Lock()
+
+    def record(self, text: str, intent: str, confidence: float):
+        if not text:
+            return
+
+        line = json.dumps({
+            "ts": round(time.time(), 3),
+            "text": text,
+            "intent": intent,
+            "confidence": round(confidence, 3),
+        })
+
+        try:
+            with self._lock:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+        except OSError as e:
+            logger.warning("Unclear utterance not logged: {}", e)
@@ -0,0 +1,248 @@
+"""
+Unclear Utterance Miner
+Day 22.5 — Offline clustering of clarification failures
+
+Pipeline (near-linear in the number of logged utterances):
+1. Stream the JSONL log, collapse exact duplicates (with counts)
+2. MinHash signature per unique utterance (unigram + bigram shingles),
+   computed in padded numpy batches
+3. LSH banding: utterances sharing any band are candidates,
+   verified by signature agreement, merged with union-find
+4. Report the biggest clusters + vocabulary suggestions for
+   INTENT_KEYWORDS / VERB_ALIASES
+
+Usage:
+    python -m core.intelligence.utterance_miner [--log PATH] [--top N]
+"""
+
+import argparse
+import json
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from core.nlp.normalizer import normalize_text, FILLER_WORDS
+from core.nlp.quality_gate import STOPWORDS
+from core.intelligence.intent_scorer import INTENT_KEYWORDS, VERB_ALIASES, HARD_GUARDS
+from core.intelligence.utterance_log import DEFAULT_LOG_PATH
+
+# 16 bands × 4 rows → candidate pairs start around Jaccard ≈ 0.5
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+JACCARD_THRESHOLD = 0.5
+
+PRIME = (1 << 31) - 1
+BATCH_SIZE = 2048
+
+KNOWN_WORDS = (
+    {w for words in INTENT_KEYWORDS.values() for w in words}
+    | set(VERB_ALIASES)
+    | set(HARD_GUARDS)
+)
+IGNORED_WORDS = STOPWORDS | FILLER_WORDS | {"__REF__", "__REPEAT__", "rudra", "me", "my", "for"}
+
+
+# -------------------------------
+# Loading
+# -------------------------------
+def load_log(lines: Iterable[str]) -> Dict[str, Dict]:
+    """
+    Collapse the log into unique normalized utterances:
+        text → {"count": int, "intents": Counter}
+    """
+    utterances: Dict[str, Dict] = {}
+
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+
+        tokens = normalize_text(entry.get("text", ""))
+        if not tokens:
+            continue
+
+        key = " ".join(tokens)
+        item = utterances.setdefault(key, {"count": 0, "intents": Counter()})
+        item["count"] += 1
+        item["intents"][entry.get("intent") or "unknown"] += 1
+
+    return utterances
+
+
+# -------------------------------
+# MinHash
+# -------------------------------
+def shingle_hashes(tokens: List[str]) -> List[int]:
+    shingles = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    return sorted({zlib.crc32(s.encode("utf-8")) % PRIME for s in shingles})
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 22):
+        rng = np.random.default_rng(seed)
+        # a, b < 2^31 and x < 2^31 → a*x + b fits in uint64
+        self.a = rng.integers(1, PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, PRIME, size=num_perm, dtype=np.uint64)
+
+    def signatures(self, token_lists: List[List[str]]) -> np.ndarray:
+        """
+        (n, num_perm) uint32 signatures, computed in padded batches.
+        """
+        out = np.empty((len(token_lists), len(self.a)), dtype=np.uint32)
+
+        for start in range(0, len(token_lists), BATCH_SIZE):
+            batch = [shingle_hashes(t) for t in token_lists[start:start + BATCH_SIZE]]
+            width = max(len(h) for h in batch)
+
+            # Pad with each row's own first shingle → min is unchanged
+            padded = np.array(
+                [h + [h[0]] * (width - len(h)) for h in batch], dtype=np.uint64
+            )
+
+            # (perm, batch, width) → min over shingles
+            hashed = (self.a[:, None, None] * padded[None, :, :] + self.b[:, None, None]) % PRIME
+            out[start:start + len(batch)] = hashed.min(axis=2).T
+
+        return out
+
+
+# -------------------------------
+# LSH clustering
+# -------------------------------
+def cluster_signatures(
+    signatures: np.ndarray,
+    bands: int = BANDS,
+    threshold: float = JACCARD_THRESHOLD,
+) -> List[int]:
+    """
+    Return a cluster id (root index) per row.
+    """
+    n = len(signatures)
+    parent = list(range(n))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    rows = signatures.shape[1] // bands
+
+    for band in range(bands):
+        chunk = signatures[:, band * rows:(band + 1) * rows]
+        _, inverse = np.unique(chunk, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+
+        # Neighbours in sort order share a bucket
+        order = np.argsort(inverse, kind="stable")
+        same = np.nonzero(inverse[order][1:] == inverse[order][:-1])[0]
+
+        for i in same:
+            x, y = int(order[i]), int(order[i + 1])
+            rx, ry = find(x), find(y)
+            if rx == ry:
+                continue
+            # Verify the candidate before merging (limits chaining)
+            if np.mean(signatures[x] == signatures[y]) >= threshold:
+                parent[ry] = rx
+
+    return [find(i) for i in range(n)]
+
+
+# -------------------------------
+# Reporting
+# -------------------------------
+def suggest_vocabulary(texts: List[str], counts: List[int], intent: str | None, limit: int = 3) -> List[Dict]:
+    """
+    Frequent cluster words the scorer does not know yet.
+    Mostly sentence-initial words → VERB_ALIASES, others → INTENT_KEYWORDS.
+    """
+    freq: Counter = Counter()
+    first: Counter = Counter()
+
+    for text, count in zip(texts, counts):
+        tokens = text.split()
+        for token in set(tokens):
+            freq[token] += count
+        first[tokens[0]] += count
+
+    suggestions = []
+    for token, n in freq.most_common():
+        if token in KNOWN_WORDS or token in IGNORED_WORDS:
+            continue
+        if len(token) < 3 or token.isdigit():
+            continue
+
+        table = "VERB_ALIASES" if first[token] * 2 >= n else "INTENT_KEYWORDS"
+        suggestions.append({"token": token, "table": table, "intent": intent, "count": n})
+        if len(suggestions) >= limit:
+            break
+
+    return suggestions
+
+
+def mine(lines: Iterable[str], top: int = 10) -> List[Dict]:
+    utterances = load_log(lines)
+    if not utterances:
+        return []
+
+    texts = list(utterances)
+    signatures = MinHasher().signatures([t.split() for t in texts])
+    roots = cluster_signatures(signatures)
+
+    clusters: Dict[int, List[int]] = {}
+    for idx, root in enumerate(roots):
+        clusters.setdefault(root, []).append(idx)
+
+    def size(members: List[int]) -> int:
+        return sum(utterances[texts[i]]["count"] for i in members)
+
+    ranked = sorted(clusters.values(), key=size, reverse=True)[:top]
+
+    report = []
+    for members in ranked:
+        members.sort(key=lambda i: utterances[texts[i]]["count"], reverse=True)
+        member_texts = [texts[i] for i in members]
+        counts = [utterances[t]["count"] for t in member_texts]
+
+        intents: Counter = Counter()
+        for t in member_texts:
+            intents.update(utterances[t]["intents"])
+        intents.pop("unknown", None)
+        intent = intents.most_common(1)[0][0] if intents else None
+
+        report.append({
+            "size": sum(counts),
+            "unique": len(members),
+            "examples": member_texts[:3],
+            "intent": intent,
+            "suggestions": suggest_vocabulary(member_texts, counts, intent),
+        })
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cluster unclear utterances")
+    parser.add_argument("--log", default=DEFAULT_LOG_PATH)
+    parser.add_argument("--top", type=int, default=10)
+    options = parser.parse_args()
+
+    with open(options.log, "r", encoding="utf-8") as f:
+        report = mine(f, top=options.top)
+
+    for rank, cluster in enumerate(report, 1):
+        print(f"{rank}. {cluster['size']} turns ({cluster['unique']} phrasings) → {cluster['intent'] or 'unassigned'}")
+        for example in cluster["examples"]:
+            print(f"     \"{example}\"")
+        for s in cluster["suggestions"]:
+            target = s["intent"] or "?"
+            print(f"     + add '{s['token']}' to {s['table']} ({target})")
+
+
+if __name__ == "__main__":
+    main()
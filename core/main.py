@@ -3,10 +3,18 @@ load_dotenv()
 
 from loguru import logger
 from core.assistant import Assistant
+from core.config import MIC_ROOMS
 
 
 def main():
     logger.info("Starting Rudra Assistant (Day 18.1 – Global Interrupt Enabled)")
+
+    # Day 25.2 — several rooms, one process
+    if MIC_ROOMS:
+        from core.session_router import run_rooms
+        run_rooms(MIC_ROOMS)
+        return
+
     assistant = Assistant()
     assistant.run()
 
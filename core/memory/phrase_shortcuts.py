@@ -0,0 +1,187 @@
+"""
+Phrase Shortcuts
+Day 22.4 — Learned phrase → (intent, args) table
+
+Learned ONLY from user confirmation of an unclear phrase:
+- a clarification answered by a successful action
+- slot recovery after an ambiguous / clarified phrase, ended by a successful action
+
+Rules:
+- Consulted before intent scoring (single dict lookup)
+- Persisted per user (JSON, atomic replace)
+- Aged out by TTL, then LFU when over capacity
+- Blocked intents (dangerous) are never learned or replayed
+- Reference phrases ("open it again") are never learned
+- Free-text slots (query, command, filename, path) are never stored:
+  "open file" must keep asking which file
+- Entries naming an unknown intent (stale / hand-edited file) are dropped
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from loguru import logger
+
+from core.nlp.intent import Intent
+from core.nlp.normalizer import normalize_text
+from core.system.config import RUDRA_DATA_DIR
+
+# Slots whose value only makes sense for one utterance
+FREE_TEXT_SLOTS = {"query", "command", "raw_text", "filename", "full_path", "path"}
+
+KNOWN_INTENTS = {i.value for i in Intent} - {Intent.UNKNOWN.value}
+
+REFERENCE_TOKENS = {"__REF__", "__REPEAT__", "that", "them", "there", "same"}
+
+
+def phrase_key(text: str) -> str:
+    return " ".join(normalize_text(text))
+
+
+class PhraseShortcuts:
+    MAX_ITEMS = 200
+    TTL_SECONDS = 30 * 24 * 3600   # 30 days since last use
+    FLUSH_EVERY = 10               # hit updates buffered before a write
+
+    def __init__(
+        self,
+        *,
+        blocked_intents: Iterable[str],
+        user_id: str | None = None,
+        path: str | None = None,
+    ):
+        self.blocked_intents = set(blocked_intents)
+        self.user_id = user_id or os.getenv("USER", "default")
+        self.path = path or os.path.join(
+            RUDRA_DATA_DIR, "shortcuts", f"{self.user_id}.json"
+        )
+
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._dirty = 0
+        self._load()
+
+    # -------------------------------
+    # Read (hot path)
+    # -------------------------------
+    def lookup(self, text: str) -> Optional[Dict[str, Any]]:
+        key = phrase_key(text)
+        item = self._items.get(key)
+        if not item:
+            return None
+
+        now = time.time()
+        if not self._valid(item) or now - item["last_used"] > self.TTL_SECONDS:
+            del self._items[key]
+            self._mark_dirty()
+            return None
+
+        item["hits"] += 1
+        item["last_used"] = now
+        self._mark_dirty()
+
+        return {"intent": item["intent"], "args": dict(item["args"])}
+
+    # -------------------------------
+    # Write
+    # -------------------------------
+    def learn(self, text: str, intent: str, args: Dict[str, Any] | None = None) -> bool:
+        """
+        Remember that text meant (intent, args).
+        Returns False when the phrase is not safe to learn.
+        """
+        if intent in self.blocked_intents or intent not in KNOWN_INTENTS:
+            return False
+
+        key = phrase_key(text)
+        if not key:
+            return False
+        if REFERENCE_TOKENS.intersection(key.split()):
+            return False
+
+        safe_args = {
+            k: v for k, v in (args or {}).items()
+            if k not in FREE_TEXT_SLOTS and isinstance(v, (str, int, float, bool))
+        }
+
+        now = time.time()
+        previous = self._items.get(key)
+        self._items[key] = {
+            "intent": intent,
+            "args": safe_args,
+            "hits": previous["hits"] if previous and previous["intent"] == intent else 0,
+            "last_used": now,
+        }
+
+        self._evict()
+        self.save()
+        return True
+
+    def forget(self, text: str):
+        if self._items.pop(phrase_key(text), None) is not None:
+            self.save()
+
+    # -------------------------------
+    # Ageing
+    # -------------------------------
+    def _evict(self):
+        now = time.time()
+        expired = [k for k, v in self._items.items() if now - v["last_used"] > self.TTL_SECONDS]
+        for key in expired:
+            del self._items[key]
+
+        overflow = len(self._items) - self.MAX_ITEMS
+        if overflow > 0:
+            # Least frequently used first, oldest first on ties
+            victims = sorted(
+                self._items, key=lambda k: (self._items[k]["hits"], self._items[k]["last_used"])
+            )[:overflow]
+            for key in victims:
+                del self._items[key]
+
+    # -------------------------------
+    # Persistence
+    # -------------------------------
+    def _mark_dirty(self):
+        self._dirty += 1
+        if self._dirty >= self.FLUSH_EVERY:
+            self.save()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict):
+            self._items = {k: v for k, v in data.items() if self._valid(v)}
+            dropped = len(data) - len(self._items)
+            if dropped:
+                logger.warning("Dropped {} invalid phrase shortcut(s)", dropped)
+            self._evict()
+
+    def _valid(self, item: Any) -> bool:
+        return (
+            isinstance(item, dict)
+            and item.get("intent") in KNOWN_INTENTS
+            and item["intent"] not in self.blocked_intents
+            and isinstance(item.get("args"), dict)
+            and isinstance(item.get("hits"), int)
+            and isinstance(item.get("last_used"), (int, float))
+        )
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._items, f)
+            os.replace(tmp, self.path)
+            self._dirty = 0
+        except OSError as e:
+            logger.warning("Phrase shortcuts not saved: {}", e)
+
+    def __len__(self) -> int:
+        return len(self._items)
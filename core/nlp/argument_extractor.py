@@ -19,9 +19,12 @@ class ArgumentType(Enum):
 
 
 class ArgumentExtractor:
-    def __init__(self, config=None):
+    def __init__(self, config=None, browser_index=None):
         self.config = config
 
+        # Day 22.3 — local bookmarks/history (in-memory lookups only)
+        self.browser_index = browser_index
+
         self.system_dirs = {
             'downloads': os.path.expanduser('~/Downloads'),
             'desktop': os.path.expanduser('~/Desktop'),
@@ -96,6 +99,11 @@ class ArgumentExtractor:
                 url = 'https://' + url
             return {'url': url, 'target': 'custom'}
 
+        if self.browser_index is not None:
+            indexed = self.browser_index.lookup(text)
+            if indexed:
+                return {'url': indexed['url'], 'target': indexed['keyword']}
+
         return {'url': 'https://google.com', 'target': 'default'}
 
     def _extract_terminal_args(self, text: str) -> Dict[str, Any]:
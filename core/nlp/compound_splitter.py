@@ -0,0 +1,91 @@
+"""
+Compound Command Splitter
+Day 22.1 — Clause splitting for multi-action utterances
+
+"open youtube and search python asyncio and list downloads"
+→ three sub-commands, each scored on its own.
+
+Rules:
+- Split only on a connector ("and", "then", "also", ",")
+  that is directly followed by a command verb
+- "search rock and roll" stays ONE clause (no verb after "and")
+- "then" / "after that" mark the next clause as sequential
+"""
+
+import re
+from typing import Dict, List
+
+# Verbs that may start a new sub-command
+CLAUSE_VERBS = {
+    "open", "launch", "start",
+    "search", "find", "lookup", "look", "google",
+    "list", "show", "read",
+    "play", "take", "save", "write",
+}
+
+# Connectors that may separate sub-commands
+CONNECTORS = {"and", "then", "also", "after", "that", ","}
+
+# Connectors that force ordering
+SEQUENTIAL_CONNECTORS = {"then", "after"}
+
+
+def split_compound(text: str) -> List[Dict[str, object]]:
+    """
+    Split text into sub-commands.
+
+    Returns a list of:
+        {"text": str, "sequential": bool}
+
+    "sequential" is True when the clause was introduced
+    with "then" / "after that" and must wait for the previous one.
+    A plain sentence returns a single clause.
+    """
+    if not text or not text.strip():
+        return []
+
+    # Keep commas as separate tokens
+    words = re.sub(r"\s*,\s*", " , ", text.strip()).split()
+
+    clauses: List[Dict[str, object]] = []
+    current: List[str] = []
+    sequential = False
+    idx = 0
+
+    while idx < len(words):
+        word = words[idx]
+
+        if word in CONNECTORS and current:
+            # Consume a run of connectors ("and then", ", after that")
+            end = idx
+            while end < len(words) and words[end] in CONNECTORS:
+                end += 1
+
+            run = words[idx:end]
+            if end < len(words) and words[end] in CLAUSE_VERBS and _is_separator(run):
+                clauses.append({"text": " ".join(current), "sequential": sequential})
+                current = []
+                sequential = any(w in SEQUENTIAL_CONNECTORS for w in run)
+                idx = end
+                continue
+
+        if word != ",":
+            current.append(word)
+        idx += 1
+
+    if current:
+        clauses.append({"text": " ".join(current), "sequential": sequential})
+
+    return clauses
+
+
+def _is_separator(run: List[str]) -> bool:
+    """
+    "that" alone is a reference ("open that"), never a separator.
+    It only counts as part of "after that".
+    """
+    if run == ["that"]:
+        return False
+    if "that" in run and "after" not in run:
+        return False
+    return True
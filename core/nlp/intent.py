@@ -6,6 +6,7 @@ class Intent(Enum):
     EXIT = "exit"
     NOTE_CREATE = "note_create"
     NOTE_READ = "note_read"
+    NOTE_DICTATE = "note_dictate"
     OPEN_BROWSER = "open_browser"
     OPEN_TERMINAL = "open_terminal" 
     OPEN_FILE_MANAGER = "open_file_manager"
@@ -30,6 +31,9 @@ def detect_intent(tokens: list[str]) -> Intent:
     if any(t in ("exit", "quit", "bye") for t in tokens):
         return Intent.EXIT
     
+    if any(t in ("dictate", "dictation") for t in tokens):
+        return Intent.NOTE_DICTATE
+
     if "note" in tokens and any(t in ("save", "write", "take") for t in tokens):
         return Intent.NOTE_CREATE
 
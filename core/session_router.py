@@ -0,0 +1,157 @@
+"""
+Session Router
+Day 25.2 — Per-room conversations on one NLP/action pipeline
+
+Every device gets its own session (an Assistant with its own pending
+slots, clarification state, short-term context and follow-up context);
+all sessions share one ActionExecutor — its pipeline, skills and pool —
+and pass their ExecutionSession into it. Utterances are dispatched one at a time from the
+fan-in queue, so NLP and actions run on a single pipeline thread while
+capture, wake word, VAD and ASR run per device.
+
+A session is anything with:
+    input      → SessionInput (read() returns the routed utterance)
+    run_once() → one conversational turn
+"""
+
+import time
+from collections import defaultdict, deque
+from typing import Callable, Dict, Optional
+
+from loguru import logger
+
+
+class SessionInput:
+    """
+    InputController stand-in for one device: read() returns the
+    next utterance routed to this session.
+    """
+
+    barge_in = None
+
+    def __init__(self, device: str):
+        self.device = device
+        self._texts = deque()
+
+    def push(self, text: str):
+        self._texts.append(text)
+
+    def read(self) -> str:
+        return self._texts.popleft() if self._texts else ""
+
+    def reset_execution_state(self):
+        self._texts.clear()
+
+
+class SessionRouter:
+    def __init__(self, mic_input, session_factory: Optional[Callable[[str, SessionInput], object]] = None):
+        self.mic_input = mic_input
+        self.session_factory = session_factory or self._assistant_session
+        self.sessions: Dict[str, object] = {}
+        self._executor = None
+
+        self.stats = defaultdict(lambda: {"turns": 0, "errors": 0, "wait_ms": deque(maxlen=200)})
+
+    def _assistant_session(self, device: str, session_input: SessionInput):
+        from core.actions.action_executor import ActionExecutor
+        from core.assistant import Assistant
+        from core.context.long_term import recent_intents
+
+        if self._executor is None:
+            self._executor = ActionExecutor()
+            try:
+                self._executor.next_intent_model.train(recent_intents())
+            except Exception as e:
+                logger.warning("Next-intent bootstrap skipped: {}", e)
+        return Assistant(input_controller=session_input, action_executor=self._executor, session=device)
+
+    def session(self, device: str):
+        if device not in self.sessions:
+            self.sessions[device] = self.session_factory(device, SessionInput(device))
+            logger.info("New session for device '{}'", device)
+        return self.sessions[device]
+
+    def dispatch(self, utterance: Dict[str, object]):
+        device = utterance["device"]
+        session = self.session(device)
+        stats = self.stats[device]
+        stats["wait_ms"].append((time.time() - utterance["heard_at"]) * 1000)
+
+        session.input.push(utterance["text"])
+        try:
+            session.run_once()
+            stats["turns"] += 1
+        except Exception as e:
+            stats["errors"] += 1
+            logger.error("[{}] turn failed: {}", device, e)
+
+    def run(self, max_turns: Optional[int] = None, idle_timeout: float = 0.2):
+        """
+        Dispatch until every device stream ended (or max_turns).
+        """
+        turns = 0
+        while max_turns is None or turns < max_turns:
+            utterance = self.mic_input.next_utterance(timeout=idle_timeout)
+            if utterance is None:
+                if not self.mic_input.active() and self.mic_input.utterances.empty():
+                    break
+                continue
+            self.dispatch(utterance)
+            turns += 1
+        return turns
+
+    def report(self) -> Dict[str, object]:
+        report = {}
+        for device, stats in self.stats.items():
+            waits = sorted(stats["wait_ms"])
+            report[device] = {
+                "turns": stats["turns"],
+                "errors": stats["errors"],
+                "wait_ms_p50": round(waits[len(waits) // 2], 1) if waits else None,
+            }
+        return report
+
+
+def room_source(device: str):
+    """
+    "udp:<port>" → a satellite streaming over the network (Day 25.3),
+    anything else → a local input device matched by name.
+    """
+    if device.startswith("udp:"):
+        from core.audio.network import UdpAudioSource
+        return UdpAudioSource(port=int(device[4:]))
+
+    from core.audio.device_manager import DeviceManager
+    return DeviceManager(device_name=device)
+
+
+def run_rooms(rooms: Dict[str, str]):
+    """
+    Production entry: {room: input device} → one session per room.
+    """
+    from core.audio.multi_mic import MultiMicInput
+    from core.config import SPEECH_CORPUS_DIR, SPEECH_ENGINE, WAKE_WORD_TEMPLATES
+    from core.speech.engine import create_engine
+
+    spotter_factory = None
+    if WAKE_WORD_TEMPLATES:
+        from core.audio.keyword_spotter import KeywordSpotter
+
+        def spotter_factory():
+            return KeywordSpotter.load(WAKE_WORD_TEMPLATES)
+
+    # Recognize-only: capture belongs to the per-room streams
+    kwargs = {"corpus_dir": SPEECH_CORPUS_DIR} if SPEECH_ENGINE == "file" else {}
+    recognizer = create_engine(SPEECH_ENGINE, **kwargs)
+
+    mic_input = MultiMicInput(
+        {room: room_source(device) for room, device in rooms.items()},
+        recognizer,
+        spotter_factory=spotter_factory,
+    )
+    router = SessionRouter(mic_input)
+    mic_input.start()
+    try:
+        router.run()
+    finally:
+        mic_input.stop()
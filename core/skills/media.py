@@ -0,0 +1,138 @@
+"""
+Media Skills
+Day 26.2 — PLAY_MEDIA and CONTROL_VOLUME (loaded by the registry on first use)
+
+play_media      → search results on YouTube (or Spotify) in the browser
+control_volume  → system output volume: pactl / amixer (Linux), osascript (macOS)
+"""
+
+import logging
+import platform
+import re
+import shutil
+import subprocess
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote_plus
+
+logger = logging.getLogger(__name__)
+
+MEDIA_SEARCH_URLS = {
+    "youtube": "https://www.youtube.com/results?search_query={}",
+    "spotify": "https://open.spotify.com/search/{}",
+}
+
+PLAY_WORDS = {"play", "playing", "put", "on", "start", "some", "me", "a", "the", "please", "rudra"}
+
+VOLUME_DIRECTIONS = (
+    ("unmute", ("unmute",)),
+    ("mute", ("mute", "silence")),
+    ("up", ("up", "louder", "increase", "raise")),
+    ("down", ("down", "quieter", "lower", "decrease", "softer", "reduce")),
+)
+VOLUME_STEP = 10
+
+
+# ---------- ARGUMENTS ----------
+
+def extract_media_args(text: str) -> Dict[str, Any]:
+    words = re.findall(r"[\w']+", text.lower())
+    target = next((w for w in words if w in MEDIA_SEARCH_URLS), "youtube")
+
+    # "play lofi beats on spotify" → query "lofi beats"
+    words = [w for w in words if w not in MEDIA_SEARCH_URLS]
+    while words and words[0] in PLAY_WORDS:
+        words.pop(0)
+    while words and words[-1] in ("on", "in", "please"):
+        words.pop()
+
+    return {"query": " ".join(words) or None, "target": target}
+
+
+def extract_volume_args(text: str) -> Dict[str, Any]:
+    words = set(re.findall(r"[a-z]+", text.lower()))
+    level_match = re.search(r"\b(\d{1,3})\s*(?:%|percent)?", text.lower())
+    level = min(100, int(level_match.group(1))) if level_match else None
+
+    direction = next((d for d, keys in VOLUME_DIRECTIONS if words & set(keys)), None)
+    # "volume 40", "turn it up to 60" → an absolute level
+    if level is not None and (direction is None or (direction in ("up", "down") and "to" in words)):
+        direction = "set"
+    return {"direction": direction, "level": level}
+
+
+# ---------- HANDLERS ----------
+
+def play_media(actions, args: Dict[str, Any]) -> Dict[str, Any]:
+    query = args.get("query")
+    if not query:
+        return {"success": False, "message": "What should I play?"}
+
+    target = args.get("target") if args.get("target") in MEDIA_SEARCH_URLS else "youtube"
+    url = MEDIA_SEARCH_URLS[target].format(quote_plus(query))
+    result = actions.open_browser(url, target)
+    if not result.get("success"):
+        return {"success": False, "message": f"I couldn't play {query}."}
+
+    return {**result, "message": f"Playing {query} on {target.capitalize()}"}
+
+
+def _volume_command(direction: str, level: Optional[int]) -> Optional[List[str]]:
+    step = level or VOLUME_STEP
+    system = platform.system()
+
+    if system == "Linux" and shutil.which("pactl"):
+        sink = "@DEFAULT_SINK@"
+        return {
+            "up": ["pactl", "set-sink-volume", sink, f"+{step}%"],
+            "down": ["pactl", "set-sink-volume", sink, f"-{step}%"],
+            "set": ["pactl", "set-sink-volume", sink, f"{level}%"],
+            "mute": ["pactl", "set-sink-mute", sink, "1"],
+            "unmute": ["pactl", "set-sink-mute", sink, "0"],
+        }[direction]
+
+    if system == "Linux" and shutil.which("amixer"):
+        return {
+            "up": ["amixer", "-q", "set", "Master", f"{step}%+"],
+            "down": ["amixer", "-q", "set", "Master", f"{step}%-"],
+            "set": ["amixer", "-q", "set", "Master", f"{level}%"],
+            "mute": ["amixer", "-q", "set", "Master", "mute"],
+            "unmute": ["amixer", "-q", "set", "Master", "unmute"],
+        }[direction]
+
+    if system == "Darwin":
+        current = "output volume of (get volume settings)"
+        script = {
+            "up": f"set volume output volume (({current}) + {step})",
+            "down": f"set volume output volume (({current}) - {step})",
+            "set": f"set volume output volume {level}",
+            "mute": "set volume output muted true",
+            "unmute": "set volume output muted false",
+        }[direction]
+        return ["osascript", "-e", script]
+
+    return None
+
+
+def control_volume(actions, args: Dict[str, Any]) -> Dict[str, Any]:
+    direction, level = args.get("direction"), args.get("level")
+    if direction not in ("up", "down", "set", "mute", "unmute"):
+        return {"success": False, "message": "Should I turn the volume up or down?"}
+
+    command = _volume_command(direction, level)
+    if command is None:
+        return {"success": False, "message": "I can't control the volume on this system."}
+
+    try:
+        subprocess.run(command, check=True, capture_output=True, timeout=2)
+    except Exception as e:
+        logger.error(e)
+        return {"success": False, "message": "Failed to change the volume"}
+
+    messages = {
+        "up": "Volume up",
+        "down": "Volume down",
+        "set": f"Volume set to {level}%",
+        "mute": "Muted",
+        "unmute": "Unmuted",
+    }
+    return {"success": True, "message": messages[direction], "direction": direction, "level": level}
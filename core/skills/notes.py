@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from core.storage.mysql import get_session
 from core.storage.notes_models import Note
 
@@ -22,6 +22,25 @@ def save_note(text: str) -> str:
     return f"I saved this note: {content}"
 
 
+# Day 25.6 — dictation saves a note piece by piece
+def start_note(content: str) -> int:
+    with get_session() as session:
+        note = Note(content=content)
+        session.add(note)
+        session.flush()
+        return note.id
+
+
+def append_to_note(note_id: int, text: str):
+    # Appended in SQL: the note is never read back, however long it gets
+    with get_session() as session:
+        session.execute(
+            update(Note)
+            .where(Note.id == note_id)
+            .values(content=func.concat(Note.content, " ", text))
+        )
+
+
 
 def read_notes(limit: int = 5) -> str:
     with get_session() as session:
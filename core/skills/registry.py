@@ -0,0 +1,185 @@
+"""
+Skill Registry
+Day 26.2 — One declaration per skill, O(1) dispatch, lazy loading
+
+Each skill is declared once as a SkillSpec:
+
+    intent            Intent it serves
+    handler           "module:function" → function(system_actions, args) -> dict
+                      (None: conversational intent answered by the assistant)
+    slots             required arguments                 → REQUIRED_ARGS
+    entities          follow-up replay whitelist         → INTENT_ENTITY_WHITELIST
+    intent_class      system / filesystem / dangerous... → INTENT_CLASS
+    interrupt_policy  HARD / SOFT / IGNORE               → INTERRUPT_POLICY
+    priority          intent tie-break                   → INTENT_PRIORITY
+    timeout           asynchronous time budget           → ACTION_TIMEOUTS
+    extractor         optional "module:function" → function(text) -> args
+
+The tables above are dicts the registry keeps in sync (registering a
+skill updates them in place), so existing `from ... import TABLE`
+users see every skill. Handler and extractor modules are imported on
+first dispatch only: startup cost does not grow with installed skills.
+"""
+
+import importlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from core.nlp.intent import Intent
+
+DEFAULT_ACTION_TIMEOUT = 10.0
+
+
+@dataclass(frozen=True)
+class SkillSpec:
+    intent: Intent
+    handler: Optional[str] = None
+    slots: Tuple[str, ...] = ()
+    entities: Tuple[str, ...] = ()
+    intent_class: Optional[str] = None
+    interrupt_policy: str = "HARD"
+    priority: int = 0
+    timeout: float = DEFAULT_ACTION_TIMEOUT
+    extractor: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.intent.value
+
+
+class SkillRegistry:
+    def __init__(self):
+        self._specs: Dict[str, SkillSpec] = {}
+        self._resolved: Dict[str, Callable] = {}
+        self._lock = threading.Lock()
+        self.load_ms: Dict[str, float] = {}
+
+        # Derived tables — same objects for the registry's whole life
+        self.required_args: Dict[str, list] = {}
+        self.entity_whitelist: Dict[str, list] = {}
+        self.intent_class: Dict[str, str] = {}
+        self.interrupt_policy: Dict[Intent, str] = {}
+        self.priority: Dict[Intent, int] = {}
+        self.timeouts: Dict[str, float] = {}
+
+    # -------------------------------
+    # Declaration
+    # -------------------------------
+    def register(self, spec: SkillSpec) -> SkillSpec:
+        name = spec.name
+        self._specs[name] = spec
+        self._resolved.pop(f"handler:{name}", None)
+        self._resolved.pop(f"extractor:{name}", None)
+
+        if spec.handler:
+            self.required_args[name] = list(spec.slots)
+            self.entity_whitelist[name] = list(spec.entities)
+            self.timeouts[name] = spec.timeout
+        if spec.intent_class:
+            self.intent_class[name] = spec.intent_class
+        self.interrupt_policy[spec.intent] = spec.interrupt_policy
+        if spec.priority:
+            self.priority[spec.intent] = spec.priority
+        return spec
+
+    def spec(self, name: str) -> Optional[SkillSpec]:
+        return self._specs.get(name)
+
+    def is_action(self, name: str) -> bool:
+        spec = self._specs.get(name)
+        return spec is not None and spec.handler is not None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    # -------------------------------
+    # Dispatch
+    # -------------------------------
+    def handler(self, name: str) -> Callable:
+        """
+        The skill's handler; its module is imported on the first call.
+        KeyError → no action skill registered under this name.
+        """
+        key = f"handler:{name}"
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            spec = self._specs.get(name)
+            if spec is None or spec.handler is None:
+                raise KeyError(name)
+            resolved = self._resolve(key, spec.handler)
+        return resolved
+
+    def extractor(self, name: str) -> Optional[Callable]:
+        spec = self._specs.get(name)
+        if spec is None or spec.extractor is None:
+            return None
+        key = f"extractor:{name}"
+        return self._resolved.get(key) or self._resolve(key, spec.extractor)
+
+    def dispatch(self, name: str, system_actions, args: Dict[str, Any]) -> Dict[str, Any]:
+        return self.handler(name)(system_actions, args)
+
+    def _resolve(self, key: str, target: str) -> Callable:
+        module_name, attr = target.split(":")
+        with self._lock:
+            if key not in self._resolved:
+                started = time.perf_counter()
+                module = importlib.import_module(module_name)
+                self._resolved[key] = getattr(module, attr)
+                if module_name not in self.load_ms:
+                    self.load_ms[module_name] = round((time.perf_counter() - started) * 1000, 2)
+                    logger.debug("Skill module {} loaded in {} ms", module_name, self.load_ms[module_name])
+            return self._resolved[key]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "skills": len(self._specs),
+            "actions": sum(1 for s in self._specs.values() if s.handler),
+            "loaded_modules": dict(self.load_ms),
+        }
+
+
+SKILLS = SkillRegistry()
+
+SYSTEM = "core.skills.system_actions"
+MEDIA = "core.skills.media"
+
+BUILTIN_SKILLS = (
+    # Conversational — answered by the assistant itself
+    SkillSpec(Intent.GREETING, interrupt_policy="IGNORE", priority=1),
+    SkillSpec(Intent.HELP, interrupt_policy="IGNORE", priority=1),
+    SkillSpec(Intent.EXIT, priority=1),
+
+    # System
+    SkillSpec(Intent.OPEN_BROWSER, f"{SYSTEM}:open_browser", slots=("url",), entities=("url", "target"),
+              intent_class="system", priority=2, timeout=5.0),
+    SkillSpec(Intent.SEARCH_WEB, f"{SYSTEM}:search_web", slots=("query",), entities=("query", "target"),
+              intent_class="system", interrupt_policy="SOFT", priority=3, timeout=5.0),
+    SkillSpec(Intent.OPEN_TERMINAL, f"{SYSTEM}:open_terminal", slots=("command",), entities=("command", "target"),
+              intent_class="dangerous", priority=5, timeout=5.0),
+
+    # Filesystem
+    SkillSpec(Intent.OPEN_FILE_MANAGER, f"{SYSTEM}:open_file_manager", slots=("path",),
+              entities=("path", "target"), intent_class="filesystem", priority=3, timeout=5.0),
+    SkillSpec(Intent.LIST_FILES, f"{SYSTEM}:list_files", slots=("path",), entities=("path", "target"),
+              intent_class="filesystem", interrupt_policy="SOFT", priority=4, timeout=10.0),
+    SkillSpec(Intent.OPEN_FILE, f"{SYSTEM}:open_file", slots=("filename",),
+              entities=("filename", "full_path", "target"), intent_class="filesystem", priority=4, timeout=5.0),
+
+    # Media (loaded on first use)
+    SkillSpec(Intent.PLAY_MEDIA, f"{MEDIA}:play_media", slots=("query",), entities=("query", "target"),
+              intent_class="media", priority=3, timeout=5.0, extractor=f"{MEDIA}:extract_media_args"),
+    SkillSpec(Intent.CONTROL_VOLUME, f"{MEDIA}:control_volume", slots=("direction",),
+              entities=("direction", "level"), intent_class="media", priority=3, timeout=3.0,
+              extractor=f"{MEDIA}:extract_volume_args"),
+)
+
+for _spec in BUILTIN_SKILLS:
+    SKILLS.register(_spec)
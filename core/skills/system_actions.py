@@ -3,7 +3,9 @@ import os
 import subprocess
 import platform
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+from core.system.prefetch_cache import PrefetchCache
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,9 @@ class SystemActions:
         self.last_action = None
         self.last_args = None
 
+        # Day 22.2 — filled speculatively by the Prefetcher
+        self.prefetch_cache = PrefetchCache()
+
     # ---------- BROWSER ----------
 
     def open_browser(self, url: str = None, target: str = None) -> Dict[str, Any]:
@@ -22,7 +27,7 @@ class SystemActions:
             if not url:
                 url = "https://google.com"
 
-            webbrowser.open(url)
+            self._browser().open(url)
 
             self._store_last("open_browser", {"url": url, "target": target})
 
@@ -112,7 +117,7 @@ class SystemActions:
                 }
 
             url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
-            webbrowser.open(url)
+            self._browser().open(url)
 
             self._store_last("search_web", {"query": query})
 
@@ -137,8 +142,11 @@ class SystemActions:
 
             if not path and filename:
                 for base in ["~/Downloads", "~/Desktop", "~/Documents"]:
-                    test = os.path.expanduser(f"{base}/{filename}")
-                    if os.path.exists(test):
+                    base_dir = os.path.expanduser(base)
+                    listing = self.prefetch_cache.take(("listdir", base_dir))
+                    test = os.path.join(base_dir, filename)
+                    found = filename in listing if listing is not None else os.path.exists(test)
+                    if found:
                         path = test
                         break
 
@@ -177,7 +185,7 @@ class SystemActions:
             if not path:
                 path = os.getcwd()
 
-            files = os.listdir(path)
+            files = self._listdir(path)
 
             self._store_last("list_files", {"path": path})
 
@@ -194,6 +202,18 @@ class SystemActions:
                 "message": "Failed to list files"
             }
 
+    # ---------- PREFETCH ----------
+
+    def _browser(self):
+        # Prefetched controller, else the module's own lookup
+        return self.prefetch_cache.take(("browser",)) or webbrowser
+
+    def _listdir(self, path: str) -> List[str]:
+        cached = self.prefetch_cache.take(("listdir", path))
+        if cached is not None:
+            return cached
+        return os.listdir(path)
+
     # ---------- CONTEXT ----------
 
     def _store_last(self, action: str, args: Dict[str, Any]):
@@ -202,3 +222,30 @@ class SystemActions:
 
     def get_last_action(self):
         return self.last_action, self.last_args
+
+
+# ---------- SKILL HANDLERS (Day 26.2) ----------
+# Registry entry points: handler(system_actions, args) -> result
+
+def open_browser(actions: SystemActions, args: Dict[str, Any]) -> Dict[str, Any]:
+    return actions.open_browser(args.get("url"), args.get("target"))
+
+
+def search_web(actions: SystemActions, args: Dict[str, Any]) -> Dict[str, Any]:
+    return actions.search_web(args.get("query"), args.get("target"))
+
+
+def open_file_manager(actions: SystemActions, args: Dict[str, Any]) -> Dict[str, Any]:
+    return actions.open_file_manager(args.get("path"), args.get("target"))
+
+
+def list_files(actions: SystemActions, args: Dict[str, Any]) -> Dict[str, Any]:
+    return actions.list_files(args.get("path"), args.get("target"))
+
+
+def open_file(actions: SystemActions, args: Dict[str, Any]) -> Dict[str, Any]:
+    return actions.open_file(args.get("filename"), args.get("full_path"), args.get("target"))
+
+
+def open_terminal(actions: SystemActions, args: Dict[str, Any]) -> Dict[str, Any]:
+    return actions.open_terminal(args.get("command"), args.get("target"))
@@ -0,0 +1,283 @@
+"""
+On-Device Command Recognizer
+Day 25.5 — The fixed command vocabulary without a cloud round trip
+
+The grammar is built from the intent tables the NLP side already uses
+(VERB_ALIASES, HARD_GUARDS, INTENT_KEYWORDS):
+
+    "hello", "help", "exit", ...            single-word intents
+    "open youtube", "launch terminal", ...  open verb × open target
+    "list files"
+
+Open-vocabulary intents (search queries, note contents) are NOT in the
+grammar: they always go to the cloud engine.
+
+Decoders (decode(samples, rate) -> [{"text", "confidence"}, ...] best first):
+- TemplateDecoder → whole-utterance log-mel templates per phrase
+                    (the KeywordSpotter embedding, one matmul per clip)
+- VoskDecoder     → Kaldi decoder restricted to the grammar
+                    (optional dependency, needs a vosk model directory)
+
+LocalFirstEngine tries the command recognizer first and answers
+locally when it is confident, otherwise it asks the cloud engine.
+Reported: share of turns resolved on-device and the latency saved.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.clip import AudioClip
+from core.audio.keyword_spotter import EMBED_FRAMES, N_MELS, embed, log_mel, trim_silence
+from core.audio.recorder import SAMPLE_RATE
+from core.intelligence.intent_scorer import HARD_GUARDS, INTENT_KEYWORDS, VERB_ALIASES
+from core.nlp.intent import Intent
+from core.speech.engine import SpeechEngine
+
+EMPTY = {"text": "", "confidence": 0.0}
+
+SINGLE_WORD_INTENTS = (Intent.GREETING, Intent.HELP, Intent.EXIT)
+OPEN_TARGET_INTENTS = (Intent.OPEN_BROWSER, Intent.OPEN_TERMINAL, Intent.OPEN_FILE_MANAGER)
+
+
+def command_grammar() -> List[str]:
+    """
+    Every phrase the on-device recognizer may return.
+    """
+    phrases = [w for intent in SINGLE_WORD_INTENTS for w in INTENT_KEYWORDS[intent]]
+
+    verbs = [verb for verb, intent in VERB_ALIASES.items() if intent == Intent.OPEN_BROWSER]
+    targets = [w for intent in OPEN_TARGET_INTENTS for w in INTENT_KEYWORDS[intent]]
+    targets += [w for w, intent in HARD_GUARDS.items() if intent in OPEN_TARGET_INTENTS and w not in targets]
+    phrases += [f"{verb} {target}" for verb in verbs for target in targets]
+
+    phrases += [f"{w} files" for w, intent in HARD_GUARDS.items() if intent == Intent.LIST_FILES]
+    return list(dict.fromkeys(phrases))
+
+
+def command_vocabulary(grammar: Optional[Iterable[str]] = None) -> List[str]:
+    grammar = command_grammar() if grammar is None else grammar
+    return sorted({word for phrase in grammar for word in phrase.split()})
+
+
+# -------------------------------
+# Decoders
+# -------------------------------
+class TemplateDecoder:
+    """
+    Nearest enrolled phrase by cosine similarity of whole-utterance
+    embeddings. Confidence = similarity of that phrase.
+    """
+
+    name = "templates"
+
+    def __init__(self, grammar: Optional[Iterable[str]] = None):
+        self.grammar = set(command_grammar() if grammar is None else grammar)
+        self._labels: List[str] = []
+        self._matrix = np.zeros((0, N_MELS * EMBED_FRAMES), dtype=np.float32)
+
+    @property
+    def phrases(self) -> List[str]:
+        return sorted(set(self._labels))
+
+    def enroll(self, phrase: str, examples: Iterable[np.ndarray]):
+        if phrase not in self.grammar:
+            raise ValueError(f"'{phrase}' is not in the command grammar")
+
+        rows = []
+        for samples in examples:
+            features = log_mel(trim_silence(samples))
+            if len(features) >= 4:
+                rows.append(embed(features))
+        if not rows:
+            raise ValueError(f"No usable enrollment audio for '{phrase}'")
+
+        self._matrix = np.vstack([self._matrix, np.array(rows, dtype=np.float32)])
+        self._labels += [phrase] * len(rows)
+
+    def decode(self, samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> List[Dict[str, object]]:
+        if sample_rate != SAMPLE_RATE:
+            raise ValueError(f"Templates are {SAMPLE_RATE} Hz, got {sample_rate} Hz audio")
+
+        features = log_mel(trim_silence(samples))
+        if len(features) < 4 or not self._labels:
+            return []
+
+        scores = self._matrix @ embed(features)
+        best: Dict[str, float] = {}
+        for label, score in zip(self._labels, scores):
+            best[label] = max(best.get(label, -1.0), float(score))
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        return [{"text": text, "confidence": round(max(0.0, score), 4)} for text, score in ranked]
+
+    def save(self, path: str):
+        np.savez(path, matrix=self._matrix, labels=np.array(self._labels))
+
+    @classmethod
+    def load(cls, path: str, grammar: Optional[Iterable[str]] = None) -> "TemplateDecoder":
+        decoder = cls(grammar)
+        data = np.load(path)
+        decoder._matrix = data["matrix"].astype(np.float32)
+        decoder._labels = [str(x) for x in data["labels"]]
+        return decoder
+
+
+class VoskDecoder:
+    """
+    Kaldi decoding restricted to the command grammar; anything else
+    comes back as "[unk]" and is rejected.
+    """
+
+    name = "vosk"
+
+    def __init__(self, model_path: str, grammar: Optional[Iterable[str]] = None):
+        from vosk import KaldiRecognizer, Model
+
+        self._recognizer_cls = KaldiRecognizer
+        self.model = Model(model_path)
+        self.grammar = set(command_grammar() if grammar is None else grammar)
+        self._grammar_json = json.dumps(sorted(self.grammar) + ["[unk]"])
+
+    def decode(self, samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> List[Dict[str, object]]:
+        recognizer = self._recognizer_cls(self.model, sample_rate, self._grammar_json)
+        recognizer.SetWords(True)
+        recognizer.AcceptWaveform(np.asarray(samples, dtype=np.int16).tobytes())
+        result = json.loads(recognizer.FinalResult())
+
+        text = result.get("text", "").strip()
+        if text not in self.grammar:
+            return []
+        words = result.get("result") or []
+        confidence = min((w.get("conf", 0.0) for w in words), default=0.0)
+        return [{"text": text, "confidence": round(float(confidence), 4)}]
+
+
+def load_command_decoder(path: str):
+    """
+    Saved templates (.npz) or a vosk model directory.
+    """
+    if os.path.isdir(path):
+        return VoskDecoder(path)
+    return TemplateDecoder.load(path)
+
+
+# -------------------------------
+# Engines
+# -------------------------------
+class CommandRecognizer(SpeechEngine):
+    """
+    Recognize-only engine over a grammar-constrained decoder.
+    """
+
+    name = "command"
+
+    def __init__(self, decoder):
+        self.decoder = decoder
+
+    def recognize_n_best(self, clip: AudioClip, n: int = 5) -> List[Dict[str, object]]:
+        samples = np.frombuffer(clip.pcm, dtype=np.int16)
+        return self.decoder.decode(samples, clip.sample_rate)[:n]
+
+    def recognize(self, clip: AudioClip) -> Dict[str, object]:
+        best = self.recognize_n_best(clip, n=1)
+        return best[0] if best else dict(EMPTY)
+
+
+class LocalFirstEngine(SpeechEngine):
+    """
+    Capture through the cloud engine; recognize on-device first.
+    """
+
+    name = "local_first"
+
+    def __init__(
+        self,
+        local: SpeechEngine,
+        cloud: SpeechEngine,
+        confidence_floor: float = 0.6,
+        history: int = 500,
+    ):
+        self.local = local
+        self.cloud = cloud
+        self.confidence_floor = confidence_floor
+
+        self.stats = {"turns": 0, "on_device": 0, "fallbacks": 0, "local_errors": 0}
+        self._local_ms = deque(maxlen=history)       # turns answered on-device
+        self._probe_ms = deque(maxlen=history)       # local attempts that fell back
+        self._cloud_ms = deque(maxlen=history)
+
+    # -------------------------------
+    # SpeechEngine
+    # -------------------------------
+    def listen(self, timeout: Optional[float] = None) -> Optional[AudioClip]:
+        return self.cloud.listen(timeout)
+
+    def skip_to(self, position: int):
+        self.cloud.skip_to(position)
+
+    def recognize(self, clip: AudioClip) -> Dict[str, object]:
+        return self._resolve(clip, 1)[0]
+
+    def recognize_n_best(self, clip: AudioClip, n: int = 5) -> List[Dict[str, object]]:
+        return [r for r in self._resolve(clip, n) if r.get("text")]
+
+    def close(self):
+        self.local.close()
+        self.cloud.close()
+
+    # -------------------------------
+    # Internals
+    # -------------------------------
+    def _resolve(self, clip: AudioClip, n: int) -> List[Dict[str, object]]:
+        self.stats["turns"] += 1
+
+        started = time.perf_counter()
+        try:
+            local = self.local.recognize_n_best(clip, n)
+        except Exception as e:
+            self.stats["local_errors"] += 1
+            logger.warning("{} recognition failed: {}", self.local.name, e)
+            local = []
+        local_ms = (time.perf_counter() - started) * 1000
+
+        if local and local[0].get("text") and local[0].get("confidence", 0.0) >= self.confidence_floor:
+            self.stats["on_device"] += 1
+            self._local_ms.append(local_ms)
+            return [dict(r, engine=self.local.name) for r in local]
+
+        self.stats["fallbacks"] += 1
+        self._probe_ms.append(local_ms)
+        cloud_started = time.perf_counter()
+        results = self.cloud.recognize_n_best(clip, n) if n > 1 else [self.cloud.recognize(clip)]
+        self._cloud_ms.append((time.perf_counter() - cloud_started) * 1000)
+        return [dict(r, engine=self.cloud.name) for r in results] or [dict(EMPTY, engine=self.cloud.name)]
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+    def report(self) -> Dict[str, object]:
+        def p50(values):
+            return round(float(np.percentile(values, 50)), 1) if values else None
+
+        s = self.stats
+        local_p50, cloud_p50 = p50(list(self._local_ms)), p50(list(self._cloud_ms))
+
+        # Each on-device turn saved a typical cloud call; each fallback paid a local probe
+        saved = (cloud_p50 or 0.0) * len(self._local_ms) - sum(self._local_ms)
+        overhead = sum(self._probe_ms)
+        return {
+            **s,
+            "on_device_share": round(s["on_device"] / s["turns"], 3) if s["turns"] else 0.0,
+            "local_ms_p50": local_p50,
+            "probe_ms_p50": p50(list(self._probe_ms)),
+            "cloud_ms_p50": cloud_p50,
+            "latency_saved_ms": round(saved, 1) if cloud_p50 is not None else None,
+            "fallback_overhead_ms": round(overhead, 1),
+            "net_saved_ms_per_turn": round((saved - overhead) / s["turns"], 1)
+            if s["turns"] and cloud_p50 is not None else None,
+        }
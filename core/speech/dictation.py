@@ -0,0 +1,263 @@
+"""
+Dictation
+Day 25.6 — Long-form speech in overlapping chunks, saved as it is recognized
+
+    ring → RingReader → VAD per frame
+        pause ≥ pause_ms after min_chunk_seconds   → close chunk at the pause
+        chunk reaches max_chunk_seconds            → force a split at the
+                                                     quietest recent frame
+        silence ≥ end_silence_seconds              → dictation ends
+    every chunk starts overlap_ms before the previous boundary
+        → recognizer pool (max_in_flight chunks at a time)
+        → results committed strictly in chunk order, the words repeated
+          across the overlap dropped, then sink(text) — e.g. a note append
+
+Only the tail words of the transcript and the chunks still being
+recognized are held in memory, so an hour of dictation costs the same
+as a minute. Text reaches the sink one chunk-recognition after the
+chunk closes.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.clip import AudioClip
+from core.audio.vad import VoiceActivityDetector, frame_energy_db
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+
+
+def stitch(tail: List[str], words: List[str], max_overlap: int = 8) -> List[str]:
+    """
+    words without the prefix that repeats the end of tail
+    (the same audio recognized at the end of one chunk and the start of the next).
+    """
+    lowered_tail = [w.lower() for w in tail[-max_overlap:]]
+    lowered = [w.lower() for w in words]
+    for k in range(min(len(lowered_tail), len(lowered)), 0, -1):
+        if lowered_tail[-k:] == lowered[:k]:
+            return words[k:]
+    return words
+
+
+class Dictation:
+    def __init__(
+        self,
+        reader,
+        recognizer,
+        sink: Callable[[str], None],
+        vad: Optional[VoiceActivityDetector] = None,
+        min_chunk_seconds: float = 2.0,
+        max_chunk_seconds: float = 8.0,
+        pause_ms: int = 300,
+        overlap_ms: int = 500,
+        end_silence_seconds: float = 3.0,
+        start_timeout: float = 5.0,
+        max_in_flight: int = 3,
+        history: int = 200,
+    ):
+        self.reader = reader
+        self.recorder = reader.recorder
+        self.recognizer = recognizer
+        self.sink = sink
+        self.vad = vad or VoiceActivityDetector()
+
+        rate, frame = self.recorder.sample_rate, self.vad.frame_samples
+        # A chunk must still be in the ring when it is copied out
+        max_chunk_seconds = min(max_chunk_seconds, self.recorder.capacity / rate - overlap_ms / 1000)
+        self.min_chunk = int(min_chunk_seconds * rate)
+        self.max_chunk = int(max_chunk_seconds * rate)
+        self.pause_frames = max(1, int(pause_ms * rate / 1000 / frame))
+        self.overlap = int(overlap_ms * rate / 1000)
+        self.end_silence_frames = int(end_silence_seconds * rate / frame)
+        self.start_timeout_frames = int(start_timeout * rate / frame)
+
+        self._pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="dictation")
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+        self._done: Dict[int, str] = {}
+        self._closed_at: Dict[int, float] = {}
+        self._next_commit = 0
+        self._tail: List[str] = []
+        self._in_flight = 0
+        # Committed text waits here; one thread at a time hands it to the sink
+        self._outbox: deque = deque()
+        self._delivering = False
+        self._stop = threading.Event()
+
+        self.stats = {
+            "chunks": 0, "forced_splits": 0, "words": 0, "overlap_words_dropped": 0,
+            "errors": 0, "audio_seconds": 0.0, "max_in_flight": 0,
+        }
+        self._latency_ms = deque(maxlen=history)
+        # Recent frame energies, to pick the split point of a forced split
+        self._energy = deque(maxlen=max(1, int(rate / frame)))
+
+    # -------------------------------
+    # Control
+    # -------------------------------
+    def stop(self):
+        self._stop.set()
+
+    def run(self) -> Dict[str, object]:
+        """
+        Chunk until the speaker stops; returns once every chunk is committed.
+        """
+        try:
+            self._chunk_loop()
+        finally:
+            self._pool.shutdown(wait=True)
+        return self.report()
+
+    # -------------------------------
+    # Chunking
+    # -------------------------------
+    def _chunk_loop(self):
+        frame = self.vad.frame_samples
+        chunk_start: Optional[int] = None
+        silence = heard = waited = 0
+
+        while not self._stop.is_set() and not GLOBAL_INTERRUPT.is_triggered():
+            view = self.reader.read_exact(frame, timeout=0.5)
+            if view is None:
+                if self.recorder.is_running():
+                    continue
+                break   # end of stream
+
+            samples = np.frombuffer(view, dtype=np.int16)
+            is_speech = bool(self.vad.classify(samples)[0])
+            self._energy.append((self.reader.cursor, float(frame_energy_db(samples, frame)[0])))
+            position = self.reader.cursor
+
+            if chunk_start is None:
+                if not is_speech:
+                    waited += 1
+                    if heard == 0 and waited >= self.start_timeout_frames:
+                        break
+                    if heard and waited >= self.end_silence_frames:
+                        break
+                    continue
+                chunk_start = max(position - frame - self.overlap, self.recorder.write_position - self.recorder.capacity)
+                silence = waited = 0
+                heard += 1
+
+            silence = 0 if is_speech else silence + 1
+            length = position - chunk_start
+
+            if silence >= self.pause_frames and length >= self.min_chunk:
+                self._submit(chunk_start, position)
+                chunk_start = None
+                waited = silence
+            elif length >= self.max_chunk:
+                split = self._quietest()
+                self._submit(chunk_start, split, forced=True)
+                chunk_start = split - self.overlap
+
+            if chunk_start is not None and silence >= self.end_silence_frames:
+                break
+
+        if chunk_start is not None and self.reader.cursor - chunk_start > frame:
+            self._submit(chunk_start, self.reader.cursor)
+
+    def _quietest(self) -> int:
+        """
+        End of the lowest-energy frame in the last second.
+        """
+        return min(self._energy, key=lambda item: item[1])[0]
+
+    # -------------------------------
+    # Recognition
+    # -------------------------------
+    def _submit(self, start: int, end: int, forced: bool = False):
+        # Copy out: the ring keeps moving while the chunk waits for a worker
+        pcm = self.recorder.view(start, end - start).tobytes()
+        clip = AudioClip(pcm=pcm, sample_rate=self.recorder.sample_rate, start=start, speech_end=end, end=end)
+
+        self._slots.acquire()
+        with self._lock:
+            index = self.stats["chunks"]
+            self.stats["chunks"] += 1
+            self.stats["forced_splits"] += int(forced)
+            self.stats["audio_seconds"] += clip.duration
+            self._closed_at[index] = time.perf_counter()
+            self._in_flight += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self._in_flight)
+
+        future = self._pool.submit(self.recognizer.recognize, clip)
+        future.add_done_callback(lambda f, i=index: self._finished(i, f))
+
+    def _finished(self, index: int, future):
+        try:
+            text = future.result().get("text", "")
+        except Exception as e:
+            logger.error("Dictation chunk {} failed: {}", index, e)
+            text = ""
+            with self._lock:
+                self.stats["errors"] += 1
+
+        with self._lock:
+            self._in_flight -= 1
+            self._done[index] = text
+            self._commit()
+        self._slots.release()
+        self._deliver()
+
+    def _commit(self):
+        """
+        Stitch finished chunks in order into the outbox (caller holds the lock).
+        """
+        while self._next_commit in self._done:
+            index = self._next_commit
+            words = self._done.pop(index).split()
+            kept = stitch(self._tail, words)
+            self.stats["overlap_words_dropped"] += len(words) - len(kept)
+            self._next_commit += 1
+
+            self._latency_ms.append((time.perf_counter() - self._closed_at.pop(index)) * 1000)
+            if not kept:
+                continue
+            self._tail = (self._tail + kept)[-16:]
+            self.stats["words"] += len(kept)
+            self._outbox.append(" ".join(kept))
+
+    def _deliver(self):
+        """
+        Pass committed text to the sink outside the lock, in commit order:
+        a slow sink (a note write) never holds up the recognizer callbacks.
+        """
+        with self._lock:
+            if self._delivering:
+                return      # the thread already delivering picks ours up too
+            self._delivering = True
+
+        while True:
+            with self._lock:
+                if not self._outbox:
+                    self._delivering = False
+                    return
+                text = self._outbox.popleft()
+            try:
+                self.sink(text)
+            except Exception as e:
+                logger.error("Dictation sink failed: {}", e)
+                with self._lock:
+                    self.stats["errors"] += 1
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+    def report(self) -> Dict[str, object]:
+        with self._lock:
+            latency = np.array(self._latency_ms, dtype=float)
+            return {
+                **self.stats,
+                "audio_seconds": round(self.stats["audio_seconds"], 2),
+                "overruns": self.reader.overruns,
+                "text_latency_ms_p50": round(float(np.percentile(latency, 50)), 1) if len(latency) else None,
+                "text_latency_ms_p95": round(float(np.percentile(latency, 95)), 1) if len(latency) else None,
+            }
@@ -0,0 +1,111 @@
+"""
+Speech Engine Interface
+Day 23.3 — One protocol for every recognizer backend
+
+    listen()              -> AudioClip | None   (capture one utterance)
+    recognize(clip)       -> {"text", "confidence"}
+    recognize_n_best(clip)-> [{"text", "confidence"}, ...]  best first
+    stream_partials(clip) -> iterator of growing partial transcripts
+    listen_once()         -> str   (what InputController calls)
+
+Backends:
+- "google" → GoogleSpeechEngine (microphone + Google Web Speech)
+- "file"   → FileSpeechEngine   (WAV/transcript pairs, offline, reproducible)
+- "worker" → WorkerSpeechEngine (any of the above, in a separate process)
+"""
+
+import time
+from typing import Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from core.audio.clip import AudioClip
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+
+
+class SpeechEngine:
+    name = "base"
+
+    # Most recent capture, kept for spooling / diagnostics
+    last_clip: Optional[AudioClip] = None
+
+    def listen(self, timeout: Optional[float] = None) -> Optional[AudioClip]:
+        raise NotImplementedError
+
+    def recognize(self, clip: AudioClip) -> Dict[str, object]:
+        raise NotImplementedError
+
+    def recognize_n_best(self, clip: AudioClip, n: int = 5) -> List[Dict[str, object]]:
+        result = self.recognize(clip)
+        return [result] if result.get("text") else []
+
+    def stream_partials(self, clip: AudioClip) -> Iterator[str]:
+        """
+        Backends without streaming yield only the final text.
+        """
+        text = self.recognize(clip).get("text", "")
+        if text:
+            yield text
+
+    def skip_to(self, position: int):
+        """
+        Streaming backends: start the next capture at this ring position
+        (e.g. right after an on-device wake word). No-op otherwise.
+        """
+
+    def close(self):
+        pass
+
+    def listen_once(self) -> str:
+        # If interrupt already active, do not listen
+        if GLOBAL_INTERRUPT.is_triggered():
+            logger.warning("Listen aborted due to global interrupt")
+            return ""
+
+        self.last_clip = None
+        clip = self.listen()
+        if clip is None:
+            return ""
+        self.last_clip = clip
+
+        # Check interrupt again after capture
+        if GLOBAL_INTERRUPT.is_triggered():
+            logger.warning("Audio captured but interrupt triggered — discarding")
+            return ""
+
+        try:
+            started = time.perf_counter()
+            text = self.recognize(clip).get("text", "")
+            clip.meta["recognize_seconds"] = time.perf_counter() - started
+        except Exception as e:
+            logger.error("{} recognition failed: {}", self.name, e)
+            return ""
+
+        # Final interrupt check before returning text
+        if GLOBAL_INTERRUPT.is_triggered():
+            logger.warning("Interrupt triggered before returning recognized text")
+            return ""
+
+        if text:
+            logger.info("{} heard: {}", self.name, text)
+        return text
+
+
+def create_engine(name: str, **kwargs) -> SpeechEngine:
+    """
+    Build a backend by config name (imports lazily so optional
+    dependencies are only needed for the backend actually used).
+    """
+    if name == "google":
+        from core.speech.google_engine import GoogleSpeechEngine
+        return GoogleSpeechEngine(**kwargs)
+
+    if name == "file":
+        from core.speech.file_engine import FileSpeechEngine
+        return FileSpeechEngine(**kwargs)
+
+    if name == "worker":
+        from core.speech.worker import WorkerSpeechEngine
+        return WorkerSpeechEngine(**kwargs)
+
+    raise ValueError(f"Unknown speech engine: {name}")
@@ -0,0 +1,118 @@
+"""
+File-Backed Speech Engine
+Day 23.3 — Deterministic, offline stand-in for the microphone + recognizer
+
+Corpus layout (one utterance per pair):
+    turn_on_wifi.wav   mono 16-bit PCM
+    turn_on_wifi.txt   line 1 = transcript, further lines = n-best alternates
+
+Utterances are replayed in sorted order. Simulated latency is
+latency + jitter × U(0, 1) from a seeded RNG, so runs repeat exactly.
+latency_script replaces that with explicit per-call delays (cycled),
+for stand-in engines with a scripted slow tail.
+"""
+
+import glob
+import os
+import random
+import time
+import wave
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from core.audio.clip import AudioClip
+from core.speech.engine import SpeechEngine
+
+
+def load_corpus(directory: str) -> List[Tuple[str, str]]:
+    """
+    (wav_path, txt_path) pairs; WAVs without a transcript are skipped.
+    """
+    pairs = []
+    for wav_path in sorted(glob.glob(os.path.join(directory, "*.wav"))):
+        txt_path = os.path.splitext(wav_path)[0] + ".txt"
+        if os.path.exists(txt_path):
+            pairs.append((wav_path, txt_path))
+    return pairs
+
+
+class FileSpeechEngine(SpeechEngine):
+    name = "file"
+
+    def __init__(
+        self,
+        corpus_dir: Optional[str] = None,
+        pairs: Optional[List[Tuple[str, str]]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        realtime: bool = False,
+        loop: bool = False,
+        seed: int = 0,
+        latency_script: Optional[List[float]] = None,
+        name: str = "file",
+    ):
+        self.name = name
+        self.latency_script = latency_script
+        self._calls = 0
+        self.pairs = pairs if pairs is not None else load_corpus(corpus_dir or ".")
+        self.latency = latency
+        self.jitter = jitter
+        self.realtime = realtime      # listen() takes as long as the audio
+        self.loop = loop
+
+        self._rng = random.Random(seed)
+        self._index = 0
+
+    def _delay(self):
+        if self.latency_script:
+            delay = self.latency_script[self._calls % len(self.latency_script)]
+            self._calls += 1
+        else:
+            delay = self.latency + self.jitter * self._rng.random()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def remaining(self) -> int:
+        return len(self.pairs) - self._index
+
+    def listen(self, timeout: Optional[float] = None) -> Optional[AudioClip]:
+        if self._index >= len(self.pairs):
+            if not self.loop or not self.pairs:
+                return None
+            self._index = 0
+
+        wav_path, txt_path = self.pairs[self._index]
+        self._index += 1
+
+        with wave.open(wav_path, "rb") as wav:
+            rate = wav.getframerate()
+            pcm = wav.readframes(wav.getnframes())
+        with open(txt_path, "r", encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+
+        clip = AudioClip(pcm=pcm, sample_rate=rate, meta={"source": wav_path, "transcripts": lines})
+        clip.end = clip.speech_end = len(pcm) // clip.sample_width
+
+        if self.realtime:
+            time.sleep(clip.duration)
+        return clip
+
+    def recognize_n_best(self, clip: AudioClip, n: int = 5) -> List[Dict[str, object]]:
+        self._delay()
+        lines = clip.meta.get("transcripts", [])[:n]
+        # Alternates get decreasing confidence
+        return [{"text": t, "confidence": round(0.95 ** (i + 1), 4)} for i, t in enumerate(lines)]
+
+    def recognize(self, clip: AudioClip) -> Dict[str, object]:
+        best = self.recognize_n_best(clip, n=1)
+        return best[0] if best else {"text": "", "confidence": 0.0}
+
+    def stream_partials(self, clip: AudioClip) -> Iterator[str]:
+        lines = clip.meta.get("transcripts", [])
+        words = lines[0].split() if lines else []
+        for i in range(1, len(words) + 1):
+            # Spread the recognizer latency across the partials
+            delay = self.latency / max(1, len(words))
+            if delay > 0:
+                time.sleep(delay)
+            yield " ".join(words[:i])
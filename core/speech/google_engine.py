@@ -1,41 +1,102 @@
+from typing import Dict, List, Optional
+
 import speech_recognition as sr
 from loguru import logger
 
-from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.audio.clip import AudioClip
+from core.audio.device_manager import ManagedAudioSource
+from core.audio.vad import AdaptiveEndpointer, VoiceActivityDetector, capture_utterance
+from core.speech.engine import SpeechEngine
+from core.speech.google_client import GoogleSpeechClient
+
 
+class GoogleSpeechEngine(SpeechEngine):
+    name = "google"
 
-class GoogleSpeechEngine:
-    def __init__(self):
+    def __init__(
+        self,
+        recorder=None,
+        device_index: Optional[int] = None,
+        device_manager=None,
+        noise_floor=None,
+        client: Optional[GoogleSpeechClient] = None,
+        capture: bool = True,
+    ):
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone(device_index=9)
+        self.source = None
+
+        # Day 24.5: raw PCM upload, no external flac encoder per turn
+        self.client = client or GoogleSpeechClient()
+
+        # Day 24.6: connect before the first command, keep it warm
+        self.client.warm_async()
+
+        # Day 23.6: threshold comes from the background estimator,
+        # never from a blocking adjust_for_ambient_noise()
+        self.noise_floor = noise_floor
+        if noise_floor is not None:
+            self.recognizer.dynamic_energy_threshold = False
+
+        # Day 23.2: with a ring recorder, utterances are cut by the
+        # adaptive endpointer instead of speech_recognition's fixed pause
+        self.recorder = recorder
+        if recorder is not None:
+            self.reader = recorder.reader("asr")
+            self.vad = VoiceActivityDetector(noise_floor=noise_floor)
+            self.endpointer = AdaptiveEndpointer()
+            self.microphone = None
+        elif device_manager is not None:
+            # Day 23.5: one persistent stream instead of a new one per turn
+            self.microphone = None
+            stream = noise_floor.tap(device_manager) if noise_floor is not None else device_manager
+            self.source = ManagedAudioSource(stream)
+        elif capture:
+            self.microphone = sr.Microphone(device_index=device_index)
+        else:
+            # Recognize-only (hedge, replay): clips come from elsewhere
+            self.microphone = None
+
         logger.info("Google Speech Engine initialized")
 
-    def listen_once(self) -> str:
-        # If interrupt already active, do not listen
-        if GLOBAL_INTERRUPT.is_triggered():
-            logger.warning("Listen aborted due to global interrupt")
-            return ""
+    def listen(self, timeout: Optional[float] = None) -> Optional[AudioClip]:
+        if self.noise_floor is not None:
+            self.recognizer.energy_threshold = self.noise_floor.energy_threshold
 
-        with self.microphone as source:
+        if self.source is not None:
             logger.info("Listening (Google)...")
-            audio = self.recognizer.listen(source)
+            audio = self.recognizer.listen(self.source, timeout=timeout)
+            return AudioClip(pcm=audio.frame_data, sample_rate=audio.sample_rate, sample_width=audio.sample_width)
+
+        if self.recorder is None:
+            with self.microphone as source:
+                logger.info("Listening (Google)...")
+                audio = self.recognizer.listen(source, timeout=timeout)
+            return AudioClip(
+                pcm=audio.frame_data,
+                sample_rate=audio.sample_rate,
+                sample_width=audio.sample_width,
+            )
 
-        # Check interrupt again after capture
-        if GLOBAL_INTERRUPT.is_triggered():
-            logger.warning("Audio captured but interrupt triggered — discarding")
-            return ""
+        logger.info("Listening (Google, streaming)...")
+        clip = capture_utterance(self.reader, self.vad, self.endpointer, timeout=timeout or 10.0)
+        if clip is not None:
+            logger.debug(
+                "Utterance {:.2f}s, endpoint delay {:.0f} ms",
+                clip.duration, clip.endpoint_delay * 1000,
+            )
+        return clip
 
-        try:
-            text = self.recognizer.recognize_google(audio)
+    def skip_to(self, position: int):
+        if self.recorder is not None:
+            self.reader.cursor = max(self.reader.cursor, position)
 
-            # Final interrupt check before returning text
-            if GLOBAL_INTERRUPT.is_triggered():
-                logger.warning("Interrupt triggered before returning recognized text")
-                return ""
+    def recognize(self, clip: AudioClip) -> Dict[str, object]:
+        best = self.recognize_n_best(clip, n=1)
+        return best[0] if best else {"text": "", "confidence": 0.0}
 
-            logger.info("Google heard: {}", text)
-            return text
+    def recognize_n_best(self, clip: AudioClip, n: int = 5) -> List[Dict[str, object]]:
+        # The ring view is the request body as-is
+        return self.client.recognize(clip.pcm, clip.sample_rate)[:n]
 
-        except Exception as e:
-            logger.error("Google Speech Recognition failed: {}", e)
-            return ""
+    def close(self):
+        self.client.close()
@@ -0,0 +1,188 @@
+"""
+Hedged Recognition
+Day 24.1 — Same audio to two engines, first good result wins
+
+    t = 0            primary.recognize(clip)
+    t = hedge_delay  still nothing good? → secondary.recognize(clip)
+    first result with text and confidence >= floor is returned,
+    the other call is cancelled (or, if already running, ignored)
+
+If neither result clears the floor, the most confident non-empty one
+is returned once both have finished.
+
+Tracked per engine: latency distribution (p50 / p95 / p99), calls, wins.
+Tracked overall: how often the hedge fired and how often it won.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.clip import AudioClip
+from core.speech.engine import SpeechEngine
+
+EMPTY = {"text": "", "confidence": 0.0}
+
+
+class HedgedRecognizer(SpeechEngine):
+    name = "hedged"
+
+    def __init__(
+        self,
+        primary: SpeechEngine,
+        secondary: SpeechEngine,
+        hedge_delay: float = 0.3,
+        confidence_floor: float = 0.5,
+        timeout: float = 10.0,
+        history: int = 500,
+    ):
+        if primary.name == secondary.name:
+            raise ValueError("Hedged engines need distinct names for their stats")
+
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_delay = hedge_delay
+        self.confidence_floor = confidence_floor
+        self.timeout = timeout
+
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="asr-hedge")
+        self._lock = threading.Lock()
+        self._latency = {e.name: deque(maxlen=history) for e in (primary, secondary)}
+        self.stats = {
+            "requests": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "wins": {primary.name: 0, secondary.name: 0},
+            "cancelled": 0,
+            "no_result": 0,
+        }
+
+    # -------------------------------
+    # SpeechEngine
+    # -------------------------------
+    def listen(self, timeout: Optional[float] = None) -> Optional[AudioClip]:
+        return self.primary.listen(timeout)
+
+    def skip_to(self, position: int):
+        self.primary.skip_to(position)
+
+    def recognize(self, clip: AudioClip) -> Dict[str, object]:
+        with self._lock:
+            self.stats["requests"] += 1
+
+        started = time.perf_counter()
+        pending = {self._submit(self.primary, clip): self.primary}
+        finished: List[Dict[str, object]] = []
+        hedged = False
+        deadline = started + self.timeout
+
+        while pending:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+
+            wait_for = deadline - now
+            if not hedged:
+                wait_for = min(wait_for, max(0.0, started + self.hedge_delay - now))
+
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                engine = pending.pop(future)
+                result = self._result(future, engine)
+                if result is None:
+                    continue
+                if self._good(result):
+                    self._cancel(pending)
+                    return self._won(result, engine, hedged, started)
+                finished.append(result)
+
+            # Fire the hedge once the delay passes (or the primary failed early)
+            if not hedged and (time.perf_counter() - started >= self.hedge_delay or not pending):
+                hedged = True
+                with self._lock:
+                    self.stats["hedges"] += 1
+                pending[self._submit(self.secondary, clip)] = self.secondary
+
+        self._cancel(pending)
+
+        candidates = [r for r in finished if r.get("text")]
+        if not candidates:
+            with self._lock:
+                self.stats["no_result"] += 1
+            return dict(EMPTY, engine=None, latency=time.perf_counter() - started, hedged=hedged)
+
+        best = max(candidates, key=lambda r: r.get("confidence", 0.0))
+        engine = self.primary if best["engine"] == self.primary.name else self.secondary
+        return self._won(best, engine, hedged, started)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------------
+    # Internals
+    # -------------------------------
+    def _submit(self, engine: SpeechEngine, clip: AudioClip):
+        return self._executor.submit(self._timed, engine, clip)
+
+    def _timed(self, engine: SpeechEngine, clip: AudioClip) -> Dict[str, object]:
+        started = time.perf_counter()
+        try:
+            result = engine.recognize(clip)
+        finally:
+            # Losers are timed too: the distribution covers every call
+            with self._lock:
+                self._latency[engine.name].append(time.perf_counter() - started)
+        return dict(result, engine=engine.name)
+
+    def _result(self, future, engine: SpeechEngine) -> Optional[Dict[str, object]]:
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning("{} recognition failed: {}", engine.name, e)
+            return None
+
+    def _good(self, result: Dict[str, object]) -> bool:
+        return bool(result.get("text")) and result.get("confidence", 0.0) >= self.confidence_floor
+
+    def _cancel(self, pending):
+        for future in pending:
+            if future.cancel():
+                with self._lock:
+                    self.stats["cancelled"] += 1
+
+    def _won(self, result, engine: SpeechEngine, hedged: bool, started: float) -> Dict[str, object]:
+        with self._lock:
+            self.stats["wins"][engine.name] += 1
+            if engine is self.secondary:
+                self.stats["hedge_wins"] += 1
+        return dict(result, latency=time.perf_counter() - started, hedged=hedged)
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+    def latency_percentiles(self, engine_name: str) -> Dict[str, float]:
+        with self._lock:
+            samples = np.array(self._latency.get(engine_name, ()), dtype=float)
+        if not len(samples):
+            return {"count": 0}
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99]) * 1000
+        return {"count": len(samples), "p50_ms": round(p50, 1), "p95_ms": round(p95, 1), "p99_ms": round(p99, 1)}
+
+    def report(self) -> Dict[str, object]:
+        hedges = self.stats["hedges"]
+        return {
+            "requests": self.stats["requests"],
+            "hedges": hedges,
+            "hedge_rate": hedges / self.stats["requests"] if self.stats["requests"] else 0.0,
+            "hedge_win_rate": self.stats["hedge_wins"] / hedges if hedges else 0.0,
+            "wins": dict(self.stats["wins"]),
+            "cancelled": self.stats["cancelled"],
+            "no_result": self.stats["no_result"],
+            "latency": {name: self.latency_percentiles(name) for name in self._latency},
+        }
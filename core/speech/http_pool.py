@@ -0,0 +1,261 @@
+"""
+Keep-alive HTTP Pool
+Day 24.6 — Pay DNS + TCP + TLS once, not once per command
+
+urllib opens (and tears down) a fresh connection for every request:
+DNS lookup, TCP connect and, over HTTPS, a TLS handshake — all on the
+critical path between "user stopped talking" and "transcript".
+
+HTTPPool keeps a few HTTP/1.1 connections open to one origin:
+- prewarm()       → connect ahead of the first command
+- request()       → reuse an idle connection; retry once if the
+                    server closed it while idle
+- refresh_idle()  → reopen connections idle longer than max_idle
+                    (servers drop them anyway), off the critical path
+- every request records dns / connect / tls / send / response timings
+"""
+
+import http.client
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+from loguru import logger
+
+PHASES = ("dns_ms", "connect_ms", "tls_ms", "send_ms", "response_ms", "total_ms")
+
+# A reused connection the server already closed fails with one of these
+STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError, BrokenPipeError)
+
+
+class TimedConnection(http.client.HTTPConnection):
+    """
+    HTTPConnection whose connect() is split into timed phases.
+    With tls_context set, the socket is wrapped (HTTPS).
+    """
+
+    def __init__(self, host, port=None, timeout=10.0, tls_context: Optional[ssl.SSLContext] = None):
+        super().__init__(host, port, timeout=timeout)
+        self.tls_context = tls_context
+        self.timings = {"dns_ms": 0.0, "connect_ms": 0.0, "tls_ms": 0.0}
+        self.last_used = 0.0
+
+    def connect(self):
+        t0 = time.perf_counter()
+        family, socktype, proto, _, address = socket.getaddrinfo(
+            self.host, self.port, type=socket.SOCK_STREAM
+        )[0]
+        t1 = time.perf_counter()
+
+        sock = socket.socket(family, socktype, proto)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(address)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            sock.close()
+            raise
+        t2 = time.perf_counter()
+
+        if self.tls_context is not None:
+            sock = self.tls_context.wrap_socket(sock, server_hostname=self.host)
+        t3 = time.perf_counter()
+
+        self.sock = sock
+        self.last_used = time.monotonic()
+        self.timings = {
+            "dns_ms": (t1 - t0) * 1000,
+            "connect_ms": (t2 - t1) * 1000,
+            "tls_ms": (t3 - t2) * 1000 if self.tls_context is not None else 0.0,
+        }
+
+    @property
+    def is_open(self) -> bool:
+        return self.sock is not None
+
+
+class HTTPPool:
+    def __init__(
+        self,
+        url: str,
+        size: int = 2,
+        max_idle: float = 30.0,
+        timeout: float = 10.0,
+        tls_context: Optional[ssl.SSLContext] = None,
+    ):
+        parts = urlsplit(url)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.scheme == "https" else 80)
+        self.size = size
+        self.max_idle = max_idle
+        self.timeout = timeout
+        if self.scheme == "https" and tls_context is None:
+            tls_context = ssl.create_default_context()
+        self.tls_context = tls_context
+
+        self._idle: "deque[TimedConnection]" = deque()
+        self._lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.stats = {"requests": 0, "connections": 0, "reused": 0, "refreshed": 0, "retries": 0}
+        self.timings: "deque[Dict[str, float]]" = deque(maxlen=200)
+
+    # -------------------------------
+    # Connections
+    # -------------------------------
+    def _new_connection(self) -> TimedConnection:
+        conn = TimedConnection(self.host, self.port, timeout=self.timeout, tls_context=self.tls_context)
+        conn.connect()
+        with self._lock:
+            self.stats["connections"] += 1
+        return conn
+
+    def _acquire(self) -> Tuple[TimedConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn = self._idle.pop()    # most recently used first
+                if now - conn.last_used <= self.max_idle:
+                    return conn, True
+                conn.close()
+        return self._new_connection(), False
+
+    def _release(self, conn: TimedConnection):
+        conn.last_used = time.monotonic()
+        with self._lock:
+            if conn.is_open and len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def prewarm(self, count: int = 1) -> int:
+        """
+        Open up to `count` connections now. Returns how many are idle.
+        """
+        while self.idle_count() < min(count, self.size):
+            self._release(self._new_connection())
+        return self.idle_count()
+
+    def refresh_idle(self) -> int:
+        """
+        Replace connections idle longer than max_idle with fresh ones.
+        """
+        now = time.monotonic()
+        with self._lock:
+            stale = [c for c in self._idle if now - c.last_used > self.max_idle]
+            for conn in stale:
+                self._idle.remove(conn)
+        for conn in stale:
+            conn.close()
+            try:
+                self._release(self._new_connection())
+            except OSError as e:
+                logger.debug("Keep-alive refresh failed: {}", e)
+                break
+            with self._lock:
+                self.stats["refreshed"] += 1
+        return len(stale)
+
+    def start_refresher(self, interval: Optional[float] = None) -> threading.Thread:
+        interval = interval or max(1.0, self.max_idle / 2)
+
+        def loop():
+            while not self._stop.wait(interval):
+                self.refresh_idle()
+
+        self._stop.clear()
+        self._refresher = threading.Thread(target=loop, name="http-keepalive", daemon=True)
+        self._refresher.start()
+        return self._refresher
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def close(self):
+        self._stop.set()
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for conn in idle:
+            conn.close()
+
+    # -------------------------------
+    # Requests
+    # -------------------------------
+    def request(self, method: str, path: str, body=None, headers: Optional[Dict[str, str]] = None):
+        """
+        Returns (status, body bytes, timings). Raises OSError /
+        http.client.HTTPException when the server cannot be reached.
+        """
+        started = time.perf_counter()
+        conn, reused = self._acquire()
+        try:
+            status, data, timings = self._send(conn, method, path, body, headers)
+        except STALE_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped our idle connection; one fresh attempt
+            with self._lock:
+                self.stats["retries"] += 1
+            conn, reused = self._new_connection(), False
+            try:
+                status, data, timings = self._send(conn, method, path, body, headers)
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        self._release(conn)
+
+        if reused:
+            timings.update({"dns_ms": 0.0, "connect_ms": 0.0, "tls_ms": 0.0})
+        else:
+            timings.update(conn.timings)
+        timings["total_ms"] = (time.perf_counter() - started) * 1000
+        timings["reused"] = reused
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["reused"] += int(reused)
+            self.timings.append(timings)
+        return status, data, timings
+
+    @staticmethod
+    def _send(conn: TimedConnection, method, path, body, headers):
+        t0 = time.perf_counter()
+        conn.request(method, path, body=body, headers=headers or {})
+        t1 = time.perf_counter()
+        response = conn.getresponse()
+        data = response.read()
+        t2 = time.perf_counter()
+        if response.will_close:
+            conn.close()
+        return response.status, data, {"send_ms": (t1 - t0) * 1000, "response_ms": (t2 - t1) * 1000}
+
+    # -------------------------------
+    # Reporting
+    # -------------------------------
+    def report(self) -> Dict[str, object]:
+        with self._lock:
+            timings = list(self.timings)
+            report = dict(self.stats)
+
+        requests = max(1, report["requests"])
+        report["reuse_rate"] = round(report["reused"] / requests, 3)
+        for phase in PHASES:
+            values = np.array([t[phase] for t in timings], dtype=float)
+            report[phase] = {
+                "p50": round(float(np.percentile(values, 50)), 2) if len(values) else None,
+                "p95": round(float(np.percentile(values, 95)), 2) if len(values) else None,
+            }
+        return report
@@ -0,0 +1,351 @@
+"""
+Speech Output (TTS)
+Day 24.4 — Spoken responses: cached, streamed, interruptible
+
+    SpeechOutput.say(text)
+        split into sentences
+        producer thread: cache hit? → PCM, else backend.synthesize(sentence)
+        consumer: plays ~100 ms chunks as soon as the FIRST sentence is ready
+        GLOBAL_INTERRUPT checked between chunks → playback stops at once
+
+Backends (synthesize(text) -> int16 mono PCM bytes):
+- "tone"    → ToneSynthesizer, deterministic stand-in (tests / offline)
+- "pyttsx3" → Pyttsx3Backend, local system voices (optional dependency)
+
+Fixed phrases (clarifications, "Okay, stopped.", ...) are kept in a
+content-addressed PCM cache: key = sha256(backend, voice, rate, text),
+on disk and in a small in-memory LRU, warmed in the background.
+"""
+
+import hashlib
+import os
+import queue
+import re
+import threading
+import time
+import wave
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.system.config import RUDRA_DATA_DIR
+
+TTS_SAMPLE_RATE = 16000
+DEFAULT_CACHE_DIR = os.path.join(RUDRA_DATA_DIR, "tts_cache")
+
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?|])\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip(" |") for s in SENTENCE_SPLIT.split(text.strip()) if s.strip(" |")]
+
+
+# -------------------------------
+# Backends
+# -------------------------------
+class TTSBackend:
+    name = "base"
+    voice = "default"
+    sample_rate = TTS_SAMPLE_RATE
+
+    def synthesize(self, text: str) -> bytes:
+        raise NotImplementedError
+
+
+class ToneSynthesizer(TTSBackend):
+    """
+    Deterministic stand-in: one short tone per character (pitch from
+    the character), a gap per space. Same text → same PCM, always.
+    """
+
+    name = "tone"
+
+    def __init__(self, char_ms: int = 40, latency: float = 0.0, sample_rate: int = TTS_SAMPLE_RATE):
+        self.char_ms = char_ms
+        self.latency = latency          # simulated render time per call
+        self.sample_rate = sample_rate
+        self.calls = 0
+
+    def synthesize(self, text: str) -> bytes:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        n = int(self.sample_rate * self.char_ms / 1000)
+        t = np.arange(n) / self.sample_rate
+        codes = np.frombuffer(text.lower().encode("utf-8"), dtype=np.uint8).astype(np.float32)
+        if not len(codes):
+            return b""
+
+        freqs = np.where(codes == 32, 0.0, 200.0 + (codes % 32) * 25.0)
+        chars = np.sin(2 * np.pi * freqs[:, None] * t[None, :]) * 6000.0
+        return chars.astype(np.int16).ravel().tobytes()
+
+
+class Pyttsx3Backend(TTSBackend):
+    name = "pyttsx3"
+
+    def __init__(self, voice: Optional[str] = None, rate: Optional[int] = None):
+        import pyttsx3
+
+        self._engine = pyttsx3.init()
+        self._lock = threading.Lock()
+        if voice:
+            self._engine.setProperty("voice", voice)
+        if rate:
+            self._engine.setProperty("rate", rate)
+        self.voice = voice or "default"
+
+        # The driver picks the WAV rate (often 22050 Hz) and does not expose
+        # it: probe once so playback and cache keys use it from the start
+        self.sample_rate, _ = self._render_wav(".")
+
+    def synthesize(self, text: str) -> bytes:
+        sample_rate, pcm = self._render_wav(text)
+        if sample_rate != self.sample_rate:
+            logger.warning("pyttsx3 rate changed {} → {} Hz", self.sample_rate, sample_rate)
+        return pcm
+
+    def _render_wav(self, text: str):
+        import tempfile
+
+        with self._lock, tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.wav")
+            self._engine.save_to_file(text, path)
+            self._engine.runAndWait()
+            with wave.open(path, "rb") as wav:
+                return wav.getframerate(), wav.readframes(wav.getnframes())
+
+
+def create_backend(name: str, **kwargs) -> TTSBackend:
+    if name == "tone":
+        return ToneSynthesizer(**kwargs)
+    if name == "pyttsx3":
+        return Pyttsx3Backend(**kwargs)
+    raise ValueError(f"Unknown TTS backend: {name}")
+
+
+# -------------------------------
+# Players
+# -------------------------------
+class NullPlayer:
+    """
+    Collects audio instead of playing it; realtime=True paces like a speaker.
+    """
+
+    def __init__(self, realtime: bool = False):
+        self.realtime = realtime
+        self.chunks: List[bytes] = []
+        self.stopped = 0
+
+    def play(self, pcm: bytes, sample_rate: int):
+        self.chunks.append(bytes(pcm))
+        if self.realtime:
+            time.sleep(len(pcm) / 2 / sample_rate)
+
+    def stop(self):
+        self.stopped += 1
+
+
+class PyAudioPlayer:
+    def __init__(self):
+        import pyaudio
+
+        self._pyaudio = pyaudio
+        self._pa = pyaudio.PyAudio()
+        self._stream = None
+        self._rate = None
+
+    def play(self, pcm: bytes, sample_rate: int):
+        if self._stream is None or self._rate != sample_rate:
+            self.stop()
+            self._stream = self._pa.open(
+                format=self._pyaudio.paInt16, channels=1, rate=sample_rate, output=True
+            )
+            self._rate = sample_rate
+        self._stream.write(bytes(pcm))
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+
+
+# -------------------------------
+# Cache
+# -------------------------------
+class PCMCache:
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, max_items: int = 64):
+        self.cache_dir = cache_dir
+        self.max_items = max_items
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def key(backend: TTSBackend, text: str) -> str:
+        ident = f"{backend.name}|{backend.voice}|{backend.sample_rate}|{text.strip()}"
+        return hashlib.sha256(ident.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, key[:2], key + ".pcm")
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            pcm = self._memory.get(key)
+            if pcm is not None:
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+                return pcm
+
+        path = self._path(key)
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                pcm = f.read()
+            self._remember(key, pcm)
+            with self._lock:
+                self.stats["hits"] += 1
+            return pcm
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, pcm: bytes, persist: bool = False):
+        self._remember(key, pcm)
+        path = self._path(key)
+        if not (persist and path):
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(pcm)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("TTS cache write failed: {}", e)
+
+    def _remember(self, key: str, pcm: bytes):
+        with self._lock:
+            self._memory[key] = pcm
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+
+# -------------------------------
+# Output stage
+# -------------------------------
+class SpeechOutput:
+    def __init__(
+        self,
+        backend: TTSBackend,
+        player=None,
+        cache: Optional[PCMCache] = None,
+        fixed_phrases: Iterable[str] = (),
+        chunk_ms: int = 100,
+        interrupt=GLOBAL_INTERRUPT,
+    ):
+        self.backend = backend
+        self.player = player or NullPlayer()
+        self.cache = cache if cache is not None else PCMCache()
+        self.fixed_phrases = {p.strip() for p in fixed_phrases}
+        self.chunk_ms = chunk_ms
+        self.interrupt = interrupt
+
+        self._say_lock = threading.Lock()
+        self.stats = {"said": 0, "interrupted": 0, "first_audio_ms": deque(maxlen=200)}
+
+    def _render(self, sentence: str) -> bytes:
+        key = PCMCache.key(self.backend, sentence)
+        pcm = self.cache.get(key)
+        if pcm is None:
+            pcm = self.backend.synthesize(sentence)
+            # Fixed phrases persist on disk; everything else stays in memory
+            self.cache.put(key, pcm, persist=sentence in self.fixed_phrases)
+        return pcm
+
+    def warm(self, phrases: Optional[Iterable[str]] = None):
+        for phrase in phrases if phrases is not None else sorted(self.fixed_phrases):
+            for sentence in split_sentences(phrase):
+                try:
+                    self._render(sentence)
+                except Exception as e:
+                    logger.warning("TTS warm-up failed for '{}': {}", sentence, e)
+
+    def warm_async(self, phrases: Optional[Iterable[str]] = None) -> threading.Thread:
+        thread = threading.Thread(target=self.warm, args=(phrases,), name="tts-warm", daemon=True)
+        thread.start()
+        return thread
+
+    def say(self, text: str) -> Dict[str, object]:
+        """
+        Speak text, returning once playback ends or is interrupted.
+        """
+        sentences = split_sentences(text)
+        result = {"sentences": len(sentences), "played_ms": 0.0, "interrupted": False, "first_audio_ms": None}
+        if not sentences or self.interrupt.is_triggered():
+            result["interrupted"] = bool(sentences)
+            return result
+
+        with self._say_lock:
+            started = time.perf_counter()
+            rendered: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=2)
+            cancel = threading.Event()
+
+            def produce():
+                try:
+                    for sentence in sentences:
+                        if cancel.is_set():
+                            break
+                        rendered.put(self._render(sentence))
+                except Exception as e:
+                    logger.error("TTS synthesis failed: {}", e)
+                finally:
+                    rendered.put(None)
+
+            producer = threading.Thread(target=produce, name="tts-render", daemon=True)
+            producer.start()
+
+            rate = self.backend.sample_rate
+            chunk_bytes = int(rate * self.chunk_ms / 1000) * 2
+
+            while True:
+                pcm = rendered.get()
+                if pcm is None:
+                    break
+                if result["first_audio_ms"] is None:
+                    result["first_audio_ms"] = (time.perf_counter() - started) * 1000
+                    self.stats["first_audio_ms"].append(result["first_audio_ms"])
+
+                view = memoryview(pcm)
+                for i in range(0, len(view), chunk_bytes):
+                    if self.interrupt.is_triggered():
+                        result["interrupted"] = True
+                        break
+                    chunk = view[i:i + chunk_bytes]
+                    self.player.play(chunk, rate)
+                    result["played_ms"] += len(chunk) / 2 / rate * 1000
+
+                if result["interrupted"]:
+                    cancel.set()
+                    self.player.stop()
+                    # Unblock the producer if it is waiting on a full queue
+                    while producer.is_alive():
+                        try:
+                            rendered.get(timeout=0.05)
+                        except queue.Empty:
+                            pass
+                    break
+
+            self.stats["said"] += 1
+            if result["interrupted"]:
+                self.stats["interrupted"] += 1
+                logger.info("Speech interrupted after {:.0f} ms", result["played_ms"])
+            return result
@@ -0,0 +1,353 @@
+"""
+ASR Worker Process
+Day 25.1 — Capture-side DSP and recognition outside the main interpreter
+
+    main process                          worker process
+    ------------                          --------------
+    capture thread → SharedRingRecorder ──shm──► SharedRing
+    WorkerSpeechEngine.listen_once()
+        requests.put({"id", "timeout"}) ───────► engine.listen()   (VAD, endpointing)
+                                                 engine.recognize()
+        results.get()  ◄─────────────────────── {"id", "text", "start", "end", ...}
+    NLP + actions
+
+    WorkerSpeechEngine.listen() / recognize(clip)      (hedge, local-first,
+        capture only  ───────────────────────► engine.listen()     dictation)
+        clip positions or pcm ───────────────► engine.recognize()
+
+Utterance VAD, endpointing and recognition run in the worker, so a slow
+action no longer starves them. Capture, wake spotting, the noise-floor
+estimate and barge-in stay in the main process; the noise floor reaches
+the worker's VAD through the ring header. The supervisor notices a dead
+worker (exit code, or no answer within result_timeout), starts a new
+one on the same ring and returns "" for the lost turn — the assistant
+loop keeps going.
+
+engine_factory(ring) runs IN the worker and must be picklable
+(a module-level function or functools.partial of one).
+"""
+
+import multiprocessing as mp
+import queue
+import threading
+import time
+from collections import deque
+from functools import partial
+from typing import Callable, Dict, Optional
+
+import numpy as np
+from loguru import logger
+
+from core.audio.clip import AudioClip
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.speech.engine import SpeechEngine, create_engine
+
+
+def ring_engine(ring, name: str = "google", **kwargs) -> SpeechEngine:
+    """
+    Default factory: a config-named backend capturing from the shared ring,
+    thresholded by the noise floor the capturing process publishes there.
+    """
+    if name == "file":
+        return create_engine(name, **kwargs)
+    if ring.publishes_noise_floor:
+        kwargs.setdefault("noise_floor", ring)
+    return create_engine(name, recorder=ring, **kwargs)
+
+
+def _worker_main(ring_name: str, engine_factory: Callable, requests, results):
+    from core.audio.shm_ring import SharedRing
+
+    ring = SharedRing.attach(ring_name)
+    engine = engine_factory(ring)
+    results.put({"id": None, "ready": True})
+
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        results.put(_serve(engine, ring, request))
+
+    engine.close()
+    ring.close()
+
+
+def _serve(engine: SpeechEngine, ring, request: Dict[str, object]) -> Dict[str, object]:
+    """
+    One request, in the worker:
+        {"pcm", "sample_rate"}        recognize audio sent by the main process
+        {"start", "end", ...}         recognize a region of the shared ring
+        {"timeout", "skip_to", ...}   capture an utterance, and recognize it
+                                      unless "recognize" is False
+    """
+    response = {"id": request["id"], "text": "", "confidence": 0.0, "start": None, "end": None}
+
+    if request.get("pcm") is not None:
+        clip = AudioClip(pcm=request["pcm"], sample_rate=request["sample_rate"])
+    elif request.get("start") is not None:
+        start, end = request["start"], request["end"]
+        clip = AudioClip(
+            pcm=ring.view(start, end - start),
+            sample_rate=ring.sample_rate,
+            start=start,
+            speech_end=request["speech_end"],
+            end=end,
+        )
+    else:
+        if request.get("skip_to") is not None:
+            engine.skip_to(request["skip_to"])
+        clip = engine.listen(request.get("timeout"))
+        if clip is None:
+            return response
+        response.update({"start": clip.start, "end": clip.end, "speech_end": clip.speech_end})
+        if not request.get("recognize", True):
+            return response
+
+    started = time.perf_counter()
+    try:
+        response.update(engine.recognize(clip))
+    except Exception as e:
+        response["error"] = str(e)
+    response["recognize_seconds"] = time.perf_counter() - started
+    return response
+
+
+class ASRWorker:
+    """
+    Supervisor for one worker process bound to a shared ring.
+    """
+
+    def __init__(
+        self,
+        ring_name: str,
+        engine_factory: Callable = ring_engine,
+        start_method: str = "spawn",
+        start_timeout: float = 30.0,
+    ):
+        self.ring_name = ring_name
+        self.engine_factory = engine_factory
+        self.start_timeout = start_timeout
+        self._ctx = mp.get_context(start_method)
+
+        self.process: Optional[mp.Process] = None
+        self._requests = None
+        self._results = None
+        self._next_id = 0
+        # One request in flight: dictation recognizes from a thread pool
+        self._call_lock = threading.Lock()
+
+        self.stats = {"requests": 0, "restarts": 0, "crashes": 0, "timeouts": 0, "errors": 0}
+        self.latencies: "deque[float]" = deque(maxlen=200)
+
+    def start(self):
+        # Fresh queues: a worker killed mid-put may leave the old ones locked
+        self._requests = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self.process = self._ctx.Process(
+            target=_worker_main,
+            args=(self.ring_name, self.engine_factory, self._requests, self._results),
+            name="asr-worker",
+            daemon=True,
+        )
+        self.process.start()
+
+        ready = self._wait(None, self.start_timeout)
+        if ready is None:
+            raise RuntimeError("ASR worker failed to start")
+        logger.info("ASR worker started (pid {})", self.process.pid)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def restart(self):
+        self.stats["restarts"] += 1
+        self._terminate()
+        self.start()
+
+    def _terminate(self):
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(1.0)
+        for q in (self._requests, self._results):
+            q.cancel_join_thread()
+            q.close()
+
+    def _wait(self, request_id: Optional[int], timeout: Optional[float]):
+        """
+        The answer to request_id (None = the ready message),
+        or None if the worker died / timed out.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                message = self._results.get(timeout=0.1)
+            except queue.Empty:
+                if not self.process.is_alive():
+                    self.stats["crashes"] += 1
+                    logger.error("ASR worker died (exit code {})", self.process.exitcode)
+                    return None
+                if deadline is not None and time.monotonic() > deadline:
+                    self.stats["timeouts"] += 1
+                    logger.error("ASR worker unresponsive for {:.1f}s", timeout)
+                    return None
+                continue
+
+            if message["id"] == request_id:
+                return message
+            # Stale answer to a turn we already gave up on
+
+    def transcribe(self, timeout: Optional[float] = None, skip_to: Optional[int] = None,
+                   result_timeout: Optional[float] = None, recognize: bool = True) -> Optional[Dict[str, object]]:
+        """
+        One turn in the worker (recognize=False: capture only, no text).
+        None → the worker was lost (and restarted).
+        """
+        return self._call({"timeout": timeout, "skip_to": skip_to, "recognize": recognize}, result_timeout)
+
+    def recognize(self, clip: Dict[str, object], result_timeout: Optional[float] = None) -> Optional[Dict[str, object]]:
+        """
+        Recognize audio the main process already holds: ring positions
+        {"start", "end", "speech_end"} or {"pcm", "sample_rate"}.
+        """
+        return self._call(dict(clip), result_timeout)
+
+    def _call(self, request: Dict[str, object], result_timeout: Optional[float]) -> Optional[Dict[str, object]]:
+        with self._call_lock:
+            if not self.is_alive():
+                self.restart()
+
+            self._next_id += 1
+            request["id"] = request_id = self._next_id
+            started = time.perf_counter()
+            self._requests.put(request)
+            self.stats["requests"] += 1
+
+            response = self._wait(request_id, result_timeout)
+            if response is None:
+                self.restart()
+                return None
+
+            self.latencies.append(time.perf_counter() - started)
+            if response.get("error"):
+                self.stats["errors"] += 1
+                logger.error("ASR worker recognition failed: {}", response["error"])
+            return response
+
+    def stop(self):
+        if self.is_alive():
+            self._requests.put(None)
+            self.process.join(2.0)
+        self._terminate()
+        self.process = None
+
+    def report(self) -> Dict[str, object]:
+        values = np.array(self.latencies, dtype=float) * 1000
+        return {
+            **self.stats,
+            "alive": self.is_alive(),
+            "pid": self.process.pid if self.process else None,
+            "turn_ms_p50": round(float(np.percentile(values, 50)), 1) if len(values) else None,
+        }
+
+
+class WorkerSpeechEngine(SpeechEngine):
+    """
+    SpeechEngine facade: the main process only sends requests and
+    reads transcripts; clips are re-viewed from the local ring.
+
+    listen_once() is one round trip. listen() and recognize(clip) split
+    it, so the facade can sit under HedgedRecognizer, LocalFirstEngine
+    or a Dictation like any other engine.
+    """
+
+    name = "worker"
+
+    def __init__(
+        self,
+        recorder,
+        engine: str = "google",
+        engine_factory: Optional[Callable] = None,
+        listen_timeout: float = 10.0,
+        result_timeout: float = 30.0,
+        start_method: str = "spawn",
+        **engine_kwargs,
+    ):
+        self.recorder = recorder
+        self.listen_timeout = listen_timeout
+        self.result_timeout = result_timeout
+        self._skip_to: Optional[int] = None
+
+        factory = engine_factory or partial(ring_engine, name=engine, **engine_kwargs)
+        self.worker = ASRWorker(recorder.name, factory, start_method=start_method)
+        self.worker.start()
+
+    def skip_to(self, position: int):
+        self._skip_to = position
+
+    def listen(self, timeout: Optional[float] = None) -> Optional[AudioClip]:
+        """
+        Capture only: the worker endpoints the utterance, the clip views the local ring.
+        """
+        skip_to, self._skip_to = self._skip_to, None
+        response = self.worker.transcribe(timeout or self.listen_timeout, skip_to, self.result_timeout, recognize=False)
+        if not response:
+            return None
+        return self._clip(response)
+
+    def recognize(self, clip: AudioClip) -> Dict[str, object]:
+        # Clips still in the shared ring travel as positions, anything else as bytes
+        if clip.meta.get("ring") == self.recorder.name and self.recorder.write_position - clip.start <= self.recorder.capacity:
+            request = {"start": clip.start, "end": clip.end, "speech_end": clip.speech_end}
+        else:
+            request = {"pcm": clip.to_bytes(), "sample_rate": clip.sample_rate}
+
+        response = self.worker.recognize(request, self.result_timeout)
+        if response is None:
+            return {"text": "", "confidence": 0.0}
+        if response.get("error"):
+            raise RuntimeError(response["error"])
+        return {k: v for k, v in response.items() if k not in ("id", "start", "end", "speech_end")}
+
+    def _clip(self, response: Dict[str, object]) -> Optional[AudioClip]:
+        start, end = response["start"], response["end"]
+        if start is None or self.recorder.write_position - start > self.recorder.capacity:
+            return None
+        meta = {"ring": self.recorder.name}
+        if "recognize_seconds" in response:
+            meta["recognize_seconds"] = response["recognize_seconds"]
+        return AudioClip(
+            pcm=self.recorder.view(start, end - start),
+            sample_rate=self.recorder.sample_rate,
+            start=start,
+            speech_end=response["speech_end"],
+            end=end,
+            meta=meta,
+        )
+
+    def listen_once(self) -> str:
+        if GLOBAL_INTERRUPT.is_triggered():
+            logger.warning("Listen aborted due to global interrupt")
+            return ""
+
+        self.last_clip = None
+        skip_to, self._skip_to = self._skip_to, None
+        response = self.worker.transcribe(self.listen_timeout, skip_to, self.result_timeout)
+        if not response or response.get("start") is None:
+            return ""
+        self.last_clip = self._clip(response)
+
+        if GLOBAL_INTERRUPT.is_triggered():
+            logger.warning("Interrupt triggered before returning recognized text")
+            return ""
+
+        text = response.get("text", "")
+        if text:
+            logger.info("{} heard: {}", self.name, text)
+        return text
+
+    def close(self):
+        # The clip views the ring, which is about to go away
+        self.last_clip = None
+        self.worker.stop()
@@ -0,0 +1,309 @@
+"""
+Browser Index
+Day 22.3 — Local bookmarks + history → keyword → URL
+
+Sources (read-only, local files only):
+- Firefox  places.sqlite       (bookmarks + history)
+- Chromium Bookmarks (JSON) + History (sqlite)
+
+Rules:
+- Browser databases are NEVER opened on the hot path
+- refresh() runs in the background and re-reads only files whose mtime changed
+- lookup() touches in-memory dicts only (cost depends on the utterance, not the index)
+- Ranked by visit frequency, bookmarks get a fixed bonus
+"""
+
+import glob
+import json
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from core.system.config import HOME_DIR
+
+BOOKMARK_BONUS = 5
+MAX_ROWS_PER_SOURCE = 5000
+MAX_KEYWORDS = 20000
+REFRESH_INTERVAL_SECONDS = 600
+
+# Words that never identify a site
+IGNORED_WORDS = {
+    "open", "browser", "the", "a", "an", "my", "me", "to", "go", "and",
+    "of", "for", "in", "on", "with", "website", "site", "page", "tab",
+    "www", "com", "org", "net", "io", "http", "https", "html", "index",
+    "home", "new", "login", "sign", "launch", "start",
+    "chrome", "chromium", "firefox", "internet",
+}
+
+FIREFOX_GLOB = ".mozilla/firefox/*/places.sqlite"
+CHROMIUM_DIRS = [
+    ".config/chromium",
+    ".config/google-chrome",
+    ".config/BraveSoftware/Brave-Browser",
+]
+
+# (url, title, score)
+Entry = Tuple[str, str, int]
+
+
+def discover_sources(home: str = HOME_DIR) -> List[Tuple[str, str]]:
+    """
+    Find browser profile files under home.
+    Returns [(kind, path)] with kind in:
+    "firefox", "chromium_bookmarks", "chromium_history"
+    """
+    sources = [("firefox", p) for p in glob.glob(os.path.join(home, FIREFOX_GLOB))]
+
+    for base in CHROMIUM_DIRS:
+        for profile in glob.glob(os.path.join(home, base, "*")):
+            bookmarks = os.path.join(profile, "Bookmarks")
+            history = os.path.join(profile, "History")
+            if os.path.isfile(bookmarks):
+                sources.append(("chromium_bookmarks", bookmarks))
+            if os.path.isfile(history):
+                sources.append(("chromium_history", history))
+
+    return sources
+
+
+def keywords_for(url: str, title: str) -> List[str]:
+    """
+    Index keys: title words + host labels.
+    "Grafana - Dashboards", https://grafana.lab.local/d/x
+    → ["grafana", "dashboards", "lab", "local"]
+    """
+    words = re.findall(r"[a-z0-9]+", (title or "").lower())
+    host = urlparse(url).hostname or ""
+    words += re.findall(r"[a-z0-9]+", host.lower())
+
+    seen = []
+    for w in words:
+        if len(w) < 3 or w in IGNORED_WORDS or w.isdigit() or w in seen:
+            continue
+        seen.append(w)
+    return seen
+
+
+class BrowserIndex:
+    def __init__(
+        self,
+        sources: Optional[List[Tuple[str, str]]] = None,
+        refresh_interval: float = REFRESH_INTERVAL_SECONDS,
+    ):
+        # None → discover on every refresh (profiles may appear later)
+        self._fixed_sources = sources
+        self.refresh_interval = refresh_interval
+        self._last_refresh = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        self._mtimes: Dict[str, float] = {}
+        self._entries: Dict[str, List[Entry]] = {}
+
+        # keyword → (url, score); swapped atomically on refresh
+        self._index: Dict[str, Tuple[str, int]] = {}
+        self._refresh_lock = threading.Lock()
+
+    # -------------------------------
+    # Hot path — in-memory only
+    # -------------------------------
+    def lookup(self, text: str) -> Optional[Dict[str, str]]:
+        """
+        Best URL for the words in text, or None.
+        URLs matching more words win, then higher visit score.
+        """
+        self._maybe_refresh()
+
+        index = self._index
+        if not index or not text:
+            return None
+
+        hits: Dict[str, List] = {}
+        for word in re.findall(r"[a-z0-9]+", text.lower()):
+            if word in IGNORED_WORDS:
+                continue
+            found = index.get(word)
+            if not found:
+                continue
+            url, score = found
+            hit = hits.setdefault(url, [0, score, word])
+            hit[0] += 1
+
+        if not hits:
+            return None
+
+        url, (_, _, keyword) = max(hits.items(), key=lambda kv: (kv[1][0], kv[1][1]))
+        return {"url": url, "keyword": keyword}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    # -------------------------------
+    # Refresh — background only
+    # -------------------------------
+    def refresh_async(self) -> threading.Thread:
+        self._last_refresh = time.monotonic()
+        thread = threading.Thread(target=self.refresh, name="browser-index", daemon=True)
+        self._refresh_thread = thread
+        thread.start()
+        return thread
+
+    def _maybe_refresh(self):
+        # Only starts a thread; the mtime check itself runs in the background
+        if time.monotonic() - self._last_refresh < self.refresh_interval:
+            return
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self.refresh_async()
+
+    def refresh(self) -> bool:
+        """
+        Re-read changed sources and rebuild the keyword map.
+        Returns True if anything changed.
+        """
+        with self._refresh_lock:
+            self._last_refresh = time.monotonic()
+            sources = self._fixed_sources
+            if sources is None:
+                sources = discover_sources()
+
+            changed = False
+            live_paths = set()
+
+            for kind, path in sources:
+                live_paths.add(path)
+                mtime = _source_mtime(path)
+                if mtime is None:
+                    continue
+
+                if self._mtimes.get(path) == mtime:
+                    continue
+
+                try:
+                    self._entries[path] = self._read_source(kind, path)
+                    self._mtimes[path] = mtime
+                    changed = True
+                except Exception as e:
+                    logger.warning("Browser index: cannot read {} ({})", path, e)
+
+            # Profiles that disappeared
+            for path in list(self._entries):
+                if path not in live_paths:
+                    del self._entries[path]
+                    self._mtimes.pop(path, None)
+                    changed = True
+
+            if changed:
+                self._index = self._build_index()
+                logger.info("Browser index refreshed: {} keywords", len(self._index))
+
+            return changed
+
+    def _build_index(self) -> Dict[str, Tuple[str, int]]:
+        # Merge scores for the same URL across sources
+        scores: Dict[str, int] = {}
+        titles: Dict[str, str] = {}
+        for entries in self._entries.values():
+            for url, title, score in entries:
+                scores[url] = scores.get(url, 0) + score
+                if title and url not in titles:
+                    titles[url] = title
+
+        index: Dict[str, Tuple[str, int]] = {}
+        for url in sorted(scores, key=scores.get, reverse=True):
+            for word in keywords_for(url, titles.get(url, "")):
+                if word not in index:
+                    index[word] = (url, scores[url])
+                    if len(index) >= MAX_KEYWORDS:
+                        return index
+        return index
+
+    # -------------------------------
+    # Source readers
+    # -------------------------------
+    def _read_source(self, kind: str, path: str) -> List[Entry]:
+        if kind == "firefox":
+            return self._read_firefox(path)
+        if kind == "chromium_bookmarks":
+            return self._read_chromium_bookmarks(path)
+        if kind == "chromium_history":
+            return self._read_chromium_history(path)
+        return []
+
+    def _query_copy(self, path: str, sql: str) -> list:
+        """
+        Browsers keep their databases locked while running.
+        Query a private snapshot instead of the live file.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            snapshot = os.path.join(tmp, "snapshot.sqlite")
+            shutil.copy2(path, snapshot)
+            # Recent visits may still live in the write-ahead log
+            if os.path.isfile(path + "-wal"):
+                shutil.copy2(path + "-wal", snapshot + "-wal")
+            conn = sqlite3.connect(snapshot)
+            try:
+                return conn.execute(sql).fetchall()
+            finally:
+                conn.close()
+
+    def _read_firefox(self, path: str) -> List[Entry]:
+        history = self._query_copy(
+            path,
+            "SELECT url, title, visit_count FROM moz_places "
+            f"WHERE visit_count > 0 ORDER BY visit_count DESC LIMIT {MAX_ROWS_PER_SOURCE}",
+        )
+        bookmarks = self._query_copy(
+            path,
+            "SELECT p.url, b.title, p.visit_count FROM moz_bookmarks b "
+            f"JOIN moz_places p ON b.fk = p.id WHERE b.type = 1 LIMIT {MAX_ROWS_PER_SOURCE}",
+        )
+
+        entries = [(u, t or "", c or 0) for u, t, c in history if _is_web(u)]
+        entries += [(u, t or "", (c or 0) + BOOKMARK_BONUS) for u, t, c in bookmarks if _is_web(u)]
+        return entries
+
+    def _read_chromium_history(self, path: str) -> List[Entry]:
+        rows = self._query_copy(
+            path,
+            "SELECT url, title, visit_count FROM urls "
+            f"ORDER BY visit_count DESC LIMIT {MAX_ROWS_PER_SOURCE}",
+        )
+        return [(u, t or "", c or 0) for u, t, c in rows if _is_web(u)]
+
+    def _read_chromium_bookmarks(self, path: str) -> List[Entry]:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        entries: List[Entry] = []
+        stack = list((data.get("roots") or {}).values())
+        while stack and len(entries) < MAX_ROWS_PER_SOURCE:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            if node.get("type") == "url" and _is_web(node.get("url", "")):
+                entries.append((node["url"], node.get("name", ""), BOOKMARK_BONUS))
+            stack.extend(node.get("children", []))
+        return entries
+
+
+def _source_mtime(path: str) -> Optional[float]:
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    # sqlite WAL writes do not touch the main file
+    if os.path.isfile(path + "-wal"):
+        mtime = max(mtime, os.path.getmtime(path + "-wal"))
+    return mtime
+
+
+def _is_web(url: str) -> bool:
+    return bool(url) and url.startswith(("http://", "https://"))
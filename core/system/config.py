@@ -2,3 +2,6 @@ import os
 
 # Absolute path to user's home directory
 HOME_DIR = os.path.expanduser("~")
+
+# Rudra's own local state (shortcuts, logs, caches)
+RUDRA_DATA_DIR = os.getenv("RUDRA_DATA_DIR", os.path.join(HOME_DIR, ".rudra"))
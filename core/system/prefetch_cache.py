@@ -0,0 +1,64 @@
+"""
+Prefetch Cache
+Day 22.2 — Short-lived, thread-safe store for speculative work
+
+Entries are consumed once (take) and expire after a short TTL,
+so a prefetched directory listing is never served stale for long.
+The cache remembers which keys were actually served, so speculative
+work is scored by use, not by whether the prediction looked right.
+"""
+
+import time
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+
+class PrefetchCache:
+    def __init__(self, ttl_seconds: float = 10.0, max_items: int = 32):
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self._items: Dict[Hashable, Tuple[float, Any]] = {}
+        self._served: Set[Hashable] = set()
+        self._lock = Lock()
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._served.discard(key)
+            while len(self._items) > self.max_items:
+                # dict keeps insertion order → drop the oldest
+                del self._items[next(iter(self._items))]
+
+    def take(self, key: Hashable) -> Optional[Any]:
+        """
+        Return and remove a fresh entry, or None.
+        """
+        with self._lock:
+            entry = self._items.pop(key, None)
+
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            return None
+
+        with self._lock:
+            self._served.add(key)
+        return value
+
+    def settle(self, key: Hashable) -> bool:
+        """
+        True if the entry put under key was served by take().
+        Either way the key is forgotten; an unserved entry is dropped.
+        """
+        with self._lock:
+            self._items.pop(key, None)
+            served = key in self._served
+            self._served.discard(key)
+        return served
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._served.clear()
@@ -0,0 +1,50 @@
+"""
+Synthetic audio helpers for the audio test suite.
+No microphone, no network — only generated PCM and WAV files.
+"""
+
+import wave
+
+import numpy as np
+
+RATE = 16000
+
+
+def silence(seconds: float, rate: int = RATE) -> np.ndarray:
+    return np.zeros(int(seconds * rate), dtype=np.int16)
+
+
+def noise(seconds: float, level: float = 100.0, seed: int = 0, rate: int = RATE) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * rate)) * level).astype(np.int16)
+
+
+def tone(seconds: float, freq: float = 220.0, level: float = 8000.0, rate: int = RATE) -> np.ndarray:
+    """
+    Voiced-speech stand-in: harmonic-rich, low spectral flatness.
+    """
+    t = np.arange(int(seconds * rate)) / rate
+    wave_ = sum(np.sin(2 * np.pi * freq * k * t) / k for k in range(1, 6))
+    return (wave_ / 2.3 * level).astype(np.int16)
+
+
+def chirp(seconds: float, f0: float, f1: float, level: float = 8000.0, rate: int = RATE) -> np.ndarray:
+    """
+    Word stand-in with a distinctive spectral trajectory.
+    """
+    t = np.arange(int(seconds * rate)) / rate
+    phase = 2 * np.pi * (f0 * t + (f1 - f0) * t * t / (2 * seconds))
+    return (np.sin(phase) * level).astype(np.int16)
+
+
+def concat(*parts: np.ndarray) -> np.ndarray:
+    return np.concatenate(parts).astype(np.int16)
+
+
+def write_wav(path, samples: np.ndarray, rate: int = RATE) -> str:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.astype(np.int16).tobytes())
+    return str(path)
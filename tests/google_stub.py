@@ -0,0 +1,64 @@
+"""
+Local stand-in for the Google speech endpoint.
+Records every request; answers in the API's line-delimited JSON.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server.requests.append({
+            "path": self.path,
+            "headers": dict(self.headers),
+            "body": body,
+            "connection": self.client_address,
+        })
+        if server.delay:
+            threading.Event().wait(server.delay)
+
+        alternatives = [{"transcript": t, "confidence": c} for t, c in server.alternatives]
+        payload = '{"result":[]}\n' + json.dumps({"result": [{"alternative": alternatives, "final": True}]}) + "\n"
+        data = payload.encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class GoogleStub:
+    def __init__(self, alternatives=(("open chrome", 0.9),), delay: float = 0.0):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.server.alternatives = list(alternatives)
+        self.server.delay = delay
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/speech-api/v2/recognize"
+
+    @property
+    def requests(self):
+        return self.server.requests
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
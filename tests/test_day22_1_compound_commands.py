@@ -0,0 +1,77 @@
+"""
+Day 22.1 Test — Compound Commands
+
+Purpose:
+- Split multi-action utterances only on real clause boundaries
+- Group independent sub-commands into parallel stages
+- Execute one stage concurrently and aggregate the response
+"""
+
+import threading
+
+from core.nlp.compound_splitter import split_compound
+from core.actions.dependency_analyzer import plan_stages
+from core.actions.action_executor import ActionExecutor, DANGEROUS_INTENTS
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.nlp.intent import Intent
+
+
+def test_split_three_clauses():
+    clauses = split_compound("open youtube and search python asyncio and list downloads")
+    assert [c["text"] for c in clauses] == [
+        "open youtube",
+        "search python asyncio",
+        "list downloads",
+    ]
+    assert not any(c["sequential"] for c in clauses)
+
+
+def test_and_inside_query_is_not_split():
+    clauses = split_compound("search rock and roll")
+    assert [c["text"] for c in clauses] == ["search rock and roll"]
+
+
+def test_then_marks_clause_sequential():
+    clauses = split_compound("open github, and then search decorators")
+    assert [c["text"] for c in clauses] == ["open github", "search decorators"]
+    assert clauses[1]["sequential"] is True
+
+
+def test_reference_and_danger_start_new_stage():
+    commands = [
+        {"intent": Intent.OPEN_BROWSER, "text": "open github"},
+        {"intent": Intent.SEARCH_WEB, "text": "search cats"},
+        {"intent": Intent.OPEN_BROWSER, "text": "open it again"},
+        {"intent": Intent.OPEN_TERMINAL, "text": "open terminal"},
+        {"intent": Intent.LIST_FILES, "text": "list downloads"},
+    ]
+    assert plan_stages(commands, DANGEROUS_INTENTS) == [[0, 1], [2], [3], [4]]
+
+
+def test_independent_actions_run_in_parallel():
+    GLOBAL_INTERRUPT.clear()
+    executor = ActionExecutor()
+
+    # Both actions must be in flight at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=2)
+
+    def fake_open_browser(url=None, target=None):
+        barrier.wait()
+        return {"success": True, "message": f"Opening {target}"}
+
+    def fake_search_web(query=None, target=None):
+        barrier.wait()
+        return {"success": True, "message": f"Searching for {query}"}
+
+    executor.system_actions.open_browser = fake_open_browser
+    executor.system_actions.search_web = fake_search_web
+
+    result = executor.execute_compound([
+        {"intent": Intent.OPEN_BROWSER, "text": "open youtube", "confidence": 0.9},
+        {"intent": Intent.SEARCH_WEB, "text": "search python asyncio", "confidence": 0.8},
+    ])
+
+    assert result["success"] is True
+    assert result["stages"] == [[0, 1]]
+    assert result["message"] == "Opening youtube | Searching for python asyncio"
+    assert result["confidence"] == 0.8
@@ -0,0 +1,97 @@
+"""
+Day 22.2 Test — Next-Intent Model + Prefetch
+
+Purpose:
+- Markov transitions are learned online and from the log
+- Predicted directory listings are warmed in the background
+- Hits, misses and wasted work are tracked from what the action actually took
+"""
+
+from core.intelligence.next_intent_model import NextIntentModel
+from core.actions.prefetcher import Prefetcher
+from core.system.prefetch_cache import PrefetchCache
+from core.skills.system_actions import SystemActions
+
+
+def test_model_learns_from_log():
+    model = NextIntentModel()
+    model.train(["list_files", "open_file", "list_files", "open_file", "search_web"])
+
+    prediction = model.predict("list_files")
+    assert prediction[0]["intent"] == "open_file"
+    assert prediction[0]["probability"] == 1.0
+
+
+def test_model_needs_minimum_observations():
+    model = NextIntentModel(min_observations=2)
+    model.observe("search_web", {"query": "cats"})
+    model.observe("open_browser", {"target": "youtube"})
+
+    assert model.predict("search_web") == []
+
+
+def test_online_prediction_keeps_args():
+    model = NextIntentModel()
+    for _ in range(2):
+        model.observe("open_file_manager", {"path": "/tmp/x", "target": "custom_path"})
+        model.observe("list_files", {"path": "/tmp/x", "target": "custom_path"})
+
+    prediction = model.predict("open_file_manager", {"target": "custom_path"})
+    assert prediction[0]["state"] == "list_files:custom_path"
+    assert prediction[0]["args"]["path"] == "/tmp/x"
+
+
+def test_prefetched_listing_is_used_and_scored(tmp_path):
+    (tmp_path / "report.txt").write_text("x")
+
+    actions = SystemActions()
+    prefetcher = Prefetcher(actions.prefetch_cache)
+
+    prefetcher.schedule(
+        [{"intent": "list_files", "probability": 0.9, "args": {"path": str(tmp_path)}}],
+        current_args={},
+    )
+    prefetcher._pending["future"].result(timeout=2)
+
+    # Change the folder after prefetch: the cached listing is served once
+    (tmp_path / "late.txt").write_text("y")
+    assert actions.list_files(str(tmp_path))["files"] == ["report.txt"]
+    assert sorted(actions.list_files(str(tmp_path))["files"]) == ["late.txt", "report.txt"]
+
+    prefetcher.resolve("list_files")
+    assert prefetcher.stats["hits"] == 1
+    assert prefetcher.hit_rate() == 1.0
+
+
+def test_wasted_prefetch_is_capped(tmp_path):
+    prefetcher = Prefetcher(PrefetchCache(), max_wasted_seconds=0.0)
+    prediction = [{"intent": "list_files", "probability": 0.9, "args": {"path": str(tmp_path)}}]
+
+    prefetcher.schedule(prediction, current_args={})
+    prefetcher._pending["future"].result(timeout=2)
+    prefetcher.resolve("search_web")
+    assert prefetcher.stats["misses"] == 1
+
+    prefetcher.schedule(prediction, current_args={})
+    assert prefetcher.stats["skipped"] == 1
+
+
+def test_right_intent_unused_listing_is_waste(tmp_path):
+    actions = SystemActions()
+    prefetcher = Prefetcher(actions.prefetch_cache)
+    other = tmp_path / "other"
+    other.mkdir()
+
+    prefetcher.schedule(
+        [{"intent": "list_files", "probability": 0.9, "args": {"path": str(tmp_path)}}],
+        current_args={},
+    )
+    prefetcher._pending["future"].result(timeout=2)
+
+    # Same intent, different folder: the warmed listing is never taken
+    actions.list_files(str(other))
+    prefetcher.resolve("list_files")
+
+    assert prefetcher.stats["hits"] == 0 and prefetcher.stats["misses"] == 1
+    assert prefetcher.stats["saved_seconds"] == 0.0
+    assert ("listdir", str(tmp_path)) not in actions.prefetch_cache._items
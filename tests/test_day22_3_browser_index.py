@@ -0,0 +1,118 @@
+"""
+Day 22.3 Test — Browser Bookmark / History Index
+
+Purpose:
+- Index Firefox and Chromium fixture profiles
+- Rank by visit frequency, bookmarks included
+- Refresh only when a source file changes
+- open_browser uses the index before falling back to google
+"""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from core.system.browser_index import BrowserIndex
+from core.nlp.argument_extractor import ArgumentExtractor
+
+
+def _firefox_profile(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE moz_places (id INTEGER PRIMARY KEY, url TEXT, title TEXT, visit_count INTEGER);
+        CREATE TABLE moz_bookmarks (id INTEGER PRIMARY KEY, type INTEGER, fk INTEGER, title TEXT);
+        INSERT INTO moz_places VALUES (1, 'https://grafana.lab.local/d/main', 'Grafana - Main Dashboard', 40);
+        INSERT INTO moz_places VALUES (2, 'https://wiki.lab.local/dashboard-howto', 'Dashboard howto', 2);
+        INSERT INTO moz_places VALUES (3, 'https://jira.lab.local/', 'Issues', 0);
+        INSERT INTO moz_bookmarks VALUES (1, 1, 3, 'Jira board');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+
+def _chromium_profile(tmp_path):
+    bookmarks = tmp_path / "Bookmarks"
+    bookmarks.write_text(json.dumps({
+        "roots": {
+            "bookmark_bar": {
+                "type": "folder",
+                "children": [
+                    {"type": "url", "name": "Home Assistant", "url": "http://hass.local:8123/"},
+                    {"type": "url", "name": "Local file", "url": "file:///etc/hosts"},
+                ],
+            }
+        }
+    }))
+
+    history = tmp_path / "History"
+    conn = sqlite3.connect(history)
+    conn.executescript(
+        """
+        CREATE TABLE urls (id INTEGER PRIMARY KEY, url TEXT, title TEXT, visit_count INTEGER);
+        INSERT INTO urls VALUES (1, 'https://news.ycombinator.com/', 'Hacker News', 120);
+        """
+    )
+    conn.commit()
+    conn.close()
+    return str(bookmarks), str(history)
+
+
+@pytest.fixture
+def index(tmp_path):
+    places = tmp_path / "places.sqlite"
+    _firefox_profile(places)
+    bookmarks, history = _chromium_profile(tmp_path)
+
+    idx = BrowserIndex(sources=[
+        ("firefox", str(places)),
+        ("chromium_bookmarks", bookmarks),
+        ("chromium_history", history),
+    ])
+    assert idx.refresh() is True
+    return idx
+
+
+def test_lookup_prefers_more_matching_words(index):
+    hit = index.lookup("open the grafana dashboard")
+    assert hit["url"] == "https://grafana.lab.local/d/main"
+
+
+def test_frequency_wins_for_shared_keyword(index):
+    hit = index.lookup("open dashboard")
+    assert hit["url"] == "https://grafana.lab.local/d/main"
+
+
+def test_bookmarks_and_history_are_indexed(index):
+    assert index.lookup("open jira")["url"] == "https://jira.lab.local/"
+    assert index.lookup("open home assistant")["url"] == "http://hass.local:8123/"
+    assert index.lookup("open hacker news")["url"] == "https://news.ycombinator.com/"
+    assert index.lookup("open hosts") is None
+
+
+def test_refresh_skips_unchanged_sources(index, tmp_path):
+    assert index.refresh() is False
+
+    bookmarks = tmp_path / "Bookmarks"
+    bookmarks.write_text(json.dumps({"roots": {}}))
+    os.utime(bookmarks, (1, 1))
+
+    assert index.refresh() is True
+    assert index.lookup("open home assistant") is None
+
+
+def test_extractor_uses_index_before_default(index):
+    extractor = ArgumentExtractor(browser_index=index)
+
+    args = extractor.extract_for_intent("open the grafana dashboard", "open_browser")
+    assert args["url"] == "https://grafana.lab.local/d/main"
+
+    # Hardcoded sites still win
+    args = extractor.extract_for_intent("open github", "open_browser")
+    assert args["url"] == "https://github.com"
+
+    args = extractor.extract_for_intent("open browser", "open_browser")
+    assert args["target"] == "default"
@@ -0,0 +1,105 @@
+"""
+Day 22.4 Test — Learned Phrase Shortcuts
+
+Purpose:
+- Confirmed phrases resolve with one lookup
+- Shortcuts survive a restart
+- Dangerous intents and reference phrases are never learned
+- TTL and LFU keep the table bounded
+- File names and paths are never replayed; invalid entries are dropped
+"""
+
+import json
+import os
+
+import pytest
+
+from core.memory.phrase_shortcuts import PhraseShortcuts
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "shortcuts" / "tester.json")
+
+
+def make(path):
+    return PhraseShortcuts(blocked_intents={"open_terminal"}, path=path)
+
+
+def test_learned_phrase_is_normalized_and_persisted(path):
+    shortcuts = make(path)
+    assert shortcuts.learn("Um, my grafana thing", "open_browser", {"url": "https://g.local", "target": "grafana"})
+
+    restarted = make(path)
+    hit = restarted.lookup("my grafana thing please")
+    assert hit == {"intent": "open_browser", "args": {"url": "https://g.local", "target": "grafana"}}
+
+
+def test_free_text_slots_are_not_stored(path):
+    shortcuts = make(path)
+    shortcuts.learn("look that up", "search_web", {"query": "python decorators"})
+    shortcuts.learn("find stuff", "search_web", {"query": "python decorators", "target": "web_search"})
+
+    assert shortcuts.lookup("look that up") is None
+    assert shortcuts.lookup("find stuff")["args"] == {"target": "web_search"}
+
+
+def test_dangerous_intent_never_learned_or_replayed(path):
+    shortcuts = make(path)
+    assert shortcuts.learn("the black box", "open_terminal", {}) is False
+    assert shortcuts.lookup("the black box") is None
+
+    # Even a hand-edited file cannot smuggle one in
+    shortcuts._items["the black box"] = {"intent": "open_terminal", "args": {}, "hits": 0, "last_used": 1e12}
+    assert shortcuts.lookup("the black box") is None
+
+
+def test_reference_phrase_not_learned(path):
+    shortcuts = make(path)
+    assert shortcuts.learn("open it again", "open_browser", {}) is False
+
+
+def test_ttl_and_lfu_eviction(path, monkeypatch):
+    shortcuts = make(path)
+    monkeypatch.setattr(PhraseShortcuts, "MAX_ITEMS", 2)
+
+    shortcuts.learn("alpha site", "open_browser", {})
+    shortcuts.learn("beta site", "open_browser", {})
+    shortcuts.lookup("alpha site")
+    shortcuts.learn("gamma site", "open_browser", {})
+
+    # beta had no hits → evicted first
+    assert shortcuts.lookup("beta site") is None
+    assert shortcuts.lookup("alpha site") is not None
+
+    shortcuts._items["gamma site"]["last_used"] -= PhraseShortcuts.TTL_SECONDS + 1
+    assert shortcuts.lookup("gamma site") is None
+
+
+def test_file_and_path_slots_are_not_stored(path):
+    shortcuts = make(path)
+    shortcuts.learn("the quarterly thing", "open_file", {"filename": "report.txt", "full_path": "/tmp/report.txt"})
+    shortcuts.learn("my stuff folder", "list_files", {"path": "/home/me/stuff", "target": "custom_path"})
+
+    assert shortcuts.lookup("the quarterly thing")["args"] == {}
+    assert shortcuts.lookup("my stuff folder")["args"] == {"target": "custom_path"}
+
+
+def test_invalid_entries_are_discarded(path):
+    os.makedirs(os.path.dirname(path))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "old thing": {"intent": "open_music_player", "args": {}, "hits": 3, "last_used": 1e12},
+            "broken": {"intent": "open_browser"},
+            "my grafana": {"intent": "open_browser", "args": {}, "hits": 0, "last_used": 1e12},
+        }, f)
+
+    shortcuts = make(path)
+    assert len(shortcuts) == 1
+    assert shortcuts.lookup("old thing") is None
+    assert shortcuts.lookup("my grafana")["intent"] == "open_browser"
+
+    # Edited in memory after loading: dropped on lookup, never returned
+    shortcuts._items["renamed"] = {"intent": "no_such_intent", "args": {}, "hits": 0, "last_used": 1e12}
+    assert shortcuts.lookup("renamed") is None and "renamed" not in shortcuts._items
+    assert shortcuts.learn("whatever", "no_such_intent", {}) is False
@@ -0,0 +1,58 @@
+"""
+Day 22.5 Test — Unclear Utterance Mining
+
+Purpose:
+- Clarification failures are appended to a JSONL log
+- Near-duplicate phrasings cluster together (MinHash LSH)
+- Unknown words surface as vocabulary suggestions
+"""
+
+import json
+
+from core.intelligence.utterance_log import UnclearUtteranceLog
+from core.intelligence.utterance_miner import MinHasher, cluster_signatures, mine
+
+
+def test_log_appends_json_lines(tmp_path):
+    log = UnclearUtteranceLog(str(tmp_path / "data" / "unclear.jsonl"))
+    log.record("fire up youtube", "open_browser", 0.41)
+    log.record("", "unknown", 0.0)
+
+    lines = (tmp_path / "data" / "unclear.jsonl").read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["text"] == "fire up youtube"
+
+
+def test_identical_text_has_identical_signature():
+    sigs = MinHasher().signatures([["fire", "up", "youtube"], ["fire", "up", "youtube"], ["list", "my", "music"]])
+    assert (sigs[0] == sigs[1]).all()
+    assert not (sigs[0] == sigs[2]).all()
+
+
+def test_similar_phrasings_share_a_cluster():
+    token_lists = [
+        "fire up the youtube app now".split(),
+        "fire up the youtube app".split(),
+        "what is the weather like today".split(),
+    ]
+    roots = cluster_signatures(MinHasher().signatures(token_lists))
+    assert roots[0] == roots[1]
+    assert roots[2] != roots[0]
+
+
+def test_mine_reports_biggest_cluster_with_suggestions():
+    lines = []
+    for text in ["fire up youtube", "fire up youtube", "fire up youtube now", "fire up youtube please"]:
+        lines.append(json.dumps({"text": text, "intent": "open_browser", "confidence": 0.4}))
+    lines.append(json.dumps({"text": "what time is it in tokyo", "intent": "unknown", "confidence": 0.0}))
+    lines.append("not json")
+
+    report = mine(lines, top=2)
+
+    assert report[0]["size"] == 4
+    assert report[0]["intent"] == "open_browser"
+    suggestions = {s["token"]: s["table"] for s in report[0]["suggestions"]}
+    assert suggestions["fire"] == "VERB_ALIASES"
+    assert "youtube" not in suggestions  # already known
+
+    assert report[1]["intent"] is None
@@ -0,0 +1,115 @@
+"""
+Day 23.2 Test — VAD + Adaptive Endpointing
+
+Purpose:
+- Vectorized features separate tones (speech stand-in) from silence and hiss
+- Short commands close after the minimum hangover, not 0.8 s
+- Utterances with internal pauses are not cut mid-sentence
+- capture_utterance returns a clip straight out of the ring
+- A per-call timeout never leaks into the next call; clips always fit the ring
+"""
+
+from core.audio.recorder import FRAME_MS, RingBufferRecorder, WavFileSource
+from core.audio.vad import (
+    ENDED,
+    AdaptiveEndpointer,
+    VoiceActivityDetector,
+    capture_utterance,
+    frame_features,
+)
+from tests.audio_fixtures import concat, noise, silence, tone, write_wav
+
+
+def test_features_are_one_row_per_frame():
+    f = frame_features(concat(silence(0.3), tone(0.3)))
+    assert len(f["energy_db"]) == 20
+    assert f["energy_db"][:10].max() < f["energy_db"][10:].min()
+
+
+def test_vad_rejects_silence_and_broadband_noise():
+    vad = VoiceActivityDetector()
+
+    assert not vad.classify(silence(0.3)).any()
+    assert not vad.classify(noise(0.3, level=3000)).any()
+    assert vad.classify(tone(0.3)).all()
+
+
+def test_short_command_closes_after_min_hangover():
+    vad = VoiceActivityDetector()
+    endpointer = AdaptiveEndpointer()
+
+    state = endpointer.feed(vad.classify(concat(silence(0.2), tone(0.5), silence(1.5))))
+
+    assert state == ENDED
+    delay_ms = (endpointer.frame_index - endpointer.speech_end) * FRAME_MS
+    assert delay_ms == 240
+
+
+def test_internal_pause_stretches_hangover():
+    vad = VoiceActivityDetector()
+    # A 210 ms pause teaches the endpointer that this speaker pauses,
+    # so the later 270 ms pause no longer ends the utterance
+    flags = vad.classify(concat(tone(0.42), silence(0.21), tone(0.42), silence(0.27), tone(0.42), silence(1.5)))
+
+    adaptive = AdaptiveEndpointer()
+    adaptive.feed(flags)
+    fixed = AdaptiveEndpointer(max_hangover_ms=240)
+    fixed.feed(flags)
+
+    assert adaptive.state == fixed.state == ENDED
+    assert (adaptive.speech_end - adaptive.speech_start) * FRAME_MS >= 1700
+    assert (fixed.speech_end - fixed.speech_start) * FRAME_MS < 1200
+    assert adaptive.hangover_frames() * FRAME_MS > 240
+
+
+def test_capture_utterance_from_ring(tmp_path):
+    audio = concat(silence(0.5), tone(0.6), silence(1.0))
+    source = WavFileSource(write_wav(tmp_path / "cmd.wav", audio))
+    recorder = RingBufferRecorder(source, capacity_seconds=5.0)
+    reader = recorder.reader("asr")
+    recorder.start()
+
+    clip = capture_utterance(reader, VoiceActivityDetector(), AdaptiveEndpointer(), timeout=2.0, catch_up=False)
+    recorder.stop()
+
+    assert clip is not None
+    assert 0.6 <= clip.duration <= 1.2
+    assert abs(clip.endpoint_delay - 0.24) < 0.01
+    assert len(clip.to_bytes()) == memoryview(clip.pcm).nbytes
+
+
+def test_capture_returns_none_without_speech(tmp_path):
+    source = WavFileSource(write_wav(tmp_path / "quiet.wav", silence(1.0)))
+    recorder = RingBufferRecorder(source, capacity_seconds=2.0)
+    reader = recorder.reader("asr")
+    recorder.start()
+
+    assert capture_utterance(reader, VoiceActivityDetector(), AdaptiveEndpointer(), timeout=0.5) is None
+    recorder.stop()
+
+
+def test_timeout_applies_to_one_call_only(tmp_path):
+    source = WavFileSource(write_wav(tmp_path / "quiet.wav", silence(1.0)))
+    recorder = RingBufferRecorder(source, capacity_seconds=2.0)
+    reader = recorder.reader("asr")
+    endpointer = AdaptiveEndpointer()
+    recorder.start()
+
+    assert capture_utterance(reader, VoiceActivityDetector(), endpointer, timeout=0.5) is None
+    recorder.stop()
+    assert endpointer.start_timeout_frames is None
+    assert endpointer.max_frames == 15000 // FRAME_MS
+
+
+def test_long_utterance_is_capped_to_the_ring_and_copied(tmp_path):
+    audio = concat(silence(0.3), tone(2.0), silence(0.5))
+    source = WavFileSource(write_wav(tmp_path / "long.wav", audio), realtime=True)
+    recorder = RingBufferRecorder(source, capacity_seconds=1.0)
+    reader = recorder.reader("asr")
+    recorder.start()
+
+    clip = capture_utterance(reader, VoiceActivityDetector(), AdaptiveEndpointer(), timeout=2.0)
+    recorder.stop()
+
+    assert clip is not None and clip.duration <= 1.0
+    assert isinstance(clip.pcm, bytes)            # would be overwritten as a view
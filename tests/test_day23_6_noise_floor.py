@@ -0,0 +1,97 @@
+"""
+Day 23.6 Test — Background Noise Floor
+
+Purpose:
+- The floor follows the ambient level, not intermittent speech
+- A background thread keeps it current from the ring recorder
+- VAD and the recognizer read the published value with no calibration pause
+"""
+
+import time
+
+import numpy as np
+
+from core.audio.noise_floor import NoiseFloorEstimator
+from core.audio.recorder import RingBufferRecorder, WavFileSource
+from core.audio.vad import VoiceActivityDetector
+from core.speech.google_engine import GoogleSpeechEngine
+from tests.audio_fixtures import concat, noise, silence, tone, write_wav
+
+
+def test_floor_tracks_ambient_not_speech():
+    estimator = NoiseFloorEstimator(window_seconds=3.0)
+
+    # Quiet room with short bursts of speech
+    for i in range(6):
+        estimator.observe(noise(0.3, level=50, seed=i))
+        estimator.observe(tone(0.15))
+    quiet = estimator.noise_floor_db
+
+    # Fan switched on
+    estimator.observe(noise(3.0, level=1000, seed=9))
+    loud = estimator.noise_floor_db
+
+    assert quiet < -50
+    assert loud - quiet > 20
+    assert estimator.energy_threshold > 1000 * 0.5
+
+
+def test_background_thread_updates_from_ring(tmp_path):
+    audio = concat(noise(1.0, level=400), tone(0.3), noise(1.0, level=400))
+    recorder = RingBufferRecorder(WavFileSource(write_wav(tmp_path / "room.wav", audio)), capacity_seconds=5)
+    estimator = NoiseFloorEstimator(window_seconds=2.0)
+    estimator.attach(recorder)
+    recorder.start()
+
+    deadline = time.time() + 2
+    while estimator.updates < 5 and time.time() < deadline:
+        time.sleep(0.01)
+    estimator.stop()
+    recorder.stop()
+
+    expected = 20 * np.log10(400 / 32768)
+    assert estimator.updates >= 5
+    assert abs(estimator.noise_floor_db - expected) < 3
+
+
+def test_vad_threshold_follows_estimator():
+    estimator = NoiseFloorEstimator()
+    vad = VoiceActivityDetector(noise_floor=estimator)
+    estimator.observe(noise(1.0, level=2000))
+
+    assert vad.threshold_db() == estimator.noise_floor_db + vad.energy_margin_db
+    # Quiet tone is now below threshold, but still heard in a quiet room
+    quiet_tone = tone(0.3, level=1500)
+    assert not vad.classify(quiet_tone).any()
+    assert VoiceActivityDetector().classify(quiet_tone).all()
+
+
+class Stream:
+    sample_rate = 16000
+
+    def __init__(self, samples):
+        self.data = samples.tobytes()
+        self.pos = 0
+
+    def read(self, n):
+        chunk = self.data[self.pos:self.pos + 2 * n]
+        self.pos += 2 * n
+        return chunk.ljust(2 * n, b"\0")
+
+
+def test_recognizer_threshold_published_without_calibration():
+    estimator = NoiseFloorEstimator()
+    estimator.observe(noise(2.0, level=300))
+
+    stream = Stream(concat(noise(0.5, level=300), tone(0.5), silence(1.5)))
+    engine = GoogleSpeechEngine(device_manager=stream, noise_floor=estimator)
+    published = estimator.energy_threshold
+
+    started = time.perf_counter()
+    clip = engine.listen(timeout=2)
+    elapsed = time.perf_counter() - started
+
+    assert engine.recognizer.energy_threshold == published
+    assert not engine.recognizer.dynamic_energy_threshold
+    assert clip.duration > 0.5
+    assert elapsed < 0.5       # no blocking ambient calibration
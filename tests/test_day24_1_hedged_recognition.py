@@ -0,0 +1,113 @@
+"""
+Day 24.1 Test — Hedged Recognition
+
+Purpose:
+- A fast primary answers alone (no hedge)
+- A slow primary is beaten by the hedge after the delay
+- Low-confidence or failing primaries trigger the hedge early
+- Per-engine latency and hedge win rates are reported
+"""
+
+import time
+
+from core.audio.clip import AudioClip
+from core.speech.engine import SpeechEngine
+from core.speech.hedged import HedgedRecognizer
+from core.speech.file_engine import FileSpeechEngine
+from tests.audio_fixtures import tone, write_wav
+
+
+class ScriptedEngine(SpeechEngine):
+    def __init__(self, name, script):
+        self.name = name
+        self.script = list(script)       # (delay, text, confidence) or Exception
+        self.calls = 0
+
+    def recognize(self, clip):
+        step = self.script[self.calls % len(self.script)]
+        self.calls += 1
+        if isinstance(step, Exception):
+            raise step
+        delay, text, confidence = step
+        time.sleep(delay)
+        return {"text": text, "confidence": confidence}
+
+
+CLIP = AudioClip(pcm=bytes(3200))
+
+
+def test_fast_primary_wins_without_hedge():
+    primary = ScriptedEngine("cloud", [(0.01, "open youtube", 0.9)])
+    secondary = ScriptedEngine("local", [(0.01, "open you tube", 0.9)])
+    hedged = HedgedRecognizer(primary, secondary, hedge_delay=0.2)
+
+    result = hedged.recognize(CLIP)
+
+    assert result["text"] == "open youtube"
+    assert result["engine"] == "cloud"
+    assert not result["hedged"]
+    assert secondary.calls == 0
+
+
+def test_slow_primary_loses_to_hedge():
+    primary = ScriptedEngine("cloud", [(1.0, "open youtube", 0.95)])
+    secondary = ScriptedEngine("local", [(0.05, "open youtube", 0.8)])
+    hedged = HedgedRecognizer(primary, secondary, hedge_delay=0.1)
+
+    started = time.perf_counter()
+    result = hedged.recognize(CLIP)
+    elapsed = time.perf_counter() - started
+
+    assert result["engine"] == "local"
+    assert result["hedged"]
+    assert elapsed < 0.5
+    assert hedged.report()["hedge_win_rate"] == 1.0
+
+
+def test_low_confidence_primary_triggers_hedge_early():
+    primary = ScriptedEngine("cloud", [(0.01, "open you", 0.2)])
+    secondary = ScriptedEngine("local", [(0.01, "open youtube", 0.9)])
+    hedged = HedgedRecognizer(primary, secondary, hedge_delay=5.0)
+
+    started = time.perf_counter()
+    result = hedged.recognize(CLIP)
+
+    assert result["text"] == "open youtube"
+    assert time.perf_counter() - started < 1.0
+
+
+def test_best_effort_when_nothing_clears_floor():
+    primary = ScriptedEngine("cloud", [(0.01, "open you", 0.3)])
+    secondary = ScriptedEngine("local", [(0.02, "open yo", 0.1)])
+    hedged = HedgedRecognizer(primary, secondary, hedge_delay=0.05, confidence_floor=0.5)
+
+    result = hedged.recognize(CLIP)
+    assert result["text"] == "open you"
+
+
+def test_failing_primary_and_latency_report():
+    primary = ScriptedEngine("cloud", [RuntimeError("network down"), (0.01, "turn on wifi", 0.9)])
+    secondary = ScriptedEngine("local", [(0.01, "turn on wifi", 0.7)])
+    hedged = HedgedRecognizer(primary, secondary, hedge_delay=5.0)
+
+    assert hedged.recognize(CLIP)["engine"] == "local"
+    assert hedged.recognize(CLIP)["engine"] == "cloud"
+
+    report = hedged.report()
+    assert report["requests"] == 2
+    assert report["hedges"] == 1
+    assert report["wins"] == {"cloud": 1, "local": 1}
+    assert report["latency"]["cloud"]["count"] == 2
+    assert report["latency"]["local"]["p50_ms"] >= 10
+
+
+def test_file_engines_as_stand_ins(tmp_path):
+    write_wav(tmp_path / "00.wav", tone(0.2))
+    (tmp_path / "00.txt").write_text("what time is it\n")
+
+    primary = FileSpeechEngine(corpus_dir=str(tmp_path), latency_script=[0.5], name="cloud")
+    secondary = FileSpeechEngine(corpus_dir=str(tmp_path), latency_script=[0.01], name="local")
+    hedged = HedgedRecognizer(primary, secondary, hedge_delay=0.05)
+
+    assert hedged.listen_once() == "what time is it"
+    assert hedged.stats["hedge_wins"] == 1
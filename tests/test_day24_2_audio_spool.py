@@ -0,0 +1,104 @@
+"""
+Day 24.2 Test — Audio Spool
+
+Purpose:
+- Utterances append to one WAV with a JSONL index (turn, times, transcript)
+- The file is a valid WAV while open and after reopening
+- Writes use one bounded mmap window, however long the session
+- Replay streams the spool back through VAD + endpointing
+- Closing the input controller closes (and trims) the spool
+"""
+
+import wave
+
+import numpy as np
+
+from benchmarks.replay_spool import replay
+from core.audio.clip import AudioClip
+from core.audio.spool import HEADER_BYTES, AudioSpool
+from core.input_controller import InputController
+from core.speech.engine import SpeechEngine
+from tests.audio_fixtures import noise, tone
+
+
+def test_append_index_and_read_back(tmp_path):
+    path = str(tmp_path / "session.wav")
+    spool = AudioSpool(path)
+    a, b = tone(0.5), noise(0.3, level=500)
+
+    spool.append(a.tobytes(), transcript="open youtube", turn_id=1, started_at=10.0, ended_at=11.0)
+    spool.append(b.tobytes(), transcript="turn on wifi", turn_id=2)
+
+    entries = spool.entries()
+    assert [e["transcript"] for e in entries] == ["open youtube", "turn on wifi"]
+    assert entries[1]["offset"] == len(a)
+    assert np.array_equal(np.asarray(spool.read(entries[0])), a)
+
+    # Valid WAV even before close
+    with wave.open(path, "rb") as wav:
+        assert wav.getnframes() == len(a) + len(b)
+    spool.close()
+
+    reopened = AudioSpool(path)
+    assert len(reopened.entries()) == 2
+    reopened.append(tone(0.1).tobytes(), transcript="third")
+    assert reopened.entries()[-1]["turn_id"] == 3
+    assert np.array_equal(np.asarray(reopened.read(reopened.entries()[1])), b)
+    reopened.close()
+
+
+def test_long_session_uses_bounded_window(tmp_path):
+    spool = AudioSpool(str(tmp_path / "long.wav"), window_bytes=64 * 1024, grow_bytes=256 * 1024)
+    chunk = noise(1.0, level=300).tobytes()           # 32 KB
+
+    for i in range(40):                               # 1.28 MB total
+        spool.append(chunk, transcript=f"turn {i}")
+        assert len(spool._window) == 64 * 1024
+
+    assert abs(spool.duration - 40.0) < 1e-6
+    spool.close()
+    assert (tmp_path / "long.wav").stat().st_size == 44 + 40 * len(chunk)
+
+
+def test_replay_recaptures_each_turn(tmp_path):
+    spool = AudioSpool(str(tmp_path / "s.wav"))
+    for seconds in (0.4, 0.7):
+        spool.append(tone(seconds).tobytes(), transcript=f"{seconds}s")
+
+    rows = replay(spool, spool.entries())
+    spool.close()
+
+    assert [r["captured"] for r in rows] == [True, True]
+    assert [r["transcript"] for r in rows] == ["0.4s", "0.7s"]
+    assert abs((rows[1]["duration_s"] - rows[0]["duration_s"]) - 0.3) < 0.05
+    assert all(r["endpoint_delay_ms"] == 240 for r in rows)
+
+
+class OneClipEngine(SpeechEngine):
+    name = "one"
+
+    def listen(self, timeout=None):
+        return AudioClip(pcm=tone(0.3).tobytes())
+
+    def recognize(self, clip):
+        return {"text": "rudra what time is it", "confidence": 0.9}
+
+
+def test_input_controller_spools_turns(tmp_path):
+    ic = InputController(engine=OneClipEngine(), push_to_talk=False)
+    ic.spool = AudioSpool(str(tmp_path / "turns.wav"))
+
+    assert ic.read() == "what time is it"
+    entry = ic.spool.entries()[0]
+    assert entry["transcript"] == "rudra what time is it"
+    assert entry["samples"] == len(tone(0.3))
+    assert entry["ended_at"] >= entry["started_at"]
+
+    # Shutdown trims the preallocation and leaves a readable file
+    ic.close()
+    ic.close()
+    assert ic.spool is None
+    reopened = AudioSpool(str(tmp_path / "turns.wav"))
+    assert [e["transcript"] for e in reopened.entries()] == ["rudra what time is it"]
+    assert (tmp_path / "turns.wav").stat().st_size == HEADER_BYTES + entry["samples"] * 2
+    reopened.close()
@@ -0,0 +1,107 @@
+"""
+Day 24.3 Test — Barge-In
+
+Purpose:
+- "stop" on the audio stream triggers GLOBAL_INTERRUPT while armed
+- Nothing fires while disarmed, or for non-interrupt keywords
+- InputController arms after a command and disarms before listening
+- Detection and cancellation latency are reported
+"""
+
+import time
+
+from core.audio.barge_in import BargeInListener
+from core.audio.keyword_spotter import KeywordSpotter
+from core.audio.recorder import RingBufferRecorder, WavFileSource
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.input_controller import InputController
+from core.speech.file_engine import FileSpeechEngine
+from tests.audio_fixtures import chirp, concat, noise, silence, tone, write_wav
+
+
+def stop_word(seed=0):
+    word = chirp(0.4, 1500, 500)
+    return word + noise(0.4, 150, seed)
+
+
+def make_spotter():
+    spotter = KeywordSpotter()
+    spotter.enroll("stop", [concat(silence(0.1), stop_word(i), silence(0.1)) for i in range(3)])
+    spotter.enroll("rudra", [concat(silence(0.1), chirp(0.5, 300, 1200), silence(0.1))])
+    return spotter
+
+
+def start_listener(tmp_path, audio):
+    recorder = RingBufferRecorder(
+        WavFileSource(write_wav(tmp_path / "room.wav", audio), realtime=True), capacity_seconds=5
+    )
+    listener = BargeInListener(recorder, make_spotter())
+    listener.start()
+    return recorder, listener
+
+
+def wait_until(predicate, seconds=3.0):
+    deadline = time.time() + seconds
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_stop_word_triggers_interrupt_while_armed(tmp_path):
+    GLOBAL_INTERRUPT.clear()
+    recorder, listener = start_listener(tmp_path, concat(tone(0.5), silence(0.3), stop_word(7), silence(0.6)))
+    listener.arm()
+    recorder.start()
+
+    try:
+        assert wait_until(GLOBAL_INTERRUPT.is_triggered)
+        assert listener.last_detection["keyword"] == "stop"
+        assert not listener.armed                     # one shot per arm
+        assert listener.acknowledge() is not None
+
+        report = listener.report()
+        assert report["detections"] == 1
+        assert report["detect_latency"]["p50_ms"] < 300
+        assert report["utterance_to_cancel"]["count"] == 1
+    finally:
+        listener.stop()
+        recorder.stop()
+        GLOBAL_INTERRUPT.clear()
+
+
+def test_disarmed_listener_and_other_keywords_do_not_fire(tmp_path):
+    GLOBAL_INTERRUPT.clear()
+    audio = concat(silence(0.2), stop_word(), silence(0.3), chirp(0.5, 300, 1200), silence(0.6))
+    recorder, listener = start_listener(tmp_path, audio)
+    recorder.start()
+
+    try:
+        time.sleep(0.45)             # "stop" spoken while disarmed
+        listener.arm()               # "rudra" is not an interrupt phrase
+        assert not wait_until(GLOBAL_INTERRUPT.is_triggered, 1.2)
+        assert listener.stats["ignored"] == 1
+    finally:
+        listener.stop()
+        recorder.stop()
+        GLOBAL_INTERRUPT.clear()
+
+
+def test_input_controller_arms_during_execution(tmp_path):
+    GLOBAL_INTERRUPT.clear()
+    recorder = RingBufferRecorder(WavFileSource(write_wav(tmp_path / "mic.wav", silence(0.5))), capacity_seconds=2)
+    listener = BargeInListener(recorder, make_spotter())
+
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    write_wav(corpus / "00.wav", tone(0.2))
+    (corpus / "00.txt").write_text("rudra open youtube\n")
+
+    ic = InputController(
+        engine=FileSpeechEngine(corpus_dir=str(corpus)), push_to_talk=False, recorder=recorder, barge_in=listener
+    )
+
+    assert ic.read() == "open youtube"
+    assert listener.armed
+    assert ic.read() == ""          # corpus exhausted
+    assert not listener.armed
+    listener.stop()
@@ -0,0 +1,109 @@
+"""
+Day 24.4 Test — Speech Output
+
+Purpose:
+- The stand-in synthesizer is deterministic
+- Fixed phrases come from a content-addressed cache (memory + disk)
+- Playback starts after the first sentence, not the whole response
+- GLOBAL_INTERRUPT stops playback between chunks
+- A backend's real sample rate is known before the first response
+"""
+
+import threading
+import time
+
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.speech.tts import NullPlayer, PCMCache, SpeechOutput, ToneSynthesizer, split_sentences
+
+
+def test_sentence_split_and_deterministic_pcm():
+    assert split_sentences("Opening YouTube. Done! Anything else?") == ["Opening YouTube.", "Done!", "Anything else?"]
+    assert split_sentences("Wi-Fi on | Bluetooth off") == ["Wi-Fi on", "Bluetooth off"]
+
+    synth = ToneSynthesizer()
+    assert synth.synthesize("Okay, stopped.") == ToneSynthesizer().synthesize("Okay, stopped.")
+    assert len(synth.synthesize("abc")) == 3 * 640 * 2
+
+
+def test_fixed_phrases_are_cached_on_disk(tmp_path):
+    synth = ToneSynthesizer()
+    output = SpeechOutput(synth, cache=PCMCache(str(tmp_path)), fixed_phrases=["Please repeat."])
+    output.warm()
+    assert synth.calls == 1
+    assert len(list(tmp_path.rglob("*.pcm"))) == 1
+
+    # A fresh process (empty memory) reads the phrase from disk
+    synth2 = ToneSynthesizer()
+    output2 = SpeechOutput(synth2, cache=PCMCache(str(tmp_path)), fixed_phrases=["Please repeat."])
+    output2.say("Please repeat.")
+    assert synth2.calls == 0
+
+    # Free text is kept in memory only
+    output2.say("Opening downloads.")
+    assert len(list(tmp_path.rglob("*.pcm"))) == 1
+
+
+def test_playback_starts_before_full_render(tmp_path):
+    synth = ToneSynthesizer(latency=0.1)
+    output = SpeechOutput(synth, player=NullPlayer(), cache=PCMCache(None))
+
+    result = output.say("One. Two. Three. Four.")
+
+    assert result["sentences"] == 4
+    assert result["first_audio_ms"] < 180           # one render, not four
+    assert not result["interrupted"]
+
+
+def test_interrupt_stops_playback():
+    GLOBAL_INTERRUPT.clear()
+    player = NullPlayer(realtime=True)
+    output = SpeechOutput(ToneSynthesizer(), player=player, cache=PCMCache(None))
+
+    timer = threading.Timer(0.25, GLOBAL_INTERRUPT.trigger)
+    timer.start()
+    started = time.perf_counter()
+    try:
+        result = output.say("This is a long answer that would take several seconds to read out loud.")
+    finally:
+        timer.cancel()
+        GLOBAL_INTERRUPT.clear()
+
+    assert result["interrupted"]
+    assert time.perf_counter() - started < 0.5
+    assert result["played_ms"] < 400
+    assert player.stopped == 1
+
+
+def test_pyttsx3_rate_is_known_before_first_response(monkeypatch, tmp_path):
+    import sys
+    import types
+    import wave
+
+    class FakeDriver:
+        def setProperty(self, name, value):
+            pass
+
+        def save_to_file(self, text, path):
+            self.path, self.text = path, text
+
+        def runAndWait(self):
+            with wave.open(self.path, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(22050)
+                wav.writeframes(b"\x00\x00" * 220 * len(self.text))
+
+    monkeypatch.setitem(sys.modules, "pyttsx3", types.SimpleNamespace(init=FakeDriver))
+    from core.speech.tts import Pyttsx3Backend
+
+    backend = Pyttsx3Backend()
+    assert backend.sample_rate == 22050             # before any response is spoken
+
+    player = NullPlayer()
+    played_rates = []
+    player.play = lambda pcm, rate: played_rates.append(rate)
+    cache = PCMCache(str(tmp_path))
+    SpeechOutput(backend, player=player, cache=cache).say("Okay, stopped.")
+
+    assert set(played_rates) == {22050}
+    assert cache.get(PCMCache.key(backend, "Okay, stopped.")) is not None
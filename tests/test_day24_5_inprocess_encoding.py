@@ -0,0 +1,74 @@
+"""
+Day 24.5 Test — In-process Upload Encoding
+
+Purpose:
+- The request body is the capture buffer itself (audio/l16, no FLAC)
+- No subprocess is spawned per turn
+- Big-endian L16 is one vectorized swap of the same samples
+"""
+
+import subprocess
+
+import numpy as np
+
+from core.audio.clip import AudioClip
+from core.audio.recorder import RingBufferRecorder
+from core.speech.google_client import GoogleSpeechClient, encode_l16, parse_response
+from core.speech.google_engine import GoogleSpeechEngine
+from tests.audio_fixtures import tone
+from tests.google_stub import GoogleStub
+
+
+class SilentSource:
+    sample_rate = 16000
+
+    def read(self, num_samples):
+        return b""
+
+    def close(self):
+        pass
+
+
+def _engine(url):
+    recorder = RingBufferRecorder(SilentSource(), capacity_seconds=1.0)
+    return GoogleSpeechEngine(recorder=recorder, client=GoogleSpeechClient(url=url, key="test"))
+
+
+def test_little_endian_body_is_a_view_of_the_buffer():
+    samples = tone(0.5)
+    body = encode_l16(memoryview(samples))
+    assert np.shares_memory(np.frombuffer(body, dtype=np.int16), samples)
+
+
+def test_big_endian_swaps_every_sample():
+    samples = tone(0.1)
+    body = encode_l16(samples.tobytes(), big_endian=True)
+    assert np.array_equal(np.frombuffer(body, dtype=">i2"), samples)
+
+
+def test_parse_response_skips_empty_result_lines():
+    text = '{"result":[]}\n{"result":[{"alternative":[{"transcript":"a","confidence":0.8},{"transcript":"b"}]}]}\n'
+    assert parse_response(text) == [{"text": "a", "confidence": 0.8}, {"text": "b", "confidence": 0.0}]
+    assert parse_response('{"result":[]}\n') == []
+
+
+def test_engine_uploads_raw_pcm_without_subprocess(monkeypatch):
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("subprocess spawned during recognition")
+
+    monkeypatch.setattr(subprocess, "Popen", no_subprocess)
+    samples = tone(1.0)
+
+    with GoogleStub(alternatives=[("open chrome", 0.92), ("open crow", 0.4)]) as stub:
+        engine = _engine(stub.url)
+        clip = AudioClip(pcm=memoryview(samples.tobytes()), sample_rate=16000)
+        best = engine.recognize_n_best(clip, n=2)
+        top = engine.recognize(clip)
+
+    assert [b["text"] for b in best] == ["open chrome", "open crow"]
+    assert top == {"text": "open chrome", "confidence": 0.92}
+
+    request = stub.requests[0]
+    assert request["headers"]["Content-Type"] == "audio/l16; rate=16000"
+    assert request["body"] == samples.tobytes()
+    assert "lang=en-US" in request["path"] and "key=test" in request["path"]
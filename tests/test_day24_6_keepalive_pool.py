@@ -0,0 +1,89 @@
+"""
+Day 24.6 Test — Keep-alive Connection Pool
+
+Purpose:
+- Prewarmed connection is reused: no DNS / connect on the command path
+- Server-closed idle connections are retried once, transparently
+- Idle connections past max_idle are refreshed off the critical path
+- Per-request phase timings are recorded and reported
+"""
+
+import time
+
+from core.speech.google_client import GoogleSpeechClient
+from core.speech.http_pool import HTTPPool
+from tests.audio_fixtures import tone
+from tests.google_stub import GoogleStub
+
+
+def test_prewarmed_connection_is_reused_across_commands():
+    with GoogleStub() as stub:
+        client = GoogleSpeechClient(url=stub.url, key="test")
+        assert client.prewarm()
+        assert client.pool.stats["connections"] == 1
+
+        for _ in range(3):
+            assert client.recognize(tone(0.2), 16000)[0]["text"] == "open chrome"
+            assert client.last_timings["reused"]
+            assert client.last_timings["connect_ms"] == 0.0
+
+        client.close()
+
+    # One TCP connection served every request
+    assert len({r["connection"] for r in stub.requests}) == 1
+    assert client.pool.stats["connections"] == 1
+    assert client.pool.report()["reuse_rate"] == 1.0
+
+
+def test_cold_request_records_connection_phases():
+    with GoogleStub() as stub:
+        pool = HTTPPool(stub.url)
+        status, data, timings = pool.request("POST", "/speech-api/v2/recognize", body=b"\x00\x00")
+        pool.close()
+
+    assert status == 200 and b"open chrome" in data
+    assert not timings["reused"]
+    assert timings["connect_ms"] > 0.0
+    assert timings["tls_ms"] == 0.0     # plain HTTP stub
+    assert timings["total_ms"] >= timings["response_ms"]
+
+
+def test_connection_closed_by_server_is_retried_once():
+    with GoogleStub() as stub:
+        pool = HTTPPool(stub.url)
+        pool.prewarm()
+
+        # The idle keep-alive connection goes dead while unused
+        pool._idle[0].sock.shutdown(2)
+
+        status, _, timings = pool.request("POST", "/speech-api/v2/recognize", body=b"")
+        pool.close()
+
+    assert status == 200
+    assert pool.stats["retries"] == 1
+    assert not timings["reused"]
+
+
+def test_idle_connections_are_refreshed():
+    with GoogleStub() as stub:
+        pool = HTTPPool(stub.url, max_idle=0.05)
+        pool.prewarm()
+        first = pool._idle[0]
+
+        time.sleep(0.1)
+        assert pool.refresh_idle() == 1
+        assert pool.idle_count() == 1 and pool._idle[0] is not first
+
+        pool.request("POST", "/speech-api/v2/recognize", body=b"")
+        report = pool.report()
+        pool.close()
+
+    assert report["refreshed"] == 1
+    assert report["reused"] == 1
+    assert report["connect_ms"]["p50"] == 0.0
+
+
+def test_offline_prewarm_is_not_fatal():
+    client = GoogleSpeechClient(url="http://127.0.0.1:9/speech-api/v2/recognize", timeout=0.5)
+    assert client.prewarm() is False
+    assert client.pool.idle_count() == 0
@@ -0,0 +1,200 @@
+"""
+Day 25.1 Test — Out-of-process ASR Worker
+
+Purpose:
+- Another process sees the capture ring through shared memory, in place
+- The worker captures + recognizes; the main process only gets text
+- A crashed worker is detected and restarted; the next turn works
+- The main process's noise floor reaches the worker's VAD
+- The facade listens and recognizes separately, so hedging, local-first
+  recognition and dictation can wrap it
+"""
+
+import os
+from functools import partial
+
+import numpy as np
+
+from core.audio.clip import AudioClip
+from core.audio.recorder import WavFileSource
+from core.audio.noise_floor import NoiseFloorEstimator
+from core.audio.shm_ring import SharedRing, SharedRingRecorder
+from core.audio.vad import VoiceActivityDetector
+from core.speech.command_recognizer import LocalFirstEngine
+from core.speech.dictation import Dictation
+from core.speech.engine import SpeechEngine
+from core.speech.google_client import GoogleSpeechClient
+from core.speech.google_engine import GoogleSpeechEngine
+from core.speech.hedged import HedgedRecognizer
+from core.speech.worker import WorkerSpeechEngine, ring_engine
+from tests.audio_fixtures import concat, noise, tone, write_wav
+from tests.google_stub import GoogleStub
+
+
+class SilentSource:
+    sample_rate = 1000
+
+    def read(self, num_samples):
+        return b""
+
+    def close(self):
+        pass
+
+
+# Factories run inside the worker process (module-level → picklable)
+def stub_engine(ring, url):
+    return GoogleSpeechEngine(recorder=ring, client=GoogleSpeechClient(url=url, key="test"))
+
+
+class CrashOnce(GoogleSpeechEngine):
+    marker = None
+
+    def recognize_n_best(self, clip, n=5):
+        if not os.path.exists(self.marker):
+            open(self.marker, "w").close()
+            os._exit(3)
+        return super().recognize_n_best(clip, n)
+
+
+def crash_once_engine(ring, url, marker):
+    engine = CrashOnce(recorder=ring, client=GoogleSpeechClient(url=url, key="test"))
+    engine.marker = marker
+    return engine
+
+
+def _live_recorder(tmp_path):
+    # One command every 2 s, paced like a microphone
+    command = concat(noise(0.5, level=30), tone(0.6), noise(0.9, level=30, seed=1))
+    source = WavFileSource(write_wav(tmp_path / "mic.wav", command), realtime=True, loop=True)
+    recorder = SharedRingRecorder(source, capacity_seconds=5.0)
+    recorder.start()
+    return recorder
+
+
+def test_attached_ring_sees_samples_in_place():
+    recorder = SharedRingRecorder(SilentSource(), capacity_seconds=1.0)
+    recorder.write(np.arange(800, dtype=np.int16))
+    recorder.write(np.arange(800, 1200, dtype=np.int16))
+
+    ring = SharedRing.attach(recorder.name)
+    assert ring.capacity == recorder.capacity and ring.write_position == 1200
+
+    view = ring.reader("asr", from_start=True).read_exact(1000, timeout=0.1)
+    assert np.array_equal(np.frombuffer(view, dtype=np.int16), np.arange(200, 1200))
+
+    # Written after attaching: visible without any copy or message
+    recorder.write(np.arange(1200, 1300, dtype=np.int16))
+    assert ring.write_position == 1300
+    assert np.array_equal(np.frombuffer(ring.view(1200, 100), dtype=np.int16), np.arange(1200, 1300))
+
+    del view
+    ring.close()
+    recorder.close()
+
+
+def test_worker_transcribes_from_shared_ring(tmp_path):
+    recorder = _live_recorder(tmp_path)
+    with GoogleStub() as stub:
+        engine = WorkerSpeechEngine(recorder, engine_factory=partial(stub_engine, url=stub.url))
+        try:
+            assert engine.listen_once() == "open chrome"
+            duration, pcm = engine.last_clip.duration, engine.last_clip.to_bytes()
+            report = engine.worker.report()
+        finally:
+            engine.close()
+            recorder.close()
+
+    assert report["pid"] != os.getpid()
+    assert report["requests"] == 1 and report["crashes"] == 0
+
+    # The main process re-views the same ring region the worker uploaded
+    assert 0.6 <= duration < 1.5
+    assert stub.requests[-1]["body"] == pcm
+
+
+def test_crashed_worker_is_restarted(tmp_path):
+    recorder = _live_recorder(tmp_path)
+    marker = str(tmp_path / "crashed")
+    with GoogleStub() as stub:
+        factory = partial(crash_once_engine, url=stub.url, marker=marker)
+        engine = WorkerSpeechEngine(recorder, engine_factory=factory)
+        try:
+            assert engine.listen_once() == ""         # turn lost, loop survives
+            assert engine.worker.is_alive()
+            assert engine.listen_once() == "open chrome"
+            report = engine.worker.report()
+        finally:
+            engine.close()
+            recorder.close()
+
+    assert report["crashes"] == 1
+    assert report["restarts"] == 1
+
+
+def test_noise_floor_is_published_to_the_worker():
+    recorder = SharedRingRecorder(SilentSource(), capacity_seconds=1.0)
+    ring = SharedRing.attach(recorder.name)
+    assert not ring.publishes_noise_floor
+
+    estimator = NoiseFloorEstimator(initial_floor_db=-50.0)
+    recorder.publish_noise_floor(estimator)
+    assert ring.publishes_noise_floor and ring.noise_floor_db == -50.0
+
+    # A louder room: the next captured frame carries the new estimate
+    estimator.noise_floor_db, estimator.energy_threshold = -32.5, 420.0
+    recorder.write(np.zeros(100, dtype=np.int16))
+    assert ring.noise_floor_db == -32.5 and ring.energy_threshold == 420.0
+
+    vad = VoiceActivityDetector(noise_floor=ring)
+    assert vad.threshold_db() == max(vad.min_energy_db, -32.5 + vad.energy_margin_db)
+
+    with GoogleStub() as stub:
+        engine = ring_engine(ring, client=GoogleSpeechClient(url=stub.url, key="test"))
+        assert engine.vad.noise_floor is ring
+        engine.close()
+
+    ring.close()
+    recorder.close()
+
+
+class Unsure(SpeechEngine):
+    name = "unsure"
+
+    def recognize(self, clip):
+        return {"text": "open chrome", "confidence": 0.1}
+
+
+def test_worker_under_hedge_local_first_and_dictation(tmp_path):
+    recorder = _live_recorder(tmp_path)
+    with GoogleStub() as stub:
+        worker = WorkerSpeechEngine(recorder, engine_factory=partial(stub_engine, url=stub.url))
+        try:
+            hedged = HedgedRecognizer(worker, Unsure(), hedge_delay=5.0)
+            assert hedged.listen_once() == "open chrome"
+            assert hedged.stats["wins"]["worker"] == 1 and hedged.stats["hedges"] == 0
+            # A ring clip is sent as positions; the worker uploads the same region
+            assert stub.requests[-1]["body"] == hedged.last_clip.to_bytes()
+
+            local_first = LocalFirstEngine(Unsure(), worker)
+            assert local_first.listen_once() == "open chrome"
+            assert local_first.stats["fallbacks"] == 1
+
+            # Dictation copies chunks out of the ring: they travel as bytes
+            assert worker.recognize(AudioClip(pcm=tone(0.6).tobytes()))["text"] == "open chrome"
+            assert stub.requests[-1]["body"] == tone(0.6).tobytes()
+
+            texts = []
+
+            def sink(text):
+                texts.append(text)
+                dictation.stop()
+
+            dictation = Dictation(recorder.reader("dictation"), worker, sink, min_chunk_seconds=0.5)
+            report = dictation.run()
+            report["worker"] = worker.worker.report()
+        finally:
+            worker.close()
+            recorder.close()
+
+    assert texts == ["open chrome"] and report["errors"] == 0
+    assert report["worker"]["crashes"] == 0 and report["worker"]["restarts"] == 0
@@ -0,0 +1,138 @@
+"""
+Day 25.2 Test — Multi-Microphone Fan-In
+
+Purpose:
+- N WAV files stand in for N devices, captured concurrently
+- Each device's utterances reach its own session, in order
+- Wake word gating is per stream
+- Per-stream CPU cost and streams-per-core are reported
+- Sessions sharing one executor never see each other's follow-up context
+"""
+
+import numpy as np
+
+from core.actions.action_executor import ActionExecutor, ExecutionSession
+from core.audio.keyword_spotter import KeywordSpotter
+from core.audio.multi_mic import MultiMicInput
+from core.audio.recorder import WavFileSource
+from core.nlp.intent import Intent
+from core.session_router import SessionRouter
+from tests.audio_fixtures import chirp, concat, noise, silence, tone, write_wav
+
+PHRASES = {220: "open chrome", 440: "what time is it", 660: "volume up"}
+
+
+class ToneRecognizer:
+    """
+    Shared recognizer: the clip's dominant pitch picks the phrase.
+    """
+
+    def recognize(self, clip):
+        samples = np.frombuffer(clip.pcm, dtype=np.int16).astype(np.float32)
+        spectrum = np.abs(np.fft.rfft(samples))
+        pitch = np.argmax(spectrum) * clip.sample_rate / len(samples)
+        nearest = min(PHRASES, key=lambda f: abs(f - pitch))
+        return {"text": PHRASES[nearest], "confidence": 0.9}
+
+
+class EchoSession:
+    def __init__(self, device, session_input):
+        self.device = device
+        self.input = session_input
+        self.heard = []
+
+    def run_once(self):
+        self.heard.append(self.input.read())
+
+
+def gap(seconds, seed=0):
+    return noise(seconds, level=30, seed=seed)
+
+
+def wake_word():
+    return chirp(0.5, 300, 1200)
+
+
+def devices(tmp_path, audio):
+    return {name: WavFileSource(write_wav(tmp_path / f"{name}.wav", samples)) for name, samples in audio.items()}
+
+
+def test_each_device_routes_to_its_own_session(tmp_path):
+    audio = {
+        "kitchen": concat(gap(0.3), tone(0.6, 220), gap(0.8), tone(0.6, 660), gap(0.8)),
+        "office": concat(gap(0.5), tone(0.6, 440), gap(0.8)),
+        "garage": concat(gap(1.0)),
+    }
+    mic_input = MultiMicInput(devices(tmp_path, audio), ToneRecognizer())
+    router = SessionRouter(mic_input, session_factory=EchoSession)
+
+    mic_input.start()
+    turns = router.run()
+    mic_input.stop()
+
+    assert turns == 3
+    assert router.sessions["kitchen"].heard == ["open chrome", "volume up"]
+    assert router.sessions["office"].heard == ["what time is it"]
+    assert "garage" not in router.sessions
+
+    report = router.report()
+    assert report["kitchen"]["turns"] == 2 and report["office"]["errors"] == 0
+
+
+def test_wake_word_gates_each_stream_independently(tmp_path):
+    def spotter():
+        s = KeywordSpotter()
+        s.enroll("rudra", [concat(silence(0.1), wake_word(), silence(0.1))])
+        return s
+
+    audio = {
+        # Speech without the wake word is never recognized
+        "kitchen": concat(gap(0.3), tone(0.6, 440), gap(0.8), wake_word(), gap(0.2), tone(0.6, 220), gap(0.8)),
+        "office": concat(gap(0.3), tone(0.6, 660), gap(1.0)),
+    }
+    mic_input = MultiMicInput(devices(tmp_path, audio), ToneRecognizer(), spotter_factory=spotter)
+    router = SessionRouter(mic_input, session_factory=EchoSession)
+
+    mic_input.start()
+    router.run()
+    mic_input.stop()
+
+    assert router.sessions["kitchen"].heard == ["open chrome"]
+    assert "office" not in router.sessions
+    assert mic_input.streams["kitchen"].stats["wakes"] == 1
+
+
+def test_report_estimates_streams_per_core(tmp_path):
+    audio = {f"room{i}": concat(gap(0.3, i), tone(0.6, 220), gap(0.8, i)) for i in range(4)}
+    mic_input = MultiMicInput(devices(tmp_path, audio), ToneRecognizer())
+    router = SessionRouter(mic_input, session_factory=EchoSession)
+
+    mic_input.start()
+    router.run()
+    mic_input.stop()
+
+    report = mic_input.report()
+    assert len(report["streams"]) == 4
+    assert all(s["audio_seconds"] > 1.0 and s["overruns"] == 0 for s in report["streams"].values())
+    assert report["streams_per_core"] >= 1
+
+
+def test_sessions_keep_their_own_follow_up_context():
+    executor = ActionExecutor()
+    executor.system_actions.list_files = lambda path=None, target=None: {"success": True, "message": f"Listed {path}"}
+    executor.system_actions.open_browser = lambda url=None, target=None: {"success": True, "message": f"Opened {url}"}
+    kitchen, office = ExecutionSession("kitchen"), ExecutionSession("office")
+
+    assert executor.execute(Intent.LIST_FILES, "list files in downloads", 0.9, session=kitchen)["success"]
+
+    # "Again" in another room has nothing to refer to
+    other = executor.execute(Intent.LIST_FILES, "list them again", 0.9, session=office)
+    assert other["message"] == "No previous context to refer to."
+
+    again = executor.execute(Intent.LIST_FILES, "list them again", 0.9, session=kitchen)
+    assert again["success"] and again.get("is_followup")
+    assert not executor.follow_up_context.contexts          # the default session is untouched
+
+    # Next-intent chains are per session too
+    executor.execute(Intent.OPEN_BROWSER, "open youtube", 0.9, session=office)
+    assert "list_files" not in str(executor.next_intent_model._transitions)
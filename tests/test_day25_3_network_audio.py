@@ -0,0 +1,162 @@
+"""
+Day 25.3 Test — Satellite Audio over UDP
+
+Purpose:
+- Loopback UDP: reordered / duplicated packets come out in order
+- Lost packets are concealed (timing kept) and counted
+- μ-law satellites feed the normal capture + VAD path as a device
+- The jitter buffer stays bounded
+- A restarted satellite (sequence back at 0) is heard again
+"""
+
+import random
+import threading
+import time
+
+import numpy as np
+
+from core.audio.network import ULAW, JitterBuffer, UdpAudioSender, UdpAudioSource
+from core.audio.recorder import FRAME_SAMPLES, RingBufferRecorder
+from core.audio.vad import AdaptiveEndpointer, VoiceActivityDetector, capture_utterance
+from tests.audio_fixtures import concat, noise, tone
+
+
+def drain(source):
+    out = b""
+    while True:
+        data = source.read(FRAME_SAMPLES)
+        if not data:
+            return np.frombuffer(out, dtype=np.int16)
+        out += data
+
+
+def test_reordered_and_duplicate_packets_play_in_order():
+    samples = tone(0.9)
+    source = UdpAudioSource("127.0.0.1")
+    sender = UdpAudioSender("127.0.0.1", source.port)
+
+    packets = sender.packets(samples.tobytes())
+    rng = random.Random(4)
+    shuffled = []
+    for i in range(0, len(packets), 3):
+        window = packets[i:i + 3]
+        rng.shuffle(window)
+        shuffled += window
+    shuffled.insert(10, shuffled[5])        # duplicate
+
+    for packet in shuffled:
+        sender.send_packet(packet)
+    sender.end()
+
+    played = drain(source)
+    report = source.report()
+    source.close()
+    sender.close()
+
+    assert np.array_equal(played, samples[:len(played)])
+    assert len(played) == len(packets) * FRAME_SAMPLES
+    assert report["reordered"] > 0 and report["duplicates"] == 1
+    assert report["lost"] == 0
+
+
+def test_lost_packets_are_concealed_and_counted():
+    samples = tone(0.9)
+    source = UdpAudioSource("127.0.0.1")
+    sender = UdpAudioSender("127.0.0.1", source.port)
+
+    packets = sender.packets(samples.tobytes())
+    for i, packet in enumerate(packets):
+        if i not in (7, 8):
+            sender.send_packet(packet)
+    sender.end()
+
+    played = drain(source)
+    report = source.report()
+    source.close()
+    sender.close()
+
+    # Timing is preserved: the gap is silence, not missing samples
+    assert len(played) == len(packets) * FRAME_SAMPLES
+    assert not played[7 * FRAME_SAMPLES:9 * FRAME_SAMPLES].any()
+    assert np.array_equal(played[9 * FRAME_SAMPLES:], samples[9 * FRAME_SAMPLES:len(played)])
+    assert report["lost"] == 2
+    assert 0.0 < report["loss_rate"] < 0.1
+
+
+def test_ulaw_satellite_feeds_capture_and_vad():
+    audio = concat(noise(0.3, level=30), tone(0.6), noise(0.9, level=30, seed=1))
+    source = UdpAudioSource("127.0.0.1")
+    sender = UdpAudioSender("127.0.0.1", source.port, codec=ULAW)
+
+    def stream():
+        # Paced like a live satellite microphone
+        for i in range(0, len(audio), FRAME_SAMPLES):
+            sender.send(audio[i:i + FRAME_SAMPLES].tobytes())
+            time.sleep(FRAME_SAMPLES / 16000)
+        sender.end()
+
+    recorder = RingBufferRecorder(source, capacity_seconds=5.0)
+    reader = recorder.reader("asr")
+    recorder.start()
+    satellite = threading.Thread(target=stream)
+    satellite.start()
+
+    clip = capture_utterance(reader, VoiceActivityDetector(), AdaptiveEndpointer(), timeout=3.0, catch_up=False)
+    satellite.join()
+    recorder.stop()
+    report = source.report()
+    source.close()
+    sender.close()
+
+    assert clip is not None and 0.5 <= clip.duration < 1.5
+    assert report["lost"] == 0 and report["bad_packets"] == 0
+    assert report["transit_ms_p50"] is not None and report["transit_ms_p50"] < 50
+    # μ-law halves the payload
+    assert report["bytes"] < len(audio) * 2 * 0.6
+
+
+def test_jitter_buffer_is_bounded():
+    jitter = JitterBuffer(frame_samples=4, depth=2, max_frames=5)
+    for seq in range(8):
+        jitter.push(seq, bytes(8))
+
+    assert len(jitter) == 5
+    assert jitter.stats["overflow"] == 3
+    jitter.pop(timeout=0.1)
+    jitter.push(0, bytes(8))                # far too late now
+    assert jitter.stats["late"] == 1
+
+
+def test_restarted_satellite_is_heard_again():
+    source = UdpAudioSource("127.0.0.1", max_frames=10)
+    old = UdpAudioSender("127.0.0.1", source.port)
+
+    before = tone(0.9)
+    packets = old.packets(before.tobytes())
+    heard = b""
+    for i in range(0, len(packets), 5):
+        for packet in packets[i:i + 5]:
+            old.send_packet(packet)
+        heard += b"".join(source.read(FRAME_SAMPLES) for _ in packets[i:i + 5])
+    assert np.array_equal(np.frombuffer(heard, dtype=np.int16), before[:len(packets) * FRAME_SAMPLES])
+    old.close()                             # crashed: no END
+
+    # Rebooted: its sequence starts over far behind the buffer's
+    after = tone(0.27, freq=330.0)          # fits the 10-frame buffer
+    new = UdpAudioSender("127.0.0.1", source.port)
+    new.send(after.tobytes())
+    new.end()
+    played = drain(source)
+    assert np.array_equal(played, after[:len(played)]) and len(played) > 0
+
+    # And again after a clean END
+    new = UdpAudioSender("127.0.0.1", source.port)
+    new.send(after.tobytes())
+    new.end()
+    played = drain(source)
+    report = source.report()
+    source.close()
+    new.close()
+
+    assert np.array_equal(played, after[:len(played)]) and len(played) > 0
+    assert report["restarts"] == 2 and report["late"] == 0 and report["lost"] == 0
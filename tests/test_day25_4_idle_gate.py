@@ -0,0 +1,112 @@
+"""
+Day 25.4 Test — Low-CPU Idle Listening
+
+Purpose:
+- Quiet audio never reaches the spotter; idle CPU is far below full rate
+- Activity escalates to the spotter with a rewind, so the wake word is caught
+- Quiet after a false escalation drops back to idle
+- Every wake-word wait (i.e. after ACTIVE_TIMEOUT) starts idle
+"""
+
+import numpy as np
+
+from core.audio.idle_gate import ESCALATED, IDLE, IdleGate
+from core.audio.keyword_spotter import KeywordSpotter
+from core.audio.recorder import RingBufferRecorder, WavFileSource
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.input_controller import InputController
+from core.speech.file_engine import FileSpeechEngine
+from tests.audio_fixtures import chirp, concat, noise, silence, tone, write_wav
+
+
+def rudra(seed=0):
+    word = chirp(0.5, 300, 1200)
+    return concat(silence(0.2), word + noise(len(word) / 16000, 150, seed), silence(0.2))
+
+
+def make_spotter():
+    spotter = KeywordSpotter()
+    spotter.enroll("rudra", [rudra(i) for i in range(3)])
+    return spotter
+
+
+def controller(tmp_path, audio, gate):
+    recorder = RingBufferRecorder(WavFileSource(write_wav(tmp_path / "mic.wav", audio)), capacity_seconds=15)
+    write_wav(tmp_path / "00.wav", tone(0.2))
+    (tmp_path / "00.txt").write_text("open youtube\n")
+    ic = InputController(
+        engine=FileSpeechEngine(corpus_dir=str(tmp_path)),
+        push_to_talk=False,
+        recorder=recorder,
+        wake_spotter=make_spotter(),
+        idle_gate=gate,
+    )
+    return ic, recorder
+
+
+def test_quiet_stays_idle_and_costs_less_than_spotting():
+    quiet = noise(10.0, level=30)
+    gate = IdleGate()
+    spotter = make_spotter()
+
+    for i in range(0, len(quiet), gate.block_samples):
+        block = quiet[i:i + gate.block_samples]
+        assert gate.idle_step(block, i + len(block)) is None
+        spotter.process(block)
+
+    report = gate.report()
+    assert report["mode"] == IDLE and report["escalations"] == 0
+    assert report["idle_cpu_s_per_hour"] < spotter.cpu_per_audio_second() * 3600 / 5
+
+
+def test_activity_escalates_with_rewind():
+    gate = IdleGate(decimation=4, onset_frames=2, pre_roll_ms=300)
+    audio = concat(noise(1.2, level=30), tone(0.5))
+
+    rewind = None
+    for i in range(0, len(audio), gate.block_samples):
+        block = audio[i:i + gate.block_samples]
+        rewind = gate.idle_step(block, i + len(block))
+        if rewind is not None:
+            break
+
+    onset = int(1.2 * 16000)
+    assert gate.mode == ESCALATED
+    assert onset - 4800 - 480 <= rewind <= onset - 4800 + 480
+    assert gate.report()["escalation_delay_ms_p50"] <= 4 * 30
+
+
+def test_wake_word_found_through_the_gate(tmp_path):
+    GLOBAL_INTERRUPT.clear()
+    gate = IdleGate()
+    audio = concat(noise(3.0, level=30), rudra(7), tone(0.5), silence(0.5))
+    ic, recorder = controller(tmp_path, audio, gate)
+    recorder.start()
+
+    assert ic.read() == "open youtube"
+    recorder.stop()
+
+    report = gate.report()
+    assert report["wakes"] == 1 and report["escalations"] == 1
+    assert report["idle_fraction"] > 0.6
+    assert report["catch_up_ms_p50"] is not None
+
+
+def test_false_escalation_drops_back_and_next_wait_starts_idle(tmp_path):
+    GLOBAL_INTERRUPT.clear()
+    gate = IdleGate(hold_seconds=0.5)
+    audio = concat(noise(0.5, level=30), tone(0.6, 180), noise(1.5, level=30, seed=2))
+    ic, recorder = controller(tmp_path, audio, gate)
+    recorder.start()
+
+    assert ic.wait_for_wake_word() is None     # stream ended, no wake word
+    recorder.stop()
+
+    assert gate.mode == IDLE
+    assert gate.report()["false_escalations"] == 1
+
+    # ACTIVE_TIMEOUT expired → the next wait begins in idle mode
+    gate.mode = ESCALATED
+    ic.active, ic.last_active_time = True, 0
+    assert ic.read() == ""
+    assert not ic.active and gate.mode == IDLE
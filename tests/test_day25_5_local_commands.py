@@ -0,0 +1,107 @@
+"""
+Day 25.5 Test — On-Device Command Recognizer
+
+Purpose:
+- The grammar covers the fixed command vocabulary, not open queries
+- Enrolled commands are recognized offline, in-grammar only
+- Commands resolve on-device; open-vocabulary input falls back to the cloud
+- An out-of-grammar phrase close to a command is not answered on-device
+- On-device share and latency saved are reported
+"""
+
+import pytest
+
+from benchmarks.bench_local_first import spoken
+from core.audio.clip import AudioClip
+from core.config import COMMAND_CONFIDENCE_FLOOR
+from core.speech.command_recognizer import (
+    CommandRecognizer,
+    LocalFirstEngine,
+    TemplateDecoder,
+    command_grammar,
+    command_vocabulary,
+)
+from core.speech.file_engine import FileSpeechEngine
+from tests.audio_fixtures import write_wav
+
+COMMANDS = ["open youtube", "launch terminal", "open downloads", "list files", "hello", "exit"]
+
+
+def clip(text, seed=99):
+    return AudioClip(pcm=spoken(text, seed, 1.05).tobytes())
+
+
+def make_decoder():
+    decoder = TemplateDecoder()
+    for phrase in COMMANDS:
+        decoder.enroll(phrase, [spoken(phrase, s, sp) for s, sp in ((1, 1.0), (2, 0.9), (3, 1.1))])
+    return decoder
+
+
+def test_grammar_is_the_command_vocabulary():
+    grammar = command_grammar()
+    for phrase in COMMANDS + ["start chrome", "open console"]:
+        assert phrase in grammar
+    assert not any(p.startswith(("search", "find")) for p in grammar)
+    assert "terminal" in command_vocabulary() and "search" not in command_vocabulary()
+
+    with pytest.raises(ValueError):
+        TemplateDecoder().enroll("search for cats", [spoken("search for cats")])
+
+
+def test_commands_recognized_offline(tmp_path):
+    recognizer = CommandRecognizer(make_decoder())
+    for phrase in COMMANDS:
+        result = recognizer.recognize(clip(phrase))
+        assert result["text"] == phrase and result["confidence"] >= COMMAND_CONFIDENCE_FLOOR
+
+    path = str(tmp_path / "commands.npz")
+    recognizer.decoder.save(path)
+    assert TemplateDecoder.load(path).phrases == sorted(COMMANDS)
+
+
+def test_local_first_resolves_commands_and_falls_back_for_queries(tmp_path):
+    queries = ["search for cheap flights to goa", "take a note buy milk"]
+    for i, text in enumerate(COMMANDS + queries):
+        write_wav(tmp_path / f"{i:02d}.wav", spoken(text, 50 + i, 1.05))
+        (tmp_path / f"{i:02d}.txt").write_text(text + "\n")
+
+    cloud = FileSpeechEngine(corpus_dir=str(tmp_path), latency=0.05, name="cloud")
+    engine = LocalFirstEngine(CommandRecognizer(make_decoder()), cloud)
+
+    heard = [engine.listen_once() for _ in range(len(COMMANDS) + len(queries))]
+    assert heard == COMMANDS + queries
+
+    report = engine.report()
+    assert report["on_device"] == len(COMMANDS) and report["fallbacks"] == len(queries)
+    assert report["on_device_share"] == round(len(COMMANDS) / (len(COMMANDS) + len(queries)), 3)
+    assert report["cloud_ms_p50"] >= 50 and report["local_ms_p50"] < report["cloud_ms_p50"]
+    assert report["net_saved_ms_per_turn"] > 0
+
+
+def test_near_miss_falls_back_to_the_cloud():
+    # "notepad" is not an open target; the templates hear "open youtube"
+    near_miss = clip("open notepad")
+    near_miss.meta["transcripts"] = ["open notepad"]
+    recognizer = CommandRecognizer(make_decoder())
+    local = recognizer.recognize(near_miss)
+    assert local["text"] == "open youtube" and local["confidence"] < COMMAND_CONFIDENCE_FLOOR
+
+    engine = LocalFirstEngine(recognizer, FileSpeechEngine(pairs=[], name="cloud"),
+                              confidence_floor=COMMAND_CONFIDENCE_FLOOR)
+    assert engine.recognize(near_miss)["text"] == "open notepad"
+    assert engine.report()["fallbacks"] == 1 and engine.report()["on_device"] == 0
+
+
+def test_local_failure_falls_back():
+    class Broken(CommandRecognizer):
+        def recognize_n_best(self, clip, n=5):
+            raise RuntimeError("model missing")
+
+    cloud = FileSpeechEngine(pairs=[], name="cloud")
+    engine = LocalFirstEngine(Broken(None), cloud)
+    cmd = clip("hello")
+    cmd.meta["transcripts"] = ["hello"]
+
+    assert engine.recognize(cmd) == {"text": "hello", "confidence": 0.95, "engine": "cloud"}
+    assert engine.report()["local_errors"] == 1
@@ -0,0 +1,168 @@
+"""
+Day 25.6 Test — Long-Form Dictation
+
+Purpose:
+- Overlapping chunks are stitched without repeated words
+- Continuous speech is split at VAD pauses, or forced before recognizer limits
+- Chunks are recognized concurrently but committed in order, incrementally
+- The sink is called outside the dictation lock, still in order
+- Memory stays bounded (only in-flight chunks and a short tail are kept)
+- "dictate a note" is its own intent
+"""
+
+import random
+import threading
+import time
+
+from core.audio.recorder import RingBufferRecorder, WavFileSource
+from core.intelligence.intent_scorer import pick_best_intent, score_intents
+from core.nlp.intent import Intent, detect_intent
+from core.speech.dictation import Dictation, stitch
+from tests.audio_fixtures import concat, silence, tone, write_wav
+
+RATE = 16000
+
+
+def speech(sentences, word_s=0.3, gap_s=0.1, pause_s=0.8):
+    """
+    Sentences of tone "words"; returns audio and (label, center sample) per word.
+    """
+    parts, words, position, n = [silence(0.5)], [], int(0.5 * RATE), 0
+    for length in sentences:
+        for _ in range(length):
+            freq = 150 + 25 * (n % 8)
+            parts += [tone(word_s, freq), silence(gap_s)]
+            words.append((f"w{n}", position + int(word_s * RATE / 2)))
+            position += int((word_s + gap_s) * RATE)
+            n += 1
+        parts.append(silence(pause_s))
+        position += int(pause_s * RATE)
+    parts.append(silence(4.0))
+    return concat(*parts), words
+
+
+class PositionRecognizer:
+    """
+    Knows where every word is: returns the words whose center lies in the clip.
+    """
+
+    def __init__(self, words, delays=(0.05,)):
+        self.words = words
+        self.delays = list(delays)
+        self.calls = 0
+        self.active = self.max_active = 0
+        self._lock = threading.Lock()
+
+    def recognize(self, clip):
+        with self._lock:
+            delay = self.delays[self.calls % len(self.delays)]
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(delay)
+        with self._lock:
+            self.active -= 1
+        text = " ".join(w for w, center in self.words if clip.start <= center < clip.end)
+        return {"text": text, "confidence": 0.9}
+
+
+def dictation(tmp_path, audio, recognizer, sink, **kwargs):
+    recorder = RingBufferRecorder(WavFileSource(write_wav(tmp_path / "dictation.wav", audio)), capacity_seconds=120)
+    recorder.start()
+    recorder.wait_for(len(audio), timeout=5)
+    d = Dictation(recorder.reader("dictation", from_start=True), recognizer, sink, **kwargs)
+    return d, recorder
+
+
+def test_stitch_drops_repeated_overlap():
+    assert stitch("the quick brown".split(), "brown fox jumps".split()) == ["fox", "jumps"]
+    assert stitch("the quick Brown fox".split(), "brown FOX jumps".split()) == ["jumps"]
+    assert stitch("one two".split(), "three four".split()) == ["three", "four"]
+    assert stitch([], "a b".split()) == ["a", "b"]
+
+
+def test_pauses_delimit_chunks_and_every_word_lands_once(tmp_path):
+    audio, words = speech([6, 5, 7, 6])
+    recognizer = PositionRecognizer(words)
+    pieces = []
+    d, recorder = dictation(tmp_path, audio, recognizer, pieces.append)
+
+    report = d.run()
+    recorder.stop()
+
+    assert " ".join(pieces).split() == [w for w, _ in words]
+    assert report["chunks"] == 4 and report["forced_splits"] == 0
+    assert report["words"] == len(words)
+
+
+def test_continuous_speech_is_force_split_and_stitched(tmp_path):
+    audio, words = speech([60], gap_s=0.15)                 # ~27 s without a pause
+    recognizer = PositionRecognizer(words)
+    pieces = []
+    d, recorder = dictation(tmp_path, audio, recognizer, pieces.append, max_chunk_seconds=5.0, overlap_ms=600)
+
+    report = d.run()
+    recorder.stop()
+
+    assert " ".join(pieces).split() == [w for w, _ in words]
+    assert report["forced_splits"] >= 4
+    assert report["overlap_words_dropped"] >= 1
+    assert report["audio_seconds"] >= len(audio) / RATE - 5
+
+
+def test_concurrent_recognition_commits_in_order(tmp_path):
+    audio, words = speech([5] * 8)
+    rng = random.Random(3)
+    recognizer = PositionRecognizer(words, delays=[rng.uniform(0.05, 0.4) for _ in range(8)])
+    pieces, seen_at = [], []
+
+    def sink(text):
+        pieces.append(text)
+        seen_at.append(time.perf_counter())
+
+    d, recorder = dictation(tmp_path, audio, recognizer, sink, max_in_flight=3)
+    started = time.perf_counter()
+    report = d.run()
+    finished = time.perf_counter()
+    recorder.stop()
+
+    assert " ".join(pieces).split() == [w for w, _ in words]
+    assert recognizer.max_active > 1 and report["max_in_flight"] <= 3
+    assert len(pieces) == 8 and seen_at[0] - started < (finished - started) / 2   # incremental
+    assert report["text_latency_ms_p50"] < 1000
+
+    # Nothing but a short tail survives a finished dictation
+    assert not d._done and not d._closed_at and len(d._tail) <= 16
+
+
+def test_sink_runs_outside_the_lock(tmp_path):
+    audio, words = speech([5] * 4)
+    recognizer = PositionRecognizer(words, delays=[0.05, 0.01])
+    pieces, free = [], []
+
+    def sink(text):
+        # Under the (non-reentrant) lock this would time out
+        acquired = d._lock.acquire(timeout=1.0)
+        free.append(acquired)
+        if acquired:
+            d._lock.release()
+        time.sleep(0.1)                                 # a slow note write
+        pieces.append(text)
+
+    d, recorder = dictation(tmp_path, audio, recognizer, sink, max_in_flight=3)
+    report = d.run()
+    recorder.stop()
+
+    assert free == [True] * 4
+    assert " ".join(pieces).split() == [w for w, _ in words]
+    assert report["errors"] == 0
+
+
+def test_dictate_is_its_own_intent():
+    for tokens in (["dictate", "a", "note"], ["start", "dictation"]):
+        intent, confidence = pick_best_intent(score_intents(tokens), tokens)
+        assert intent == Intent.NOTE_DICTATE and confidence >= 0.65
+        assert detect_intent(tokens) == Intent.NOTE_DICTATE
+
+    tokens = ["take", "note", "buy", "milk"]
+    assert pick_best_intent(score_intents(tokens), tokens)[0] == Intent.NOTE_CREATE
@@ -0,0 +1,148 @@
+"""
+Day 26.1 Test — Asynchronous Action Execution
+
+Purpose:
+- submit() returns a future at once; a slow action no longer blocks the caller
+- Each intent has a time budget; late results are ignored
+- GLOBAL_INTERRUPT cancels everything in flight (queued actions never start)
+- The pool and its queue are bounded; queue depth and latency are reported
+- Completions update follow-up state under the executor lock, never mid-turn
+"""
+
+import gc
+import threading
+import time
+
+from core.actions import action_executor as ae
+from core.actions.action_executor import ActionExecutor
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.control.interrupt_controller import InterruptController
+from core.nlp.intent import Intent
+
+
+def slow_executor(delay=0.3, workers=4):
+    executor = ActionExecutor()
+    executor.max_workers = workers
+    calls = []
+
+    def list_files(path=None, target=None):
+        calls.append(path)
+        time.sleep(delay)
+        return {"success": True, "message": f"Listed {target or path}"}
+
+    executor.system_actions.list_files = list_files
+    return executor, calls
+
+
+def test_submit_does_not_block():
+    GLOBAL_INTERRUPT.clear()
+    executor, calls = slow_executor(delay=0.3)
+
+    started = time.perf_counter()
+    future = executor.submit(Intent.LIST_FILES, "list downloads", 0.9)
+    assert time.perf_counter() - started < 0.1 and not future.done()
+
+    result = future.result(timeout=2)
+    assert result["success"] and result["executed"] and result["message"].startswith("Listed")
+    assert executor.follow_up_context.contexts[-1]["action"] == "list_files"
+
+    report = executor.execution_report()
+    assert report["completed"] == 1 and report["latency"]["list_files"]["p50_ms"] >= 300
+    executor.close()
+
+
+def test_gated_turns_resolve_immediately():
+    GLOBAL_INTERRUPT.clear()
+    executor, calls = slow_executor()
+
+    future = executor.submit(Intent.SEARCH_WEB, "search", 0.9)     # no query
+    assert future.done() and future.result()["message"] == "Please provide query."
+    assert executor.execution_report()["submitted"] == 0
+
+
+def test_timeout_per_intent(monkeypatch):
+    GLOBAL_INTERRUPT.clear()
+    monkeypatch.setitem(ae.ACTION_TIMEOUTS, "list_files", 0.1)
+    executor, calls = slow_executor(delay=0.4)
+
+    started = time.perf_counter()
+    result = executor.submit(Intent.LIST_FILES, "list downloads", 0.9).result(timeout=2)
+    assert result["timed_out"] and not result["success"]
+    assert time.perf_counter() - started < 0.3
+
+    time.sleep(0.5)     # the action itself still finishes in the background
+    report = executor.execution_report()
+    assert report["timeouts"] == 1 and report["late_results"] == 1 and report["in_flight"] == 0
+    executor.close()
+
+
+def test_interrupt_cancels_in_flight_actions():
+    GLOBAL_INTERRUPT.clear()
+    executor, calls = slow_executor(delay=0.5, workers=1)
+
+    futures = [executor.submit(Intent.LIST_FILES, "list downloads", 0.9) for _ in range(3)]
+    time.sleep(0.1)
+    assert executor.queue_depth() == 2 and executor.in_flight() == 3
+
+    GLOBAL_INTERRUPT.trigger()
+    try:
+        results = [f.result(timeout=0.1) for f in futures]
+    finally:
+        GLOBAL_INTERRUPT.clear()
+
+    assert all(r["message"] == "Action cancelled." for r in results)
+    time.sleep(0.6)
+    assert len(calls) == 1                          # queued actions never started
+    assert executor.execution_report()["cancelled"] == 3
+    executor.close()
+
+
+def test_queue_is_bounded():
+    GLOBAL_INTERRUPT.clear()
+    executor, calls = slow_executor(delay=0.3, workers=1)
+    executor.max_queue = 2
+
+    futures = [executor.submit(Intent.LIST_FILES, "list downloads", 0.9) for _ in range(4)]
+    rejected = [f.result() for f in futures if f.done()]
+    assert len(rejected) == 1 and "busy" in rejected[0]["message"]
+
+    for f in futures:
+        f.result(timeout=3)
+    report = executor.execution_report()
+    assert report["rejected"] == 1 and report["max_queue_depth"] == 2 and report["queue_depth"] == 0
+    executor.close()
+
+
+def test_completion_waits_for_the_executor_lock():
+    GLOBAL_INTERRUPT.clear()
+    executor, calls = slow_executor(delay=0.05)
+
+    with executor._lock:            # e.g. the main loop inside _prepare
+        future = executor.submit(Intent.LIST_FILES, "list downloads", 0.9)
+        time.sleep(0.3)
+        assert calls and not future.done()
+        assert not executor.follow_up_context.contexts
+
+    assert future.result(timeout=2)["success"]
+    assert executor.follow_up_context.contexts[-1]["action"] == "list_files"
+    executor.close()
+
+
+def test_interrupt_subscribers_are_weak():
+    controller = InterruptController()
+    fired = threading.Event()
+
+    class Owner:
+        def on_interrupt(self):
+            fired.set()
+
+    owner = Owner()
+    controller.subscribe(owner.on_interrupt)
+    controller.trigger()
+    assert fired.is_set()
+
+    fired.clear()
+    del owner
+    gc.collect()
+    controller.trigger()
+    assert not fired.is_set() and not controller._subscribers
@@ -0,0 +1,114 @@
+"""
+Day 26.2 Test — Skill Registry
+
+Purpose:
+- Each skill is declared once; REQUIRED_ARGS, INTENT_ENTITY_WHITELIST,
+  INTENT_CLASS, INTERRUPT_POLICY and INTENT_PRIORITY are derived from it
+- Registering a skill updates every table in place
+- Dispatch is one lookup; handler modules load on first use and are cached
+- PLAY_MEDIA and CONTROL_VOLUME run through the registry like any other skill
+"""
+
+import subprocess
+import sys
+
+from core.actions import action_executor as ae
+from core.actions.action_executor import ActionExecutor
+from core.context.follow_up import INTENT_CLASS, INTENT_ENTITY_WHITELIST
+from core.control.global_interrupt import GLOBAL_INTERRUPT
+from core.control.interrupt_policy import INTERRUPT_POLICY
+from core.intelligence.intent_scorer import INTENT_PRIORITY
+from core.nlp.intent import Intent
+from core.skills.media import extract_media_args, extract_volume_args
+from core.skills.registry import SKILLS, SkillRegistry, SkillSpec
+
+
+def test_tables_are_derived_from_specs():
+    assert ae.REQUIRED_ARGS["open_file"] == ["filename"]
+    assert INTENT_ENTITY_WHITELIST["open_file"] == ["filename", "full_path", "target"]
+    assert INTENT_CLASS["open_terminal"] == "dangerous"
+    assert INTERRUPT_POLICY[Intent.SEARCH_WEB] == "SOFT"
+    assert INTERRUPT_POLICY[Intent.GREETING] == "IGNORE"
+    assert INTENT_PRIORITY[Intent.OPEN_TERMINAL] == 5
+    assert ae.ACTION_TIMEOUTS["list_files"] == 10.0
+
+    # Conversational intents have a policy but are not actions
+    assert "greeting" not in ae.REQUIRED_ARGS and not SKILLS.is_action("greeting")
+    assert SKILLS.is_action("play_media") and SKILLS.is_action("control_volume")
+
+
+def test_register_updates_tables_in_place():
+    registry = SkillRegistry()
+    required, policy = registry.required_args, registry.interrupt_policy
+
+    registry.register(SkillSpec(Intent.NOTE_CREATE, "core.skills.media:play_media", slots=("content",),
+                                entities=("content",), intent_class="notes", interrupt_policy="SOFT",
+                                priority=2, timeout=1.5))
+
+    assert required is registry.required_args and required["note_create"] == ["content"]
+    assert policy[Intent.NOTE_CREATE] == "SOFT"
+    assert registry.entity_whitelist["note_create"] == ["content"]
+    assert registry.intent_class["note_create"] == "notes"
+    assert registry.priority[Intent.NOTE_CREATE] == 2
+    assert registry.timeouts["note_create"] == 1.5
+
+
+def test_handler_is_resolved_once():
+    registry = SkillRegistry()
+    registry.register(SkillSpec(Intent.PLAY_MEDIA, "core.skills.media:play_media"))
+
+    handler = registry.handler("play_media")
+    assert registry.handler("play_media") is handler
+    assert list(registry.report()["loaded_modules"]) == ["core.skills.media"]
+
+    try:
+        registry.handler("open_browser")
+        raise AssertionError("unregistered skill resolved")
+    except KeyError:
+        pass
+
+
+def test_skill_modules_load_lazily():
+    code = (
+        "import sys, core.actions.action_executor; "
+        "print('core.skills.media' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert out.stdout.strip() == "False", out.stderr
+
+
+def test_media_arguments():
+    assert extract_media_args("play lofi beats on spotify") == {"query": "lofi beats", "target": "spotify"}
+    assert extract_media_args("play some jazz") == {"query": "jazz", "target": "youtube"}
+    assert extract_media_args("play")["query"] is None
+
+    assert extract_volume_args("turn the volume up") == {"direction": "up", "level": None}
+    assert extract_volume_args("volume 40 percent") == {"direction": "set", "level": 40}
+    assert extract_volume_args("turn it down to 20") == {"direction": "set", "level": 20}
+    assert extract_volume_args("unmute")["direction"] == "unmute"
+
+
+def test_play_media_dispatch():
+    GLOBAL_INTERRUPT.clear()
+    executor = ActionExecutor()
+    opened = []
+
+    def open_browser(url=None, target=None):
+        opened.append(url)
+        return {"success": True, "message": f"Opened {target}"}
+
+    executor.system_actions.open_browser = open_browser
+
+    result = executor.execute(Intent.PLAY_MEDIA, "play lofi beats", 0.9)
+    assert result["success"] and result["message"] == "Playing lofi beats on Youtube"
+    assert opened == ["https://www.youtube.com/results?search_query=lofi+beats"]
+
+    missing = executor.execute(Intent.CONTROL_VOLUME, "change the volume", 0.9)
+    assert not missing["success"] and missing["message"] == "Please provide direction."
+
+
+def test_unknown_action_is_not_implemented():
+    executor = ActionExecutor()
+    assert executor._execute_action_by_name("note_read", {}) == {
+        "success": False, "message": "Intent not implemented: note_read",
+    }